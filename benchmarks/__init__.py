@@ -0,0 +1,10 @@
+"""__init__ for benchmarks package"""
+from benchmarks.baseline import (
+    compare_to_baseline,
+    load_baseline,
+    save_baseline,
+    update_baseline,
+)
+from benchmarks.dom import Node
+from benchmarks.fake_remote import FakeRemote
+from benchmarks.scenarios import SCENARIOS, Scenario, ScenarioResult, run_scenario
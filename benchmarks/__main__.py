@@ -0,0 +1,100 @@
+"""This module contains the benchmarks' entry point, which runs the benchmark scenarios against a
+local fake WebDriver remote end, without a browser, and compares their cost against a baseline.
+
+Examples
+--------
+    python -m benchmarks
+    python -m benchmarks table_columns multi_select_dropdown --latency 0.005
+    python -m benchmarks --save-baseline
+"""
+import argparse
+import json
+import logging
+import sys
+from typing import Optional, Sequence
+
+from benchmarks.baseline import (
+    DEFAULT_BASELINE_FILE,
+    add_baseline_arguments,
+    compare_to_baseline,
+    load_baseline,
+    save_or_compare,
+)
+from benchmarks.fake_remote import FakeRemote
+from benchmarks.scenarios import SCENARIOS, run_scenario
+
+# The default latency of each command, roughly that of a local browser
+DEFAULT_LATENCY = 0.001  # seconds
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark scenarios and prints their cost, compared to the baseline.
+
+    Returns
+    -------
+    int
+        0 if no scenario regressed compared to the baseline, or else 1.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help="The names of the scenarios to run. Defaults to all of them.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=DEFAULT_LATENCY,
+        help="The latency of each command in seconds.",
+    )
+    add_baseline_arguments(
+        parser, default_baseline=DEFAULT_BASELINE_FILE, measure="a scenario's wall time"
+    )
+    parser.add_argument(
+        "--output", default=None, help="A JSON file to write the results to."
+    )
+    args = parser.parse_args(argv)
+    # The framework logs every element it finds, which would dominate the measured CPU time
+    logging.getLogger().setLevel(logging.WARNING)
+
+    unknown = set(args.scenarios) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenarios or scenario.name in args.scenarios
+    ]
+    baseline = load_baseline(path=args.baseline)
+    results = []
+    with FakeRemote(latency=args.latency) as remote:
+        driver = remote.create_driver()
+        for scenario in scenarios:
+            result = run_scenario(
+                remote=remote, driver=driver, scenario=scenario, repeat=args.repeat
+            )
+            results.append(result)
+            expected = baseline.get(scenario.name, {}).get("round_trips", "-")
+            print(
+                f"{scenario.name:<28} {result.round_trips:>5} round trips (baseline {expected:>5})"
+                f"  {result.wall_time * 1000:>8.2f}ms wall  {result.cpu_time * 1000:>8.2f}ms CPU"
+                f"  {scenario.description}"
+            )
+        driver.quit()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {result.name: result.as_dict() for result in results}, file, indent=2
+            )
+    return save_or_compare(
+        args=args,
+        entries={result.name: result.as_dict() for result in results},
+        compare=lambda: compare_to_baseline(
+            results=results, baseline=baseline, max_slowdown=args.max_slowdown
+        ),
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""This module contains helpers to persist the results of the benchmark scenarios as a baseline,
+and to compare the results of a run against it, as well as the command line arguments and exit
+code shared by the benchmarks' entry points."""
+import argparse
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from benchmarks.scenarios import ScenarioResult
+
+DEFAULT_BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def load_baseline(path: str = DEFAULT_BASELINE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Loads the baseline results, keyed by scenario name. Returns an empty dictionary if the file
+    doesn't exist yet.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def update_baseline(
+    entries: Dict[str, Dict[str, Any]], path: str = DEFAULT_BASELINE_FILE
+):
+    """Saves the entries, keyed by e.g. scenario name, in the baseline, keeping the other entries
+    of the baseline."""
+    baseline = load_baseline(path=path)
+    baseline.update(entries)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def save_baseline(results: Iterable[ScenarioResult], path: str = DEFAULT_BASELINE_FILE):
+    """Saves the results of a run as the baseline, keeping the baseline of the scenarios which
+    were not run."""
+    update_baseline(
+        entries={result.name: result.as_dict() for result in results}, path=path
+    )
+
+
+def compare_to_baseline(
+    results: Iterable[ScenarioResult],
+    baseline: Dict[str, Dict[str, Any]],
+    max_slowdown: Optional[float] = None,
+) -> List[str]:
+    """Compares the results of a run against the baseline. The round trips are deterministic,
+    hence any increase is a regression. The wall time is only compared if max_slowdown is given,
+    as it depends on the machine.
+
+    Parameters
+    ----------
+    results : Iterable[ScenarioResult]
+    baseline : Dict[str, Dict[str, Any]]
+    max_slowdown : Optional[float]
+        The maximum ratio of a scenario's wall time to its baseline wall time, e.g. 1.5. Defaults
+        to None, meaning the wall time is not compared.
+
+    Returns
+    -------
+    List[str]
+        A description of each regression.
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        if result.round_trips > expected["round_trips"]:
+            regressions.append(
+                f"{result.name}: {result.round_trips} round trips, up from "
+                f"{expected['round_trips']}"
+            )
+        if max_slowdown and result.wall_time > expected["wall_time"] * max_slowdown:
+            regressions.append(
+                f"{result.name}: {result.wall_time * 1000:.1f}ms wall time, up from "
+                f"{expected['wall_time'] * 1000:.1f}ms"
+            )
+    return regressions
+
+
+def add_baseline_arguments(
+    parser: argparse.ArgumentParser, default_baseline: str, measure: str
+):
+    """Adds the arguments shared by the benchmarks' entry points to parser: --repeat, --baseline,
+    --save-baseline and --max-slowdown.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+    default_baseline : str
+        The default path of the baseline file.
+    measure : str
+        What --max-slowdown compares against the baseline, e.g. "a scenario's wall time".
+    """
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=default_baseline)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Saves the results as the baseline instead of comparing against it.",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help=f"Also fails if {measure} exceeds its baseline's by this ratio.",
+    )
+
+
+def save_or_compare(
+    args: argparse.Namespace,
+    entries: Dict[str, Dict[str, Any]],
+    compare: Callable[[], List[str]],
+) -> int:
+    """Saves the entries as the baseline if --save-baseline was given, or else prints the
+    regressions returned by compare.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments added by add_baseline_arguments.
+    entries : Dict[str, Dict[str, Any]]
+        The results of the run, see update_baseline.
+    compare : Callable[[], List[str]]
+        Compares the results of the run against the baseline and returns the regressions.
+
+    Returns
+    -------
+    int
+        The exit code: 0 if the baseline was saved or nothing regressed, or else 1.
+    """
+    if args.save_baseline:
+        update_baseline(entries=entries, path=args.baseline)
+        print(f"Saved the baseline to {args.baseline}.")
+        return 0
+    regressions = compare()
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
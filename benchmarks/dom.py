@@ -0,0 +1,205 @@
+"""This module contains a minimal synthetic DOM served by the fake WebDriver remote end, see
+benchmarks/fake_remote.py, together with a CSS selector matcher supporting the selectors used by
+the framework: type, id, class and attribute selectors, the descendant and child combinators and
+selector lists."""
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# A simple selector's kind ("tag", "id", "class" or "attr"), name, operator and value
+_SimpleSelector = Tuple[str, str, Optional[str], Optional[str]]
+# A compound selector's simple selectors, preceded by the combinator with the previous compound
+# selector (None for the first one)
+_Compound = Tuple[Optional[str], List[_SimpleSelector]]
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?P<combinator>[>+~])\s*
+    | (?P<descendant>\s+)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<class>[\w-]+)
+    | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~|]?=)\s*
+        (?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+    | (?P<tag>\*|[a-zA-Z][\w-]*)
+    """,
+    re.VERBOSE,
+)
+_SELECTORS_CACHE: Dict[str, List[List[_Compound]]] = {}
+
+
+class Node:
+    """This class implements an element of the synthetic DOM.
+
+    Examples
+    --------
+        button = Node("button", {"class": "dropdown"}, text="Cities")
+        page = Node("html", children=[Node("body", children=[button])])
+    """
+
+    def __init__(
+        self,
+        tag: str,
+        attributes: Optional[Dict[str, str]] = None,
+        text: str = "",
+        children: Optional[List[Node]] = None,
+        on_click: Optional[Callable[[Node], None]] = None,
+    ):
+        self.tag = tag
+        self.attributes = dict(attributes or {})
+        self.own_text = text
+        self.parent: Optional[Node] = None
+        self.children: List[Node] = []
+        # Called when the element is clicked, to simulate the page's behaviour
+        self.on_click = on_click
+        for child in children or []:
+            self.append(child)
+
+    def __repr__(self) -> str:
+        return f"Node({self.tag!r}, {self.attributes!r})"
+
+    def append(self, child: Node) -> Node:
+        """Appends a child element and returns it."""
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    @property
+    def root(self) -> Node:
+        """The topmost ancestor of the element."""
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    @property
+    def text(self) -> str:
+        """The text of the element and its descendants, approximating innerText."""
+        texts = [self.own_text] + [child.text for child in self.children]
+        return " ".join(text for text in texts if text).strip()
+
+    @property
+    def classes(self) -> List[str]:
+        """The classes of the element."""
+        return self.attributes.get("class", "").split()
+
+    def descendants(self) -> Iterator[Node]:
+        """Iterates over the descendants of the element in document order."""
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def select(self, selector: str) -> List[Node]:
+        """Returns the descendants matching a CSS selector, like querySelectorAll."""
+        selectors = _parse(selector)
+        return [
+            node
+            for node in self.descendants()
+            if any(_matches(node, compounds) for compounds in selectors)
+        ]
+
+    def select_first(self, selector: str) -> Optional[Node]:
+        """Returns the first descendant matching a CSS selector, like querySelector."""
+        selectors = _parse(selector)
+        return next(
+            (
+                node
+                for node in self.descendants()
+                if any(_matches(node, compounds) for compounds in selectors)
+            ),
+            None,
+        )
+
+
+def _parse(selector: str) -> List[List[_Compound]]:
+    """Parses a selector list into a list of complex selectors, each a list of compound ones.
+
+    Raises
+    ------
+    ValueError
+        If the selector is not supported.
+    """
+    if selector in _SELECTORS_CACHE:
+        return _SELECTORS_CACHE[selector]
+    selectors = []
+    for complex_selector in selector.split(","):
+        compounds: List[_Compound] = []
+        combinator: Optional[str] = None
+        simple: List[_SimpleSelector] = []
+        text, position = complex_selector.strip(), 0
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if not match or match.end() == position:
+                raise ValueError(f"Unsupported CSS selector: {selector}")
+            position = match.end()
+            if match.group("combinator") or match.group("descendant"):
+                if match.group("combinator") in ("+", "~"):
+                    raise ValueError(f"Unsupported CSS combinator in: {selector}")
+                compounds.append((combinator, simple))
+                combinator, simple = match.group("combinator") or " ", []
+            elif match.group("id"):
+                simple.append(("id", match.group("id"), None, None))
+            elif match.group("class"):
+                simple.append(("class", match.group("class"), None, None))
+            elif match.group("attr"):
+                value = next(
+                    (
+                        match.group(group)
+                        for group in ("dq", "sq", "bare")
+                        if match.group(group) is not None
+                    ),
+                    None,
+                )
+                simple.append(("attr", match.group("attr"), match.group("op"), value))
+            else:
+                simple.append(("tag", match.group("tag"), None, None))
+        compounds.append((combinator, simple))
+        selectors.append(compounds)
+    _SELECTORS_CACHE[selector] = selectors
+    return selectors
+
+
+def _matches_simple(node: Node, simple: _SimpleSelector) -> bool:
+    """Determines whether an element matches a simple selector."""
+    # pylint: disable=too-many-return-statements
+    kind, name, operator, value = simple
+    if kind == "tag":
+        return name in ("*", node.tag)
+    if kind == "id":
+        return node.attributes.get("id") == name
+    if kind == "class":
+        return name in node.classes
+    actual = node.attributes.get(name)
+    if actual is None or operator is None:
+        return actual is not None
+    if operator == "=":
+        return actual == value
+    if operator == "*=":
+        return bool(value) and value in actual
+    if operator == "^=":
+        return bool(value) and actual.startswith(value)
+    if operator == "$=":
+        return bool(value) and actual.endswith(value)
+    if operator == "~=":
+        return value in actual.split()
+    return actual == value or actual.startswith(f"{value}-")
+
+
+def _matches(
+    node: Node, compounds: List[_Compound], index: Optional[int] = None
+) -> bool:
+    """Determines whether an element matches a complex selector, from right to left."""
+    index = len(compounds) - 1 if index is None else index
+    combinator, simple = compounds[index]
+    if not all(_matches_simple(node, selector) for selector in simple):
+        return False
+    if index == 0:
+        return True
+    ancestor = node.parent
+    if combinator == ">":
+        return ancestor is not None and _matches(ancestor, compounds, index - 1)
+    while ancestor is not None:
+        if _matches(ancestor, compounds, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
@@ -0,0 +1,579 @@
+"""This module contains a local stand-in for a W3C WebDriver remote end, which serves a synthetic
+DOM (see benchmarks/dom.py) over HTTP, with a configurable latency per command. It implements the
+commands the framework issues, and answers the framework's scripts, which it recognises by their
+text, with Python implementations of them.
+
+Examples
+--------
+    with FakeRemote(latency=0.001) as remote:
+        remote.load(page=Node("html", children=[Node("input", {"id": "name"})]))
+        driver = remote.create_driver()
+        Input(parent=driver, locator=(By.ID, "name")).enter_value("Sofia")
+        remote.round_trips
+"""
+import json
+import pkgutil
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks.dom import Node
+from browsers.async_browser import ELEMENT_KEY
+from browsers.base_browser import CLEAR_STORAGE_SCRIPT
+from elements.collection import (
+    COLLECTION_ATTRIBUTES_SCRIPT,
+    COLLECTION_COUNT_SCRIPT,
+    COLLECTION_FILTER_BY_TEXT_SCRIPT,
+    COLLECTION_ITEM_SCRIPT,
+    COLLECTION_TEXTS_SCRIPT,
+)
+from elements.dropdowns.base_dropdown import OPTIONS_WAIT_SCRIPT
+from elements.dropdowns.single_select_dropdown import FIND_OPTION_SCRIPT
+from elements.element_cache import DOM_EPOCH_SCRIPT
+from elements.element_properties import READ_PROPERTIES_SCRIPT
+from elements.locator_chain import LOCATOR_CHAIN_SCRIPT
+from elements.table import (
+    TABLE_CELL_SCRIPT,
+    TABLE_COLUMN_SCRIPT,
+    TABLE_HEADERS_SCRIPT,
+    TABLE_SNAPSHOT_SCRIPT,
+)
+
+SESSION_ID = "fake-session"
+
+
+class FakeRemoteError(Exception):
+    """A WebDriver error returned by the fake remote end, e.g. no such element."""
+
+    def __init__(self, status: int, error: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+def _find_all(context: Node, by: str, value: str) -> List[Node]:
+    """Finds the elements matching a locator under context, like findAll of LOCATOR_FUNCTIONS."""
+    if by == "css selector":
+        try:
+            return context.select(value)
+        except ValueError as exc:
+            raise FakeRemoteError(400, "invalid selector", str(exc)) from exc
+    if by in ("link text", "partial link text"):
+        return [
+            link
+            for link in context.select("a")
+            if (value in link.text if by == "partial link text" else link.text == value)
+        ]
+    raise FakeRemoteError(
+        500, "unsupported operation", f"The fake remote end doesn't support {by}"
+    )
+
+
+def _read_properties(remote: "FakeRemote", element: Node, names: List[str]):
+    # pylint: disable=unused-argument,too-many-return-statements
+    def read(name: str) -> Any:
+        if name == "text":
+            return element.text
+        if name == "tag":
+            return element.tag
+        if name == "value":
+            return element.attributes.get("value")
+        if name == "enabled":
+            return "disabled" not in element.attributes
+        if name == "displayed":
+            return True
+        if name == "selected":
+            return element.attributes.get("aria-selected") == "true"
+        if name == "rect":
+            return {"x": 0, "y": 0, "width": 100, "height": 20}
+        if name.startswith(("attr:", "prop:")):
+            return element.attributes.get(name[5:])
+        return ""
+
+    return {name: read(name) for name in names}
+
+
+def _locator_chain(
+    remote: "FakeRemote", root: Optional[Node], locators: List[List[str]]
+):
+    context, found = root or remote.document, []
+    for step, (by, value) in enumerate(locators):
+        matches = _find_all(context, by, value)
+        if not matches:
+            return {"found": found, "failedStep": step}
+        context = matches[0]
+        found.append(context)
+    return {"found": found, "failedStep": None}
+
+
+def _collection_item(remote, root, by, value, index):
+    elements = _find_all(root or remote.document, by, value)
+    return elements[index] if -len(elements) <= index < len(elements) else None
+
+
+def _collection_filter(remote, root, by, value, text, exact, case_sensitive):
+    # pylint: disable=too-many-arguments
+    def normalize(value: str) -> str:
+        return value if case_sensitive else value.lower()
+
+    return [
+        element
+        for element in _find_all(root or remote.document, by, value)
+        if (
+            normalize(element.text) == normalize(text)
+            if exact
+            else normalize(text) in normalize(element.text)
+        )
+    ]
+
+
+def _options_wait(remote, container, by, value, timeout, interval):
+    # pylint: disable=unused-argument,too-many-arguments
+    options = _find_all(container, by, value)
+    texts = [option.text for option in options]
+    if options and all(texts):
+        return {"options": options, "texts": texts}
+    # The synthetic DOM doesn't change by itself, hence the options would never load
+    return None
+
+
+def _find_option(remote, container, by, value, timeout, interval, text, hint):
+    # pylint: disable=unused-argument,too-many-arguments
+    options = _find_all(container, by, value)
+
+    def normalize(value: str) -> str:
+        return " ".join(value.split()).lower()
+
+    if (
+        hint is not None
+        and hint < len(options)
+        and normalize(options[hint].text) == text
+    ):
+        return {"option": options[hint], "index": hint}
+    for index, option in enumerate(options):
+        if normalize(option.text) == text:
+            return {"option": option, "index": index}
+    return {"option": None, "index": -1} if options else None
+
+
+def _table_headers(remote, table, header_selector):
+    return {
+        "version": remote.version,
+        "titles": [cell.text for cell in table.select(header_selector)],
+    }
+
+
+def _table_column(
+    remote, table, version, index, header_selector, rows_selector, cells_selector
+):
+    # pylint: disable=too-many-arguments
+    if version is not None and version != remote.version:
+        return {"version": remote.version, "header": None, "cells": []}
+    headers = table.select(header_selector)
+    cells = []
+    for row in table.select(rows_selector):
+        row_cells = row.select(cells_selector)
+        cells.append(row_cells[index] if index < len(row_cells) else None)
+    return {
+        "version": remote.version,
+        "header": headers[index] if index < len(headers) else None,
+        "cells": cells,
+    }
+
+
+def _table_cell(
+    remote, table, row, column, header_selector, rows_selector, cells_selector
+):
+    # pylint: disable=unused-argument,too-many-arguments
+    if row is None:
+        return table.select(header_selector)[column]
+    return table.select(rows_selector)[row].select(cells_selector)[column]
+
+
+def _table_snapshot(
+    remote, table, header_selector, rows_selector, cells_selector, attributes
+):
+    # pylint: disable=unused-argument,too-many-arguments
+    def read_cell(cell: Node) -> Dict[str, Any]:
+        return {
+            "text": cell.text,
+            "attributes": {
+                name: cell.attributes.get(name) for name in attributes or []
+            },
+        }
+
+    return {
+        "headers": [read_cell(cell) for cell in table.select(header_selector)],
+        "rows": [
+            [read_cell(cell) for cell in row.select(cells_selector)]
+            for row in table.select(rows_selector)
+        ],
+    }
+
+
+def _selenium_atom(name: str) -> str:
+    """Returns the script selenium executes for one of its JavaScript atoms, e.g. getAttribute."""
+    atom = pkgutil.get_data("selenium.webdriver.remote", f"{name}.js").decode("utf8")
+    return f"return ({atom}).apply(null, arguments);"
+
+
+# The Python implementations of the scripts executed by the framework, called with the fake remote
+# end and the script's arguments, in which elements are passed as Node objects
+SCRIPT_HANDLERS: Dict[str, Callable[..., Any]] = {
+    READ_PROPERTIES_SCRIPT: _read_properties,
+    LOCATOR_CHAIN_SCRIPT: _locator_chain,
+    COLLECTION_COUNT_SCRIPT: lambda remote, root, by, value: len(
+        _find_all(root or remote.document, by, value)
+    ),
+    COLLECTION_ITEM_SCRIPT: _collection_item,
+    COLLECTION_TEXTS_SCRIPT: lambda remote, root, by, value: [
+        element.text for element in _find_all(root or remote.document, by, value)
+    ],
+    COLLECTION_ATTRIBUTES_SCRIPT: lambda remote, root, by, value, name: [
+        element.attributes.get(name)
+        for element in _find_all(root or remote.document, by, value)
+    ],
+    COLLECTION_FILTER_BY_TEXT_SCRIPT: _collection_filter,
+    OPTIONS_WAIT_SCRIPT: _options_wait,
+    FIND_OPTION_SCRIPT: _find_option,
+    TABLE_HEADERS_SCRIPT: _table_headers,
+    TABLE_COLUMN_SCRIPT: _table_column,
+    TABLE_CELL_SCRIPT: _table_cell,
+    TABLE_SNAPSHOT_SCRIPT: _table_snapshot,
+    DOM_EPOCH_SCRIPT: lambda remote: f"fake:{remote.version}",
+    CLEAR_STORAGE_SCRIPT: lambda remote: None,
+    _selenium_atom(
+        "getAttribute"
+    ): lambda remote, element, name: element.attributes.get(name),
+    _selenium_atom("isDisplayed"): lambda remote, element: True,
+}
+
+
+class FakeRemote:
+    """This class implements a local stand-in for a W3C WebDriver remote end, serving a synthetic
+    DOM, see the module's docstring. Every command is delayed by latency seconds, to simulate the
+    round trip to a browser, and counted per command name."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # The routes of the commands: HTTP method, path pattern and command name
+    ROUTES: List[Tuple[str, str, str]] = [
+        ("POST", r"/session", "newSession"),
+        ("DELETE", r"/session/[^/]+", "deleteSession"),
+        ("POST", r"/session/[^/]+/url", "get"),
+        ("GET", r"/session/[^/]+/url", "getCurrentUrl"),
+        ("GET", r"/session/[^/]+/window", "getWindowHandle"),
+        ("GET", r"/session/[^/]+/window/handles", "getWindowHandles"),
+        ("POST", r"/session/[^/]+/element", "findElement"),
+        ("POST", r"/session/[^/]+/elements", "findElements"),
+        ("POST", r"/session/[^/]+/element/([^/]+)/element", "findChildElement"),
+        ("POST", r"/session/[^/]+/element/([^/]+)/elements", "findChildElements"),
+        ("GET", r"/session/[^/]+/element/([^/]+)/text", "getElementText"),
+        ("GET", r"/session/[^/]+/element/([^/]+)/name", "getElementTagName"),
+        ("GET", r"/session/[^/]+/element/([^/]+)/rect", "getElementRect"),
+        ("GET", r"/session/[^/]+/element/([^/]+)/enabled", "isElementEnabled"),
+        ("GET", r"/session/[^/]+/element/([^/]+)/selected", "isElementSelected"),
+        (
+            "GET",
+            r"/session/[^/]+/element/([^/]+)/attribute/([^/]+)",
+            "getElementAttribute",
+        ),
+        (
+            "GET",
+            r"/session/[^/]+/element/([^/]+)/property/([^/]+)",
+            "getElementProperty",
+        ),
+        ("POST", r"/session/[^/]+/element/([^/]+)/click", "clickElement"),
+        ("POST", r"/session/[^/]+/element/([^/]+)/clear", "clearElement"),
+        ("POST", r"/session/[^/]+/element/([^/]+)/value", "sendKeysToElement"),
+        ("POST", r"/session/[^/]+/execute/sync", "executeScript"),
+        ("POST", r"/session/[^/]+/execute/async", "executeAsyncScript"),
+        ("POST", r"/session/[^/]+/actions", "performActions"),
+        ("DELETE", r"/session/[^/]+/actions", "releaseActions"),
+        ("DELETE", r"/session/[^/]+/cookie", "deleteAllCookies"),
+    ]
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.document = Node("#document")
+        self.url = "about:blank"
+        # Incremented on every change of the DOM caused by a command, e.g. a click
+        self.version = 0
+        self.commands: Counter = Counter()
+        self._element_ids: Dict[int, str] = {}
+        self._elements: Dict[str, Node] = {}
+        self._ids = count(1)
+        self._routes = [
+            (method, re.compile(f"{pattern}$"), name)
+            for method, pattern, name in self.ROUTES
+        ]
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.remote = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """The URL of the remote end."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def round_trips(self) -> int:
+        """The number of commands received since the counts were last reset."""
+        return sum(self.commands.values())
+
+    def start(self) -> "FakeRemote":
+        """Starts serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeRemote":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def create_driver(self) -> WebDriver:
+        """Starts a session with the remote end.
+
+        Returns
+        -------
+        WebDriver
+        """
+        return WebDriver(command_executor=self.address, options=ChromeOptions())
+
+    def load(self, page: Node):
+        """Replaces the served DOM with page, the root element of a synthetic DOM."""
+        self.document = Node("#document", children=[page])
+        self.version += 1
+
+    def reset_counts(self):
+        """Resets the command counts."""
+        self.commands.clear()
+
+    def element_id(self, node: Node) -> str:
+        """Returns the WebDriver id of an element."""
+        if id(node) not in self._element_ids:
+            element_id = f"element-{next(self._ids)}"
+            self._element_ids[id(node)] = element_id
+            self._elements[element_id] = node
+        return self._element_ids[id(node)]
+
+    def element(self, element_id: str) -> Node:
+        """Returns the element with a WebDriver id, given that it's still attached to the DOM.
+
+        Raises
+        ------
+        FakeRemoteError
+            If the element is not known or no longer attached to the DOM.
+        """
+        node = self._elements.get(element_id)
+        if node is None:
+            raise FakeRemoteError(
+                404, "no such element", f"Unknown element {element_id}"
+            )
+        if node.root is not self.document:
+            raise FakeRemoteError(
+                404, "stale element reference", f"Element {element_id} is stale"
+            )
+        return node
+
+    def serialize(self, value: Any) -> Any:
+        """Converts a value to JSON, encoding elements as WebDriver element references."""
+        if isinstance(value, Node):
+            return {ELEMENT_KEY: self.element_id(value)}
+        if isinstance(value, (list, tuple)):
+            return [self.serialize(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.serialize(item) for key, item in value.items()}
+        return value
+
+    def deserialize(self, value: Any) -> Any:
+        """Converts a value from JSON, decoding WebDriver element references to elements."""
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return self.element(value[ELEMENT_KEY])
+            return {key: self.deserialize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.deserialize(item) for item in value]
+        return value
+
+    def handle(self, method: str, path: str, payload: Dict[str, Any]) -> Any:
+        """Executes a command and returns its value.
+
+        Raises
+        ------
+        FakeRemoteError
+        """
+        for route_method, pattern, name in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                self.commands[name] += 1
+                if self.latency:
+                    time.sleep(self.latency)
+                handler = getattr(self, f"_{name}", None)
+                if handler is None:
+                    return None
+                return self.serialize(handler(payload, *match.groups()))
+        raise FakeRemoteError(404, "unknown command", f"{method} {path}")
+
+    def _newSession(self, payload):
+        # pylint: disable=invalid-name,unused-argument
+        return {"sessionId": SESSION_ID, "capabilities": {"browserName": "fake"}}
+
+    def _get(self, payload):
+        # pylint: disable=invalid-name
+        self.url = payload["url"]
+
+    def _getCurrentUrl(self, payload):
+        # pylint: disable=invalid-name,unused-argument
+        return self.url
+
+    def _getWindowHandle(self, payload):
+        # pylint: disable=invalid-name,unused-argument
+        return "window-1"
+
+    def _getWindowHandles(self, payload):
+        # pylint: disable=invalid-name,unused-argument
+        return ["window-1"]
+
+    def _find(self, context: Node, payload, first: bool):
+        elements = _find_all(context, payload["using"], payload["value"])
+        if not first:
+            return elements
+        if not elements:
+            raise FakeRemoteError(
+                404, "no such element", f"Unable to locate element: {payload['value']}"
+            )
+        return elements[0]
+
+    def _findElement(self, payload):
+        # pylint: disable=invalid-name
+        return self._find(self.document, payload, first=True)
+
+    def _findElements(self, payload):
+        # pylint: disable=invalid-name
+        return self._find(self.document, payload, first=False)
+
+    def _findChildElement(self, payload, element_id):
+        # pylint: disable=invalid-name
+        return self._find(self.element(element_id), payload, first=True)
+
+    def _findChildElements(self, payload, element_id):
+        # pylint: disable=invalid-name
+        return self._find(self.element(element_id), payload, first=False)
+
+    def _getElementText(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        return self.element(element_id).text
+
+    def _getElementTagName(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        return self.element(element_id).tag
+
+    def _getElementRect(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        self.element(element_id)
+        return {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    def _isElementEnabled(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        return "disabled" not in self.element(element_id).attributes
+
+    def _isElementSelected(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        return self.element(element_id).attributes.get("aria-selected") == "true"
+
+    def _getElementAttribute(self, payload, element_id, name):
+        # pylint: disable=invalid-name,unused-argument
+        return self.element(element_id).attributes.get(name)
+
+    def _getElementProperty(self, payload, element_id, name):
+        # pylint: disable=invalid-name,unused-argument
+        return self.element(element_id).attributes.get(name)
+
+    def _clickElement(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        element = self.element(element_id)
+        if element.on_click:
+            element.on_click(element)
+            self.version += 1
+
+    def _clearElement(self, payload, element_id):
+        # pylint: disable=invalid-name,unused-argument
+        self.element(element_id).attributes["value"] = ""
+        self.version += 1
+
+    def _sendKeysToElement(self, payload, element_id):
+        # pylint: disable=invalid-name
+        element = self.element(element_id)
+        value = element.attributes.get("value", "")
+        for key in payload["text"]:
+            # Input.clear_input selects the whole text before pressing backspace, hence backspace
+            # clears the whole value
+            value = "" if key == Keys.BACK_SPACE else value + key
+        element.attributes["value"] = value
+        self.version += 1
+
+    def _executeScript(self, payload):
+        # pylint: disable=invalid-name
+        handler = SCRIPT_HANDLERS.get(payload["script"])
+        if handler is None:
+            raise FakeRemoteError(
+                500,
+                "javascript error",
+                f"The fake remote end can't execute the script: {payload['script'][:200]}",
+            )
+        return handler(self, *self.deserialize(payload["args"]))
+
+    def _executeAsyncScript(self, payload):
+        # pylint: disable=invalid-name
+        return self._executeScript(payload)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handles the HTTP requests of the fake remote end, see FakeRemote.handle."""
+
+    protocol_version = "HTTP/1.1"
+    # The headers and body of a response are written separately, which would otherwise be
+    # delayed until the client acknowledges the headers
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        try:
+            status, body = 200, {
+                "value": self.server.remote.handle(self.command, self.path, payload)
+            }
+        except FakeRemoteError as exc:
+            status = exc.status
+            body = {
+                "value": {"error": exc.error, "message": str(exc), "stacktrace": ""}
+            }
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_DELETE = _respond
@@ -0,0 +1,208 @@
+"""This module contains a benchmark of the time it takes to import the framework's packages, e.g. in
+each of the runner's short-lived worker processes, as reported by `python -X importtime`.
+
+Each module is imported in a fresh interpreter, so that nothing is imported already. The number
+of modules an import loads is deterministic for a given environment, hence any increase is a
+regression, e.g. a package importing its submodules eagerly again. The import time is only
+compared against the baseline if --max-slowdown is given, as it depends on the machine.
+
+Examples
+--------
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time elements browsers --repeat 10
+    python -m benchmarks.import_time --save-baseline
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from benchmarks.baseline import add_baseline_arguments, load_baseline, save_or_compare
+
+# The modules whose import is measured, by default
+IMPORT_TIME_MODULES = (
+    "elements",
+    "elements.dropdowns",
+    "browsers",
+    "elements.base_web_element",
+    "browsers.chrome_browser",
+)
+DEFAULT_IMPORT_TIME_BASELINE_FILE = os.path.join(
+    os.path.dirname(__file__), "import_time_baseline.json"
+)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTimeResult(NamedTuple):
+    """The cost of importing a module in a fresh interpreter, the fastest of its repeats."""
+
+    module: str
+    import_time: float  # seconds
+    modules: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the result as a dictionary, without the module's name.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {"import_time": self.import_time, "modules": self.modules}
+
+
+def parse_import_time(output: str, module: str) -> ImportTimeResult:
+    """Parses the output of `python -X importtime -c "import <module>"`.
+
+    Each line of the output is of the form "import time: <self us> | <cumulative us> | <name>",
+    with the name indented by two spaces per level of nesting, and the lines come in the order
+    the imports finished. Hence the module's line is the first one at the top level with its name,
+    and the modules it imported are the lines right before it, after the previous top level one.
+
+    Parameters
+    ----------
+    output : str
+        The standard error of the interpreter.
+    module : str
+        The name of the imported module.
+
+    Returns
+    -------
+    ImportTimeResult
+    """
+    imported = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            # The header line
+            continue
+        # The name is separated from the bar by a single space, followed by its indentation
+        name = fields[2][1:].rstrip()
+        imported += 1
+        if name.startswith(" "):
+            continue
+        if name == module:
+            return ImportTimeResult(
+                module=module,
+                import_time=int(fields[1]) / 1_000_000,
+                modules=imported,
+            )
+        imported = 0
+    raise UserWarning(f"The import of {module} is missing from the output!")
+
+
+def measure_import_time(module: str, repeat: int = 5) -> ImportTimeResult:
+    """Measures the import of a module in a fresh interpreter, repeat times, and returns the
+    fastest.
+
+    Parameters
+    ----------
+    module : str
+    repeat : int
+        Defaults to 5.
+
+    Returns
+    -------
+    ImportTimeResult
+    """
+    results = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if process.returncode:
+            raise UserWarning(f"Could not import {module}!\n{process.stderr}")
+        results.append(parse_import_time(output=process.stderr, module=module))
+    return min(results, key=lambda result: result.import_time)
+
+
+def compare_to_import_time_baseline(
+    results: Iterable[ImportTimeResult],
+    baseline: Dict[str, Dict[str, Any]],
+    max_slowdown: Optional[float] = None,
+) -> List[str]:
+    """Compares the results of a run against the baseline, see benchmarks/baseline.py.
+
+    Parameters
+    ----------
+    results : Iterable[ImportTimeResult]
+    baseline : Dict[str, Dict[str, Any]]
+    max_slowdown : Optional[float]
+        The maximum ratio of a module's import time to its baseline import time, e.g. 1.5.
+        Defaults to None, meaning the import time is not compared.
+
+    Returns
+    -------
+    List[str]
+        A description of each regression.
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.module)
+        if expected is None:
+            continue
+        if result.modules > expected["modules"]:
+            regressions.append(
+                f"{result.module}: imports {result.modules} modules, up from "
+                f"{expected['modules']}"
+            )
+        if max_slowdown and result.import_time > expected["import_time"] * max_slowdown:
+            regressions.append(
+                f"{result.module}: {result.import_time * 1000:.1f}ms import time, up from "
+                f"{expected['import_time'] * 1000:.1f}ms"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Measures the import of the modules and prints their cost, compared to the baseline.
+
+    Returns
+    -------
+    int
+        0 if no module regressed compared to the baseline, or else 1.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time", description=__doc__
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=list(IMPORT_TIME_MODULES),
+        help="The modules to import. Defaults to the framework's packages.",
+    )
+    add_baseline_arguments(
+        parser,
+        default_baseline=DEFAULT_IMPORT_TIME_BASELINE_FILE,
+        measure="a module's import time",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(path=args.baseline)
+    results = []
+    for module in args.modules:
+        result = measure_import_time(module=module, repeat=args.repeat)
+        results.append(result)
+        expected = baseline.get(module, {}).get("modules", "-")
+        print(
+            f"{module:<28} {result.import_time * 1000:>8.2f}ms"
+            f"  {result.modules:>4} modules (baseline {expected:>4})"
+        )
+
+    return save_or_compare(
+        args=args,
+        entries={result.module: result.as_dict() for result in results},
+        compare=lambda: compare_to_import_time_baseline(
+            results=results, baseline=baseline, max_slowdown=args.max_slowdown
+        ),
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""This module contains the benchmark scenarios, each a synthetic page and a workload of the
+framework run against it, and the measurement of their cost: the number of round trips to the
+remote end, the wall time and the Python CPU time."""
+import time
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks.dom import Node
+from benchmarks.fake_remote import FakeRemote
+from elements import BaseWebElement, Collection, Input, MultiSelectDropdown, Table
+
+TABLE_ROWS = 20
+TABLE_COLUMNS = 5
+COLLECTION_SIZE = 200
+DROPDOWN_OPTIONS = 50
+DROPDOWN_SELECTION = [f"Option {index}" for index in (3, 7, 11, 19, 42)]
+PARENT_CHAIN_DEPTH = 8
+
+
+class Scenario(NamedTuple):
+    """A benchmark scenario."""
+
+    name: str
+    description: str
+    # Builds the synthetic page the workload is run against
+    build_page: Callable[[], Node]
+    # The workload, given a driver connected to the fake remote end
+    run: Callable[[WebDriver], Any]
+
+
+class ScenarioResult(NamedTuple):
+    """The cost of one run of a scenario, averaged over its repeats."""
+
+    name: str
+    round_trips: int
+    wall_time: float  # seconds
+    cpu_time: float  # seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the result as a dictionary, without its name.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "round_trips": self.round_trips,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+        }
+
+
+def _page(*children: Node) -> Node:
+    return Node("html", children=[Node("body", children=list(children))])
+
+
+def build_table_page() -> Node:
+    """A page with a table of TABLE_ROWS rows and TABLE_COLUMNS columns."""
+    header = Node(
+        "tr",
+        children=[
+            Node("th", text=f"Column {column}") for column in range(TABLE_COLUMNS)
+        ],
+    )
+    rows = [
+        Node(
+            "tr",
+            children=[
+                Node("td", text=f"Cell {row}.{column}")
+                for column in range(TABLE_COLUMNS)
+            ],
+        )
+        for row in range(TABLE_ROWS)
+    ]
+    return _page(
+        Node(
+            "table",
+            children=[Node("thead", children=[header]), Node("tbody", children=rows)],
+        )
+    )
+
+
+def build_list_page() -> Node:
+    """A page with a list of COLLECTION_SIZE items."""
+    return _page(
+        Node(
+            "ul",
+            {"class": "items"},
+            children=[
+                Node("li", text=f"Item {index}") for index in range(COLLECTION_SIZE)
+            ],
+        )
+    )
+
+
+def build_dropdown_page() -> Node:
+    """A page with a multi-select dropdown of DROPDOWN_OPTIONS options, which behaves like the one
+    MultiSelectDropdown's default locators are written for: the dropdown button expands the
+    options container, the options toggle their selection and the Apply button shows the selected
+    options, comma-separated, as the dropdown's text."""
+    button = Node("button", {"class": "dropdown", "aria-expanded": "false"})
+    container = Node("div", {"class": "hoverable-content"})
+    options = [
+        Node(
+            "li",
+            {"class": "collection-values-item", "aria-selected": "false"},
+            text=f"Option {index}",
+        )
+        for index in range(DROPDOWN_OPTIONS)
+    ]
+
+    def set_expanded(expanded: bool):
+        button.attributes["aria-expanded"] = str(expanded).lower()
+        container.attributes["class"] = (
+            "hoverable-content hoverable-content--visible"
+            if expanded
+            else "hoverable-content"
+        )
+
+    def toggle_option(option: Node):
+        selected = option.attributes["aria-selected"] == "true"
+        option.attributes["aria-selected"] = str(not selected).lower()
+
+    def apply(_: Node):
+        button.own_text = ", ".join(
+            option.text
+            for option in options
+            if option.attributes["aria-selected"] == "true"
+        )
+        set_expanded(False)
+
+    button.on_click = lambda _: set_expanded(True)
+    for option in options:
+        option.on_click = toggle_option
+    container.append(Node("ul", children=options))
+    container.append(
+        Node("button", {"aria-label": "Apply"}, text="Apply", on_click=apply)
+    )
+    return _page(button, container)
+
+
+def build_input_page() -> Node:
+    """A page with a text input."""
+    return _page(Node("input", {"id": "name", "type": "text", "value": "Plovdiv"}))
+
+
+def build_parent_chain_page() -> Node:
+    """A page with PARENT_CHAIN_DEPTH nested containers, the innermost one containing a text."""
+    node = Node("span", text="Leaf")
+    for level in reversed(range(PARENT_CHAIN_DEPTH)):
+        node = Node("div", {"class": f"level-{level}"}, children=[node])
+    return _page(node)
+
+
+def _parent_chain(driver: WebDriver) -> str:
+    element: Any = driver
+    for level in range(PARENT_CHAIN_DEPTH):
+        element = BaseWebElement(
+            parent=element, locator=(By.CSS_SELECTOR, f".level-{level}")
+        )
+    return BaseWebElement(parent=element, locator=(By.CSS_SELECTOR, "span")).text
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(
+        name="table_columns",
+        description=f"Table.columns of a {TABLE_ROWS}x{TABLE_COLUMNS} table",
+        build_page=build_table_page,
+        run=lambda driver: Table(parent=driver).columns,
+    ),
+    Scenario(
+        name="table_column_by_title",
+        description=f"Table.get_column_by_column_title of a {TABLE_ROWS}x{TABLE_COLUMNS} table",
+        build_page=build_table_page,
+        run=lambda driver: Table(parent=driver).get_column_by_column_title("Column 3"),
+    ),
+    Scenario(
+        name="collection_find_elements",
+        description=f"Collection.find_elements of {COLLECTION_SIZE} elements",
+        build_page=build_list_page,
+        run=lambda driver: Collection(
+            parent=driver, children_locator=(By.CSS_SELECTOR, "ul.items > li")
+        ).find_elements(),
+    ),
+    Scenario(
+        name="collection_texts",
+        description=f"Collection.texts of {COLLECTION_SIZE} elements",
+        build_page=build_list_page,
+        run=lambda driver: Collection(
+            parent=driver, children_locator=(By.CSS_SELECTOR, "ul.items > li")
+        ).texts(),
+    ),
+    Scenario(
+        name="multi_select_dropdown",
+        description=f"MultiSelectDropdown.select_options of {len(DROPDOWN_SELECTION)} out of "
+        f"{DROPDOWN_OPTIONS} options",
+        build_page=build_dropdown_page,
+        run=lambda driver: MultiSelectDropdown(parent=driver).select_options(
+            DROPDOWN_SELECTION
+        ),
+    ),
+    Scenario(
+        name="input_enter_value",
+        description="Input.enter_value, clearing the input first",
+        build_page=build_input_page,
+        run=lambda driver: Input(parent=driver, locator=(By.ID, "name")).enter_value(
+            "Sofia"
+        ),
+    ),
+    Scenario(
+        name="deep_parent_chain",
+        description=f"The text of an element under a chain of {PARENT_CHAIN_DEPTH} parents",
+        build_page=build_parent_chain_page,
+        run=_parent_chain,
+    ),
+]
+
+
+def run_scenario(
+    remote: FakeRemote,
+    driver: WebDriver,
+    scenario: Scenario,
+    repeat: int = 5,
+) -> ScenarioResult:
+    """Runs a scenario repeat times, each time against a freshly built page, and measures its cost.
+
+    Parameters
+    ----------
+    remote : FakeRemote
+    driver : WebDriver
+        A driver connected to remote.
+    scenario : Scenario
+    repeat : int
+        Defaults to 5.
+
+    Returns
+    -------
+    ScenarioResult
+        The round trips of a single run, and the mean wall time and CPU time of a run. The CPU
+        time is that of the thread running the workload, i.e. excluding the fake remote end.
+    """
+    round_trips, wall_time, cpu_time = 0, 0.0, 0.0
+    for _ in range(repeat):
+        remote.load(page=scenario.build_page())
+        remote.reset_counts()
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        scenario.run(driver)
+        cpu_time += time.thread_time() - cpu_start
+        wall_time += time.perf_counter() - wall_start
+        round_trips = max(round_trips, remote.round_trips)
+    return ScenarioResult(
+        name=scenario.name,
+        round_trips=round_trips,
+        wall_time=wall_time / repeat,
+        cpu_time=cpu_time / repeat,
+    )
@@ -0,0 +1,234 @@
+"""This module contains a benchmark of the startup time and memory of a real browser with each
+launch profile (see browsers/launch_profiles.py), e.g. for finding how many sessions fit on a CI
+node. Unlike the other benchmarks, it needs the browser and its driver to be installed.
+
+The memory is the resident set size (RSS) of the driver process and all of its descendants, i.e.
+the browser's processes, summed up, which overestimates it by the pages the processes share. It's
+read from /proc, hence it's only reported on Linux.
+
+Examples
+--------
+    python -m benchmarks.startup --browser chrome
+    python -m benchmarks.startup --browser firefox --profiles ci-fast ci-fast+low-memory
+    python -m benchmarks.startup --sessions 4 --url https://example.com --output startup.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from importlib import import_module
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from browsers.base_browser import BaseBrowser
+from browsers.launch_profiles import LAUNCH_PROFILES, get_launch_profile
+
+# The browser class of each browser supported by --browser, imported on use
+BROWSER_CLASSES = {
+    "chrome": ("browsers.chrome_browser", "ChromeBrowser"),
+    "firefox": ("browsers.firefox_browser", "FirefoxBrowser"),
+    "edge": ("browsers.edge_browser", "EdgeBrowser"),
+}
+DEFAULT_URL = "about:blank"
+
+
+class StartupResult(NamedTuple):
+    """The cost of starting sessions with a launch profile, averaged over the sessions."""
+
+    profile: str
+    startup_time: float  # seconds, until the session was created
+    navigation_time: float  # seconds, of opening the URL once started
+    rss: Optional[int]  # bytes, or None if it can't be read
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the result as a dictionary, without the profile's name.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "startup_time": self.startup_time,
+            "navigation_time": self.navigation_time,
+            "rss": self.rss,
+        }
+
+
+def _parent_pids() -> Dict[int, int]:
+    """Returns the parent process id of each running process, read from /proc."""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as file:
+                stat = file.read()
+        except OSError:
+            # The process exited in the meantime
+            continue
+        # The process name, in parentheses, may contain spaces, hence the fields after it are split
+        parents[int(entry)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """Returns the sum of the resident set sizes of a process and all of its descendants.
+
+    Parameters
+    ----------
+    pid : int
+
+    Returns
+    -------
+    Optional[int]
+        The size in bytes, or None if it can't be read, i.e. not on Linux.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children: Dict[int, List[int]] = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+    rss = 0
+    pids = [pid]
+    while pids:
+        pid_ = pids.pop()
+        pids.extend(children.get(pid_, []))
+        try:
+            with open(f"/proc/{pid_}/status", encoding="utf-8") as file:
+                for line in file:
+                    if line.startswith("VmRSS:"):
+                        rss += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return rss
+
+
+def _driver_pid(browser: BaseBrowser) -> Optional[int]:
+    """Returns the process id of the browser's driver, e.g. chromedriver, if it runs locally."""
+    process = getattr(getattr(browser.driver, "service", None), "process", None)
+    return process.pid if process is not None else None
+
+
+def _total_rss(browsers: List[BaseBrowser]) -> Optional[int]:
+    """Returns the RSS of the drivers of the browsers and their descendants. Browsers sharing a
+    driver service, see browsers/driver_service.py, are counted once."""
+    pids = {_driver_pid(browser) for browser in browsers}
+    if None in pids:
+        return None
+    rss_values = [process_tree_rss(pid) for pid in pids]
+    return sum(rss_values) if None not in rss_values else None
+
+
+def measure_startup(
+    browser_name: str, profile_name: str, sessions: int = 1, url: str = DEFAULT_URL
+) -> StartupResult:
+    """Starts sessions browsers with a launch profile one after another, opens url in each and
+    measures them, keeping them running until all are measured.
+
+    Parameters
+    ----------
+    browser_name : str
+        One of BROWSER_CLASSES.
+    profile_name : str
+        The name of the launch profile, see get_launch_profile.
+    sessions : int
+        Defaults to 1.
+    url : str
+        Defaults to DEFAULT_URL.
+
+    Returns
+    -------
+    StartupResult
+    """
+    module_name, class_name = BROWSER_CLASSES[browser_name]
+    browser_cls = getattr(import_module(module_name), class_name)
+    profile = get_launch_profile(profile_name)
+    browsers: List[BaseBrowser] = []
+    startup_time = navigation_time = 0.0
+    try:
+        for _ in range(sessions):
+            start = time.perf_counter()
+            browser = browser_cls(profile=profile)
+            browsers.append(browser)
+            started = time.perf_counter()
+            browser.open_url(url=url)
+            startup_time += started - start
+            navigation_time += time.perf_counter() - started
+        rss = _total_rss(browsers=browsers)
+    finally:
+        for browser in browsers:
+            browser.quit()
+    return StartupResult(
+        profile=profile_name,
+        startup_time=startup_time / sessions,
+        navigation_time=navigation_time / sessions,
+        rss=rss // sessions if rss is not None else None,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Measures the startup of the browser with each launch profile and prints the results.
+
+    Returns
+    -------
+    int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup", description=__doc__
+    )
+    parser.add_argument("--browser", default="chrome", help="chrome, firefox or edge.")
+    parser.add_argument(
+        "--profiles",
+        nargs="*",
+        default=sorted(LAUNCH_PROFILES),
+        help="The launch profiles to measure, e.g. ci-fast+low-memory. Defaults to all of them.",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=1,
+        help="The number of sessions to run at once with each profile.",
+    )
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument(
+        "--output", default=None, help="A JSON file to write the results to."
+    )
+    args = parser.parse_args(argv)
+    if args.browser not in BROWSER_CLASSES:
+        parser.error(f"Unknown browser: {args.browser}")
+    if args.sessions < 1:
+        parser.error("The number of sessions must be at least 1")
+    for profile_name in args.profiles:
+        try:
+            get_launch_profile(profile_name)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    results = []
+    for profile_name in args.profiles:
+        result = measure_startup(
+            browser_name=args.browser,
+            profile_name=profile_name,
+            sessions=args.sessions,
+            url=args.url,
+        )
+        results.append(result)
+        rss = f"{result.rss / 2**20:>8.1f}MB" if result.rss is not None else "       -"
+        print(
+            f"{profile_name:<28} {result.startup_time * 1000:>8.0f}ms startup"
+            f"  {result.navigation_time * 1000:>8.0f}ms navigation  {rss} RSS per session"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {result.profile: result.as_dict() for result in results},
+                file,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
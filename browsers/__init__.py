@@ -1,4 +1,54 @@
-"""__init__ for browsers package"""
-from browsers.chrome_browser import ChromeBrowser, ChromeOptionArguments
-from browsers.edge_browser import EdgeBrowser, EdgeOptionArguments
-from browsers.firefox_browser import FirefoxBrowser, FirefoxOptionArguments
+"""__init__ for browsers package
+
+The browser classes are imported lazily, on first access, see elements/__init__.py. Hence a worker
+running a single browser type doesn't import the modules of the others.
+"""
+from typing import TYPE_CHECKING
+
+from lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from browsers.browser_pool import BrowserPool, get_browser_pool
+    from browsers.chrome_browser import ChromeBrowser, ChromeOptionArguments
+    from browsers.driver_service import SharedDriverService, get_shared_driver_service
+    from browsers.edge_browser import EdgeBrowser, EdgeOptionArguments
+    from browsers.firefox_browser import FirefoxBrowser, FirefoxOptionArguments
+    from browsers.launch_profiles import (
+        LAUNCH_PROFILES,
+        LaunchProfile,
+        get_launch_profile,
+    )
+    from browsers.network import NetworkProxy, NetworkRules
+    from browsers.readiness import (
+        PredicateReadiness,
+        ReadinessStrategy,
+        ScriptReadiness,
+        get_readiness_strategy,
+    )
+
+# The module each lazily imported name is defined in
+_LAZY_IMPORTS = {
+    "BrowserPool": "browsers.browser_pool",
+    "get_browser_pool": "browsers.browser_pool",
+    "ChromeBrowser": "browsers.chrome_browser",
+    "ChromeOptionArguments": "browsers.chrome_browser",
+    "SharedDriverService": "browsers.driver_service",
+    "get_shared_driver_service": "browsers.driver_service",
+    "EdgeBrowser": "browsers.edge_browser",
+    "EdgeOptionArguments": "browsers.edge_browser",
+    "FirefoxBrowser": "browsers.firefox_browser",
+    "FirefoxOptionArguments": "browsers.firefox_browser",
+    "LAUNCH_PROFILES": "browsers.launch_profiles",
+    "LaunchProfile": "browsers.launch_profiles",
+    "get_launch_profile": "browsers.launch_profiles",
+    "NetworkProxy": "browsers.network",
+    "NetworkRules": "browsers.network",
+    "PredicateReadiness": "browsers.readiness",
+    "ReadinessStrategy": "browsers.readiness",
+    "ScriptReadiness": "browsers.readiness",
+    "get_readiness_strategy": "browsers.readiness",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
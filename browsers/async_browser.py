@@ -0,0 +1,375 @@
+"""This module contains an implementation of an asyncio based browser, which drives a WebDriver
+session without blocking the event loop, so a single thread can drive many sessions concurrently.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+
+from browsers.async_remote_connection import DEFAULT_POOL_SIZE, AsyncRemoteConnection
+from browsers.readiness import (
+    DEFAULT_READY_TIMEOUT,
+    Ready,
+    get_readiness_strategy,
+    wait_until_ready_async,
+)
+from elements.locator_chain import to_script_locator
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+# The key of web element references in the W3C WebDriver protocol
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class AsyncWebElement:
+    """This class implements a reference to an element of an AsyncBaseBrowser's page, i.e. the
+    asyncio counterpart of Selenium's WebElement."""
+
+    def __init__(self, parent: AsyncBaseBrowser, element_id: str):
+        self.parent = parent
+        self.id = element_id  # pylint: disable=invalid-name
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(session={self.parent.session_id}, id={self.id})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, AsyncWebElement) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    async def _execute(
+        self, method: str, path: str, payload: Optional[Dict] = None
+    ) -> Any:
+        return await self.parent.execute(method, f"/element/{self.id}{path}", payload)
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Finds the first element matching the locator under this element.
+
+        Returns
+        -------
+        AsyncWebElement
+        """
+        by, value = to_script_locator((by, value))
+        return self.parent.unwrap(
+            await self._execute("POST", "/element", {"using": by, "value": value})
+        )
+
+    async def find_elements(self, by: str, value: str) -> List[AsyncWebElement]:
+        """Finds all elements matching the locator under this element.
+
+        Returns
+        -------
+        List[AsyncWebElement]
+        """
+        by, value = to_script_locator((by, value))
+        return self.parent.unwrap(
+            await self._execute("POST", "/elements", {"using": by, "value": value})
+        )
+
+    async def click(self):
+        """Clicks on the element."""
+        await self._execute("POST", "/click", {})
+
+    async def send_keys(self, value: Any):
+        """Types value into the element."""
+        await self._execute("POST", "/value", {"text": str(value)})
+
+    async def clear(self):
+        """Clears the value of the element."""
+        await self._execute("POST", "/clear", {})
+
+    async def text(self) -> str:
+        """Returns the visible text of the element.
+
+        Returns
+        -------
+        str
+        """
+        return await self._execute("GET", "/text")
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        """Returns the value of the element's attribute. Unlike WebElement.get_attribute, the
+        element's property of the same name is not used as a fallback, see get_property.
+
+        Returns
+        -------
+        Optional[str]
+        """
+        return await self._execute("GET", f"/attribute/{name}")
+
+    async def get_property(self, name: str) -> Any:
+        """Returns the value of the element's property.
+
+        Returns
+        -------
+        Any
+        """
+        return await self._execute("GET", f"/property/{name}")
+
+    async def is_enabled(self) -> bool:
+        """Determines whether the element is enabled or not.
+
+        Returns
+        -------
+        bool
+        """
+        return await self._execute("GET", "/enabled")
+
+    async def is_selected(self) -> bool:
+        """Determines whether the element is selected or not.
+
+        Returns
+        -------
+        bool
+        """
+        return await self._execute("GET", "/selected")
+
+    async def is_displayed(self) -> bool:
+        """Determines whether the element is displayed or not.
+
+        Returns
+        -------
+        bool
+        """
+        return await self._execute("GET", "/displayed")
+
+
+class AsyncBaseBrowser:
+    """This class implements a browser driven over asyncio. Sessions created with the same
+    connection share its pool of keep-alive connections.
+
+    Examples
+    --------
+        browser = await AsyncBaseBrowser.create("http://localhost:9515", options=ChromeOptions())
+        browsers = await asyncio.gather(
+            *(AsyncBaseBrowser.create(connection=connection, options=options) for _ in range(20))
+        )
+        browser = await AsyncBaseBrowser.launch(service=ChromeService(), options=ChromeOptions())
+        await browser.open_url("https://example.com")
+        await browser.quit()
+    """
+
+    def __init__(
+        self,
+        connection: AsyncRemoteConnection,
+        session_id: str,
+        capabilities: Dict[str, Any],
+        service: Optional[Service] = None,
+    ):
+        self.connection = connection
+        self.session_id = session_id
+        self.capabilities = capabilities
+        self._service = service
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(session={self.session_id})"
+
+    @classmethod
+    async def create(
+        cls,
+        remote_server_addr: Optional[str] = None,
+        options: Optional[ArgOptions] = None,
+        connection: Optional[AsyncRemoteConnection] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        service: Optional[Service] = None,
+    ) -> AsyncBaseBrowser:
+        """Creates a new session on a running remote end, e.g. a driver or a Selenium Grid.
+
+        Parameters
+        ----------
+        remote_server_addr : Optional[str]
+            The URL of the remote end. Not needed if connection is passed.
+        options : Optional[ArgOptions]
+            The browser's options, e.g. ChromeOptions, whose capabilities are requested.
+        connection : Optional[AsyncRemoteConnection]
+            A connection to share with other sessions. Defaults to a new one.
+        pool_size : int
+            The pool size of a new connection.
+        service : Optional[Service]
+            A driver service owned by the browser, which is stopped when the browser quits.
+
+        Returns
+        -------
+        AsyncBaseBrowser
+        """
+        if connection is None:
+            if remote_server_addr is None:
+                raise ValueError(
+                    "Either a remote_server_addr or a connection is required!"
+                )
+            connection = AsyncRemoteConnection(remote_server_addr, pool_size=pool_size)
+        capabilities = options.to_capabilities() if options is not None else {}
+        value = await connection.execute(
+            "POST",
+            "/session",
+            {"capabilities": {"alwaysMatch": capabilities, "firstMatch": [{}]}},
+        )
+        browser = cls(
+            connection=connection,
+            session_id=value["sessionId"],
+            capabilities=value.get("capabilities", {}),
+            service=service,
+        )
+        LOGGER.info("Started an async browser session: %s.", browser.session_id)
+        return browser
+
+    @classmethod
+    async def launch(
+        cls,
+        service: Service,
+        options: Optional[ArgOptions] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> AsyncBaseBrowser:
+        """Starts a driver service, e.g. selenium.webdriver.chrome.service.Service, without
+        blocking the event loop and creates a session on it. The service is stopped when the
+        browser quits.
+
+        Returns
+        -------
+        AsyncBaseBrowser
+        """
+        await asyncio.get_running_loop().run_in_executor(None, service.start)
+        return await cls.create(
+            remote_server_addr=service.service_url,
+            options=options,
+            pool_size=pool_size,
+            service=service,
+        )
+
+    def wrap(self, value: Any) -> Any:
+        """Converts AsyncWebElements within value to the protocol's element references."""
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
+
+    def unwrap(self, value: Any) -> Any:
+        """Converts the protocol's element references within value to AsyncWebElements."""
+        if isinstance(value, list):
+            return [self.unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(parent=self, element_id=value[ELEMENT_KEY])
+            return {key: self.unwrap(item) for key, item in value.items()}
+        return value
+
+    async def execute(
+        self, method: str, path: str, payload: Optional[Dict] = None
+    ) -> Any:
+        """Sends a command of the browser's session.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the command.
+        path : str
+            The path of the command's endpoint, relative to the session, e.g. "/url".
+        payload : Optional[Dict]
+            The command's parameters.
+
+        Returns
+        -------
+        Any
+            The value of the command's response.
+        """
+        return await self.connection.execute(
+            method, f"/session/{self.session_id}{path}", payload
+        )
+
+    async def open_url(
+        self,
+        url: str,
+        ready: Optional[Ready] = None,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    ):
+        """Opens a url specified by url: str and, if ready is given, waits until the page is ready,
+        see browsers/readiness.py and BaseBrowser.open_url. Predicates are called with the browser.
+        """
+        await self.execute("POST", "/url", {"url": url})
+        if ready is not None:
+            await wait_until_ready_async(
+                browser=self,
+                strategy=get_readiness_strategy(ready),
+                timeout=ready_timeout,
+            )
+        LOGGER.info("Opened URL: %s.", url)
+
+    async def current_url(self) -> str:
+        """Returns the URL of the current page.
+
+        Returns
+        -------
+        str
+        """
+        return await self.execute("GET", "/url")
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Finds the first element matching the locator in the page.
+
+        Returns
+        -------
+        AsyncWebElement
+        """
+        by, value = to_script_locator((by, value))
+        return self.unwrap(
+            await self.execute("POST", "/element", {"using": by, "value": value})
+        )
+
+    async def find_elements(self, by: str, value: str) -> List[AsyncWebElement]:
+        """Finds all elements matching the locator in the page.
+
+        Returns
+        -------
+        List[AsyncWebElement]
+        """
+        by, value = to_script_locator((by, value))
+        return self.unwrap(
+            await self.execute("POST", "/elements", {"using": by, "value": value})
+        )
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Synchronously executes JavaScript in the page, see WebDriver.execute_script.
+
+        Returns
+        -------
+        Any
+            The value returned by the script.
+        """
+        return self.unwrap(
+            await self.execute(
+                "POST",
+                "/execute/sync",
+                {"script": script, "args": self.wrap(list(args))},
+            )
+        )
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        """Asynchronously executes JavaScript in the page, see WebDriver.execute_async_script.
+
+        Returns
+        -------
+        Any
+            The value the script passed to its callback.
+        """
+        return self.unwrap(
+            await self.execute(
+                "POST",
+                "/execute/async",
+                {"script": script, "args": self.wrap(list(args))},
+            )
+        )
+
+    async def quit(self):
+        """Ends the session and stops the driver service owned by the browser, if any."""
+        await self.connection.execute("DELETE", f"/session/{self.session_id}")
+        if self._service is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._service.stop)
+            await self.connection.close()
+        LOGGER.info("Quit the async browser session: %s.", self.session_id)
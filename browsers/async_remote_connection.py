@@ -0,0 +1,194 @@
+"""This module contains an implementation of a non-blocking connection to a WebDriver remote end,
+e.g. chromedriver or a Selenium Grid, over a pool of keep-alive HTTP/1.1 connections."""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+# The maximum number of concurrent connections to the remote end per AsyncRemoteConnection
+DEFAULT_POOL_SIZE = 16
+DEFAULT_COMMAND_TIMEOUT = 120  # seconds
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncRemoteConnection:
+    """This class implements a non-blocking connection to a WebDriver remote end. Commands are
+    sent over a pool of up to pool_size keep-alive connections, which are reused across commands
+    and across all sessions sharing the connection.
+
+    Examples
+    --------
+        connection = AsyncRemoteConnection("http://localhost:9515", pool_size=32)
+        value = await connection.execute("GET", "/status")
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        remote_server_addr: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_COMMAND_TIMEOUT,
+    ):
+        url = urlparse(remote_server_addr)
+        if url.scheme != "http":
+            raise ValueError(
+                f"Only http remote ends are supported, got: {remote_server_addr}"
+            )
+        self.host = url.hostname or "localhost"
+        self.port = url.port or 80
+        self.base_path = url.path.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: List[_Connection] = []
+        # Created on first use, so the pool binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._error_handler = ErrorHandler()
+
+    async def execute(
+        self, method: str, path: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Sends a WebDriver command and returns the value of its response.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the command, e.g. "POST".
+        path : str
+            The path of the command's endpoint, e.g. "/session/{id}/url".
+        payload : Optional[Dict[str, Any]]
+            The command's parameters.
+
+        Returns
+        -------
+        Any
+            The "value" of the response.
+
+        Raises
+        ------
+        WebDriverException
+            The same exception WebDriver raises for the error returned by the remote end.
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        status, response_body = await asyncio.wait_for(
+            self._request(method=method, path=self.base_path + path, body=body),
+            timeout=self.timeout,
+        )
+        text = response_body.decode("utf-8")
+        if status >= 400:
+            self._error_handler.check_response({"status": status, "value": text})
+        return json.loads(text).get("value") if text else None
+
+    async def _request(
+        self, method: str, path: str, body: Optional[bytes]
+    ) -> Tuple[int, bytes]:
+        """Sends an HTTP request over a pooled connection and returns the response's status and
+        body. A request over a reused connection, which the remote end may have closed in the
+        meantime, is retried once over a new one."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+        async with self._semaphore:
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await self._open()
+            try:
+                status, response_body, keep_alive = await self._send_or_close(
+                    connection=connection, method=method, path=path, body=body
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not reused:
+                    raise
+                connection = await self._open()
+                status, response_body, keep_alive = await self._send_or_close(
+                    connection=connection, method=method, path=path, body=body
+                )
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection[1].close()
+            return status, response_body
+
+    async def _open(self) -> _Connection:
+        """Opens a new connection to the remote end."""
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def _send_or_close(
+        self, connection: _Connection, method: str, path: str, body: Optional[bytes]
+    ) -> Tuple[int, bytes, bool]:
+        """Sends the request like _send, but closes the connection if sending fails for any reason,
+        including the request being cancelled, e.g. by the timeout, as the connection is left in
+        an unknown state and would otherwise leak."""
+        try:
+            return await self._send(
+                connection=connection, method=method, path=path, body=body
+            )
+        except BaseException:
+            connection[1].close()
+            raise
+
+    async def _send(
+        self, connection: _Connection, method: str, path: str, body: Optional[bytes]
+    ) -> Tuple[int, bytes, bool]:
+        """Writes an HTTP/1.1 request to the connection and reads the response.
+
+        Returns
+        -------
+        Tuple[int, bytes, bool]
+            The status of the response, its body and whether the connection can be reused.
+        """
+        # pylint: disable=too-many-locals
+        reader, writer = connection
+        body = body or b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            "Connection: keep-alive\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("The remote end closed the connection!")
+        status = int(status_line.split()[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "content-length" in headers:
+            response_body = await reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if not size:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            response_body = b"".join(chunks)
+        else:
+            # The body ends when the remote end closes the connection
+            return status, await reader.read(), False
+        return status, response_body, headers.get("connection", "").lower() != "close"
+
+    async def close(self):
+        """Closes all idle connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        LOGGER.info(
+            "Closed %s idle connections to %s:%s.", len(idle), self.host, self.port
+        )
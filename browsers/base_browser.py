@@ -1,29 +1,279 @@
 """This module contains a base class implementation for a browser."""
-import logging
+from typing import TYPE_CHECKING, Optional, Set
+from urllib.parse import urlsplit
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from settings import LOGGING_LEVEL, set_global_driver
+from browsers.readiness import (
+    DEFAULT_READY_TIMEOUT,
+    Ready,
+    get_readiness_strategy,
+    wait_until_ready,
+)
+from elements.element_cache import (
+    ElementCache,
+    disable_element_cache,
+    enable_element_cache,
+    get_element_cache,
+)
+from instrumentation.actions import instrumented
+from instrumentation.page_metrics import is_page_metrics_enabled, record_page_metrics
+from instrumentation.recorder import (
+    CommandRecorder,
+    get_command_recorder,
+    instrument_driver,
+    is_instrumentation_enabled,
+)
+from logger import get_logger, log_timing
+from settings import (
+    ELEMENT_CACHE_ENABLED,
+    clear_global_driver,
+    set_global_driver,
+)
 
-logging.basicConfig(level=LOGGING_LEVEL)
+if TYPE_CHECKING:
+    # Only for the annotations, as the proxy's http.server is only imported when it's used
+    from browsers.network import NetworkProxy, NetworkRules, NetworkStats
+
+LOGGER = get_logger(__name__)
 DEFAULT_WINDOW_WIDTH = 1280
 DEFAULT_WINDOW_HEIGHT = 720
+# The URL a browser is left at after being reset
+BLANK_URL = "about:blank"
+# Clears the storage of the current page's origin. Access to the storage throws for some pages,
+# e.g. about:blank, hence the errors are ignored
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# The storage reset clears of each origin, through the DevTools protocol. The cookies are cleared
+# for all origins at once
+CLEARED_STORAGE_TYPES = (
+    "local_storage,indexeddb,websql,file_systems,service_workers,cache_storage"
+)
+
+
+def _origin_of(url: str) -> str:
+    """Returns the origin of an HTTP(S) URL, e.g. "https://example.com:8080", or else an empty
+    string, e.g. for about:blank."""
+    parts = urlsplit(url)
+    return (
+        f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") else ""
+    )
 
 
 class BaseBrowser:
     """This class implements a base browser class to be inherited by specific browsers, such as
     Chrome, Firefox, Edge."""
 
-    def __init__(self, driver: WebDriver):
+    def __init__(
+        self, driver: WebDriver, network_proxy: Optional["NetworkProxy"] = None
+    ):
         self.driver: WebDriver = driver
+        # The proxy the browser was launched with, if any, see browsers/network.py
+        self.network_proxy = network_proxy
+        # The rules of the proxy at launch, restored by reset after block_requests
+        self._launch_rules = network_proxy.rules if network_proxy is not None else None
+        self._blocked_requests = False
+        # The origins opened with open_url since the last reset, whose storage reset clears
+        self._visited_origins: Set[str] = set()
         set_global_driver(driver=self.driver)
+        if ELEMENT_CACHE_ENABLED:
+            self.enable_element_cache()
+        if is_instrumentation_enabled():
+            self.enable_instrumentation()
+
+    @property
+    def element_cache(self) -> Optional[ElementCache]:
+        """Returns the element cache of the browser, or None if it's not enabled.
+
+        Returns
+        -------
+        Optional[ElementCache]
+        """
+        return get_element_cache(driver=self.driver)
+
+    def enable_element_cache(self) -> ElementCache:
+        """Enables the element cache for all elements found in the browser, see
+        elements/element_cache.py.
+
+        Returns
+        -------
+        ElementCache
+            The browser's element cache, which exposes the hit/miss counters.
+        """
+        return enable_element_cache(driver=self.driver)
+
+    def enable_instrumentation(self) -> CommandRecorder:
+        """Makes the browser record every WebDriver command it issues, see
+        instrumentation/recorder.py.
+
+        Returns
+        -------
+        CommandRecorder
+            The recorder the commands are recorded with.
+        """
+        instrument_driver(driver=self.driver)
+        return get_command_recorder()
+
+    def block_requests(self, rules: "NetworkRules"):
+        """Blocks the requests matching rules until the next reset, see browsers/network.py.
+        Chromium based browsers block them through the DevTools protocol, by their URL only, i.e.
+        the resource types are blocked by their file extensions. If the browser was launched with
+        a NetworkProxy, its rules are replaced with rules, which also applies to the other
+        browsers using the proxy, until reset restores the proxy's rules at launch.
+
+        Parameters
+        ----------
+        rules : NetworkRules
+
+        Raises
+        ------
+        UserWarning
+            If the browser is neither Chromium based nor launched with a NetworkProxy.
+        """
+        self._blocked_requests = True
+        if self.network_proxy is not None:
+            self.network_proxy.rules = rules
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": rules.blocked_url_patterns()}
+            )
+        elif self.network_proxy is None:
+            raise UserWarning(
+                "Requests can only be blocked in Chromium based browsers or in browsers "
+                "launched with a NetworkProxy!"
+            )
+        LOGGER.info("Blocking requests with %s.", rules)
+
+    @property
+    def network_stats(self) -> Optional["NetworkStats"]:
+        """Returns the counters of the requests the browser's NetworkProxy blocked and served from
+        its cache, shared with the other browsers using the proxy, or None if the browser was not
+        launched with a proxy.
+
+        Returns
+        -------
+        Optional[NetworkStats]
+        """
+        return self.network_proxy.stats if self.network_proxy is not None else None
+
+    def _track_origin(self, url: str):
+        origin = _origin_of(url)
+        if origin:
+            self._visited_origins.add(origin)
+
+    @instrumented
+    def open_url(
+        self,
+        url: str,
+        ready: Optional[Ready] = None,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    ):
+        """Opens a url specified by url: str and, if ready is given, waits until the page is ready,
+        see browsers/readiness.py. Then records the page's performance metrics, if enabled, see
+        instrumentation/page_metrics.py.
+
+        Parameters
+        ----------
+        url : str
+        ready : Optional[Ready]
+            The readiness strategy, e.g. "network-idle", "network-idle+dom-quiet", a
+            ReadinessStrategy or a predicate called with the driver. Defaults to None, meaning
+            the navigation returns according to the session's page load strategy only.
+        ready_timeout : float
+            Defaults to DEFAULT_READY_TIMEOUT.
+
+        Raises
+        ------
+        TimeoutException
+            If the page was not ready within ready_timeout.
+        """
+        self._track_origin(url=url)
+        strategy = get_readiness_strategy(ready) if ready is not None else None
+        if strategy is not None:
+            strategy.prepare(driver=self.driver)
+        with log_timing(
+            LOGGER, "open_url", "Opened URL: %s", url, url=url, ready=str(ready)
+        ):
+            self.driver.get(url=url)
+            if strategy is not None:
+                wait_until_ready(
+                    driver=self.driver, strategy=strategy, timeout=ready_timeout
+                )
+        if is_page_metrics_enabled() and not url.startswith("about:"):
+            record_page_metrics(driver=self.driver, url=url)
+        if self.element_cache is not None:
+            self.element_cache.invalidate()
+
+    def is_alive(self) -> bool:
+        """Determines whether the browser's session is still usable.
+
+        Returns
+        -------
+        bool
+        """
+        try:
+            _ = self.driver.current_window_handle
+        except WebDriverException:
+            return False
+        return True
+
+    @instrumented
+    def reset(self, url: str = BLANK_URL):
+        """Brings the browser back to a clean state, which is cheaper than starting a new one:
+        replaces all windows with a new one, which drops the session storage of all origins,
+        clears the cookies and the storage, e.g. local storage and IndexedDB, undoes
+        block_requests and opens url.
+
+        Chromium based browsers clear the cookies of all origins and the storage of every origin
+        opened with open_url, and of the current one. Other browsers, i.e. Firefox, only clear the
+        cookies and local storage of the origin open when reset is called. Firefox keeps the
+        cookies and local storage of all other origins visited, which the next user of the
+        browser then sees.
 
-    def open_url(self, url: str):
-        """Opens a url specified by url: str."""
-        self.driver.get(url=url)
-        logging.info("Opened URL: %s.", url)
+        Parameters
+        ----------
+        url : str
+            The URL to open after the reset. Defaults to BLANK_URL.
+        """
+        self._track_origin(url=self.driver.current_url)
+        self.driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        chromium = hasattr(self.driver, "execute_cdp_cmd")
+        if not chromium:
+            # WebDriver only deletes the cookies of the current page's domain, hence it's done while
+            # the test's page is still open
+            self.driver.delete_all_cookies()
+        handles = self.driver.window_handles
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        for handle in handles:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        if chromium:
+            # Chromium based browsers can clear the cookies of all domains, not only the current one
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in self._visited_origins:
+                self.driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": CLEARED_STORAGE_TYPES},
+                )
+            if self._blocked_requests:
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        if self._blocked_requests and self.network_proxy is not None:
+            self.network_proxy.rules = self._launch_rules
+        self._blocked_requests = False
+        self._visited_origins.clear()
+        self.open_url(url=url)
+        LOGGER.info("Reset the browser to URL: %s.", url)
 
     def quit(self):
         """Quits the driver (closes the WebDriver session) and closes all associated windows."""
         self.driver.quit()
-        logging.info("Quit the driver and closed all associated windows.")
+        disable_element_cache(driver=self.driver)
+        clear_global_driver(driver=self.driver)
+        LOGGER.info("Quit the driver and closed all associated windows.")
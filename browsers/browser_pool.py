@@ -0,0 +1,312 @@
+"""This module contains an implementation of a pool of browsers, which are started ahead of time
+and reused across tests instead of being started and quit for every test."""
+import atexit
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple, Type
+
+from browsers.base_browser import BLANK_URL, BaseBrowser
+from logger import get_logger
+from settings import set_global_driver
+
+LOGGER = get_logger(__name__)
+DEFAULT_POOL_SIZE = 2
+# How many times a browser is checked out before it's quit and replaced by a new one
+DEFAULT_MAX_USES = 50
+
+
+class PoolStats:
+    """This class contains the counters of a BrowserPool."""
+
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    def __init__(self):
+        self.launches = 0
+        self.checkouts = 0
+        self.reuses = 0
+        self.recycles = 0
+        self.failed_health_checks = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the counters as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return dict(vars(self))
+
+
+class BrowserPool:
+    """This class implements a pool of up to size browsers of a given type, started with the same
+    arguments. Checking a browser out hands over an idle browser, or starts a new one if the pool
+    isn't full yet, or else waits for one to be checked in. Checking a browser in resets it and
+    makes it available again, unless it has been used max_uses times or is no longer usable, in
+    which case it's quit.
+
+    Examples
+    --------
+        pool = BrowserPool(ChromeBrowser, size=4, options_args=[(ChromeOptionArguments.HEADLESS,)])
+        pool.prewarm()
+        with pool.session() as browser:
+            browser.open_url("https://example.com")
+        print(pool.stats.as_dict())
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        browser_cls: Type[BaseBrowser],
+        size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        reset_url: str = BLANK_URL,
+        **browser_kwargs,
+    ):
+        if size < 1 or max_uses < 1:
+            raise ValueError("The pool size and the maximum uses must be at least 1!")
+        self.browser_cls = browser_cls
+        self.size = size
+        self.max_uses = max_uses
+        self.reset_url = reset_url
+        self.browser_kwargs = browser_kwargs
+        self.stats = PoolStats()
+        self._idle: Deque[BaseBrowser] = deque()
+        self._uses: Dict[int, int] = {}
+        self._started = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.browser_cls.__name__}, size={self.size}, "
+            f"kwargs={self.browser_kwargs})"
+        )
+
+    def _launch(self) -> BaseBrowser:
+        """Starts a new browser, given that a slot for it was already reserved."""
+        try:
+            browser = self.browser_cls(**self.browser_kwargs)
+        except Exception:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.stats.launches += 1
+            self._uses[id(browser)] = 0
+        return browser
+
+    def _discard(self, browser: BaseBrowser):
+        """Quits a browser and frees up its slot in the pool."""
+        try:
+            browser.quit()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.warning("Could not quit browser %s of pool %s.", browser, self)
+        with self._condition:
+            self._uses.pop(id(browser), None)
+            self._started -= 1
+            self._condition.notify()
+
+    def prewarm(self, count: Optional[int] = None):
+        """Starts browsers ahead of time, so that checking them out doesn't have to wait for them to
+        start.
+
+        Parameters
+        ----------
+        count : Optional[int]
+            How many browsers to start. Defaults to filling up the pool.
+        """
+        with self._condition:
+            count = max(min(count or self.size, self.size - self._started), 0)
+            self._started += count
+        launched = 0
+        try:
+            for _ in range(count):
+                # Releases its own slot if it fails
+                browser = self._launch()
+                launched += 1
+                with self._condition:
+                    self._idle.append(browser)
+                    self._condition.notify()
+        finally:
+            # Releases the slots reserved for the browsers not launched after a failure
+            unlaunched = count - launched - (launched < count)
+            if unlaunched:
+                with self._condition:
+                    self._started -= unlaunched
+                    self._condition.notify(unlaunched)
+        LOGGER.info("Prewarmed %s browsers in pool %s.", count, self)
+
+    def checkout(self, timeout: Optional[float] = None) -> BaseBrowser:
+        """Hands over a clean browser for exclusive use, until it's checked in again.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            How long to wait for a browser to be checked in if the pool is full, in seconds.
+            Defaults to waiting indefinitely.
+
+        Returns
+        -------
+        BaseBrowser
+
+        Raises
+        ------
+        TimeoutError
+            If no browser became available within the timeout.
+        """
+        start = time.monotonic()
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError(f"The browser pool {self} is closed!")
+                remaining = (
+                    None if timeout is None else timeout - (time.monotonic() - start)
+                )
+                if not self._condition.wait_for(
+                    lambda: self._idle or self._started < self.size, timeout=remaining
+                ):
+                    raise TimeoutError(
+                        f"Could not check out a browser from pool {self} within {timeout} seconds!"
+                    )
+                browser = self._idle.popleft() if self._idle else None
+                if browser is None:
+                    self._started += 1
+
+            if browser is None:
+                browser = self._launch()
+            elif not browser.is_alive():
+                with self._condition:
+                    self.stats.failed_health_checks += 1
+                self._discard(browser)
+                continue
+            else:
+                with self._condition:
+                    self.stats.reuses += 1
+            break
+
+        wait_time = time.monotonic() - start
+        with self._condition:
+            self.stats.checkouts += 1
+            self.stats.total_wait_time += wait_time
+            self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+            self._uses[id(browser)] += 1
+        # The browser may have been started by another thread
+        set_global_driver(driver=browser.driver)
+        LOGGER.info(
+            "Checked out browser %s from pool %s in %.3fs.", browser, self, wait_time
+        )
+        return browser
+
+    def checkin(self, browser: BaseBrowser, healthy: bool = True):
+        """Returns a browser to the pool. The browser is reset, or quit if it has been used
+        max_uses times, if healthy is False or if it can't be reset.
+
+        Parameters
+        ----------
+        browser : BaseBrowser
+            A browser checked out from this pool.
+        healthy : bool
+            Whether the browser is known to be usable, e.g. False after a test crashed it.
+            Defaults to True.
+        """
+        if (
+            self._closed
+            or not healthy
+            or self._uses.get(id(browser), 0) >= self.max_uses
+        ):
+            with self._condition:
+                self.stats.recycles += 1
+            self._discard(browser)
+            return
+        try:
+            browser.reset(url=self.reset_url)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.warning("Could not reset browser %s, hence it's recycled.", browser)
+            with self._condition:
+                self.stats.recycles += 1
+            self._discard(browser)
+            return
+        with self._condition:
+            self._idle.append(browser)
+            self._condition.notify()
+        LOGGER.info("Checked in browser %s to pool %s.", browser, self)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[BaseBrowser]:
+        """Checks out a browser for the duration of the with block and checks it in afterwards. A
+        browser which is no longer usable after an exception is recycled.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            See checkout.
+
+        Yields
+        ------
+        BaseBrowser
+        """
+        browser = self.checkout(timeout=timeout)
+        try:
+            yield browser
+        except BaseException:
+            self.checkin(browser, healthy=browser.is_alive())
+            raise
+        self.checkin(browser)
+
+    def close(self):
+        """Quits all idle browsers and makes the pool quit browsers when they're checked in."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        for browser in idle:
+            self._discard(browser)
+        LOGGER.info("Closed browser pool %s.", self)
+
+
+_POOLS: Dict[Tuple[Type[BaseBrowser], str], BrowserPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_browser_pool(
+    browser_cls: Type[BaseBrowser],
+    size: int = DEFAULT_POOL_SIZE,
+    max_uses: int = DEFAULT_MAX_USES,
+    **browser_kwargs,
+) -> BrowserPool:
+    """Returns the process-wide pool of the given browser type and arguments, creating it on first
+    use. The size and max_uses are only applied when the pool is created.
+
+    Examples
+    --------
+        with get_browser_pool(ChromeBrowser, options_args=headless_args).session() as browser:
+            ...
+
+    Returns
+    -------
+    BrowserPool
+    """
+    key = (browser_cls, repr(sorted(browser_kwargs.items())))
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = BrowserPool(
+                browser_cls, size=size, max_uses=max_uses, **browser_kwargs
+            )
+        return _POOLS[key]
+
+
+@atexit.register
+def close_browser_pools():
+    """Closes all pools created with get_browser_pool."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -1,18 +1,26 @@
 """This module contains an implementation of a Chrome browser."""
-import logging
 from enum import Enum
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from selenium.webdriver import Chrome, ChromeOptions
+from selenium.webdriver.chrome.service import Service
 
-from browsers.base_browser import (
-    DEFAULT_WINDOW_HEIGHT,
-    DEFAULT_WINDOW_WIDTH,
-    BaseBrowser,
+from browsers.base_browser import BaseBrowser
+from browsers.chromium_options import configure_chromium_options
+from browsers.driver_service import (
+    SharedDriverService,
+    SharedServiceChrome,
+    get_shared_driver_service,
 )
-from settings import LOGGING_LEVEL
+from browsers.launch_profiles import LaunchProfile
+from logger import get_logger
+from settings import SHARE_DRIVER_SERVICES
 
-logging.basicConfig(level=LOGGING_LEVEL)
+if TYPE_CHECKING:
+    # Only for the annotations, as the proxy's http.server is only imported when it's used
+    from browsers.network import NetworkProxy
+
+LOGGER = get_logger(__name__)
 
 
 class ChromeOptionArguments(Enum):
@@ -20,6 +28,16 @@ class ChromeOptionArguments(Enum):
 
     WINDOW_SIZE = "window-size"
     HEADLESS = "headless"
+    DISABLE_EXTENSIONS = "disable-extensions"
+    DISABLE_BACKGROUND_TIMER_THROTTLING = "disable-background-timer-throttling"
+    DISABLE_BACKGROUNDING_OCCLUDED_WINDOWS = "disable-backgrounding-occluded-windows"
+    DISABLE_RENDERER_BACKGROUNDING = "disable-renderer-backgrounding"
+    PROCESS_PER_SITE = "process-per-site"
+    RENDERER_PROCESS_LIMIT = "renderer-process-limit"
+    DISABLE_DEV_SHM_USAGE = "disable-dev-shm-usage"
+    BLINK_SETTINGS = "blink-settings"
+    ENABLE_LOGGING = "enable-logging"
+    VERBOSITY = "v"
 
 
 class ChromeBrowser(BaseBrowser):
@@ -32,6 +50,14 @@ class ChromeBrowser(BaseBrowser):
         browser = ChromeBrowser(
             [(ChromeOptionArguments.HEADLESS, ), (ChromeOptionArguments.WINDOW_SIZE, '640,480')]
         )
+        browser = ChromeBrowser(service=get_shared_driver_service("chrome"))
+        browser = ChromeBrowser(profile=get_launch_profile("ci-fast"))
+
+    The browser starts a chromedriver process of its own, unless given a SharedDriverService, or
+    SHARE_DRIVER_SERVICES is enabled, in which case its session runs on the shared chromedriver
+    process, see browsers/driver_service.py. A launch profile, see browsers/launch_profiles.py,
+    adds its option arguments before options_args. A NetworkProxy, see browsers/network.py,
+    makes the browser send its requests through the proxy.
     """
 
     def __init__(
@@ -39,27 +65,25 @@ class ChromeBrowser(BaseBrowser):
         options_args: Optional[
             List[Tuple[ChromeOptionArguments, Optional[Any]]]
         ] = None,
+        service: Optional[Union[Service, SharedDriverService]] = None,
+        profile: Optional[LaunchProfile] = None,
+        network_proxy: Optional["NetworkProxy"] = None,
     ):
-        options = ChromeOptions()
-        if options_args:
-            # pylint: disable=duplicate-code
-            for arg in options_args:
-                arg_ = (
-                    f"--{arg[0].value}"
-                    if len(arg) == 1
-                    else f"--{arg[0].value}={arg[1]}"
-                )
-                options.add_argument(argument=arg_)
+        options = configure_chromium_options(
+            options=ChromeOptions(),
+            arguments=ChromeOptionArguments,
+            options_args=options_args,
+            profile=profile,
+            network_proxy=network_proxy,
+        )
+        if service is None and SHARE_DRIVER_SERVICES:
+            service = get_shared_driver_service("chrome")
+        if isinstance(service, SharedDriverService):
+            driver = SharedServiceChrome(shared_service=service, options=options)
         else:
-            # By default, only a resolution is set. Can be updated in case other options are needed
-            # to be available by default
-            options.add_argument(
-                f"--{ChromeOptionArguments.WINDOW_SIZE.value}"
-                f"={DEFAULT_WINDOW_WIDTH},{DEFAULT_WINDOW_HEIGHT}"
-            )
-
-        super().__init__(driver=Chrome(options=options))
-        logging.info(
+            driver = Chrome(options=options, service=service)
+        super().__init__(driver=driver, network_proxy=network_proxy)
+        LOGGER.info(
             "Started a Chrome browser with the following options: %s.",
             options._arguments,
         )
@@ -0,0 +1,67 @@
+"""This module contains the building of the options of the Chromium based browsers, i.e. Chrome
+and Edge, which share their command line switches."""
+from enum import Enum
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+
+from browsers.base_browser import DEFAULT_WINDOW_HEIGHT, DEFAULT_WINDOW_WIDTH
+from browsers.launch_profiles import LaunchProfile, chromium_option_arguments
+
+if TYPE_CHECKING:
+    # Only for the annotations, as the proxy's http.server is only imported when it's used
+    from browsers.network import NetworkProxy
+
+
+def configure_chromium_options(
+    options: ChromiumOptions,
+    arguments: Type[Enum],
+    options_args: Optional[List[Tuple[Any, ...]]] = None,
+    profile: Optional[LaunchProfile] = None,
+    network_proxy: Optional["NetworkProxy"] = None,
+) -> ChromiumOptions:
+    """Adds the option arguments, the launch profile's options and the proxy to the options of a
+    Chromium based browser. If neither option arguments nor a profile are given, only the default
+    window size is set.
+
+    Parameters
+    ----------
+    options : ChromiumOptions
+        E.g. ChromeOptions().
+    arguments : Type[Enum]
+        The option arguments enum of the browser, i.e. ChromeOptionArguments or
+        EdgeOptionArguments.
+    options_args : Optional[List[Tuple[Any, ...]]]
+        The option arguments, each an argument of the enum followed by its value, if any.
+    profile : Optional[LaunchProfile]
+        Its arguments come before options_args, hence the ones given explicitly take precedence.
+    network_proxy : Optional[NetworkProxy]
+        The proxy to send the requests through, see browsers/network.py.
+
+    Returns
+    -------
+    ChromiumOptions
+        The options passed.
+    """
+    if profile is not None:
+        options_args = chromium_option_arguments(
+            profile=profile, arguments=arguments
+        ) + list(options_args or [])
+        if profile.page_load_strategy:
+            options.page_load_strategy = profile.page_load_strategy
+    if options_args:
+        for arg in options_args:
+            arg_ = (
+                f"--{arg[0].value}" if len(arg) == 1 else f"--{arg[0].value}={arg[1]}"
+            )
+            options.add_argument(argument=arg_)
+    else:
+        # By default, only a resolution is set. Can be updated in case other options are needed
+        # to be available by default
+        options.add_argument(
+            f"--{arguments.WINDOW_SIZE.value}={DEFAULT_WINDOW_WIDTH},{DEFAULT_WINDOW_HEIGHT}"
+        )
+    if network_proxy is not None:
+        for argument in network_proxy.chromium_arguments():
+            options.add_argument(argument=argument)
+    return options
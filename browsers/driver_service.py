@@ -0,0 +1,270 @@
+"""This module contains an implementation of a driver service, e.g. chromedriver, shared by all
+sessions of a browser type within a process. The sessions are multiplexed over one driver process
+instead of each session starting its own, and their commands are sent over one pool of keep-alive
+connections to it.
+
+Only drivers which serve multiple sessions at once can be shared, i.e. chromedriver and
+msedgedriver, but not geckodriver, which serves a single session.
+"""
+import atexit
+import threading
+from typing import Callable, Dict, Optional
+
+import urllib3
+from selenium.webdriver import Chrome, Edge
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+# The maximum number of idle keep-alive connections to a shared driver service. Should be at
+# least the number of sessions sending commands at the same time, as connections above it are
+# closed after use instead of being kept alive
+DEFAULT_CONNECTION_POOL_SIZE = 8
+
+
+class SharedDriverService:
+    """This class implements a driver service shared by multiple sessions. The driver process is
+    started when the first session is created and restarted if it died, and keeps running, even
+    while no session uses it, until stop is called or the interpreter exits. The sessions send
+    their commands over a pool of up to pool_size keep-alive connections.
+
+    Examples
+    --------
+        service = get_shared_driver_service("chrome", pool_size=16)
+        browser = ChromeBrowser(service=service)
+        pool = BrowserPool(ChromeBrowser, size=16, service=service)
+    """
+
+    def __init__(self, service: Service, pool_size: int = DEFAULT_CONNECTION_POOL_SIZE):
+        if pool_size < 1:
+            raise ValueError("The connection pool size must be at least 1!")
+        self.service = service
+        self.pool_size = pool_size
+        # The number of sessions currently using the service
+        self.sessions = 0
+        # How many times the driver process was started
+        self.starts = 0
+        self._pool_manager: Optional[urllib3.PoolManager] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        # Stable, as it's part of the key of the browser pools created with it, see
+        # get_browser_pool
+        return f"{type(self).__name__}({self.service.path}, url={self.service.service_url})"
+
+    @property
+    def is_running(self) -> bool:
+        """Determines whether the driver process is running.
+
+        Returns
+        -------
+        bool
+        """
+        process = getattr(self.service, "process", None)
+        return process is not None and process.poll() is None
+
+    @property
+    def pool_manager(self) -> urllib3.PoolManager:
+        """Returns the pool of keep-alive connections to the driver, shared by the sessions.
+
+        Returns
+        -------
+        urllib3.PoolManager
+        """
+        with self._lock:
+            if self._pool_manager is None:
+                self._pool_manager = urllib3.PoolManager(
+                    maxsize=self.pool_size, timeout=RemoteConnection.get_timeout()
+                )
+            return self._pool_manager
+
+    def acquire(self) -> str:
+        """Registers a new session of the service, starting the driver process if it's not running.
+
+        Returns
+        -------
+        str
+            The URL of the driver.
+        """
+        with self._lock:
+            if not self.is_running:
+                self.service.start()
+                self.starts += 1
+                LOGGER.info("Started the shared driver service %s.", self)
+            self.sessions += 1
+            return self.service.service_url
+
+    def release(self):
+        """Unregisters a session of the service, e.g. after it quit. The driver process keeps
+        running for later sessions."""
+        with self._lock:
+            self.sessions = max(self.sessions - 1, 0)
+
+    def stop(self):
+        """Stops the driver process and closes the connections to it."""
+        with self._lock:
+            if self.sessions:
+                LOGGER.warning(
+                    "Stopping the shared driver service %s while it's still in use.",
+                    self,
+                )
+            if self._pool_manager is not None:
+                self._pool_manager.clear()
+                self._pool_manager = None
+            if self.is_running:
+                self.service.stop()
+                LOGGER.info("Stopped the shared driver service %s.", self)
+
+
+class PooledRemoteConnection(ChromiumRemoteConnection):
+    """This class implements a connection to a Chromium based driver, which sends the commands over
+    a pool of keep-alive connections shared with other sessions, instead of a pool of its own.
+    """
+
+    def __init__(
+        self,
+        remote_server_addr: str,
+        vendor_prefix: str,
+        browser_name: str,
+        pool_manager: urllib3.PoolManager,
+    ):
+        # Set before the parent's constructor, which gets the pool from _get_connection_manager
+        self._pool_manager = pool_manager
+        # The driver runs locally, hence it's never reached through a proxy
+        super().__init__(
+            remote_server_addr=remote_server_addr,
+            vendor_prefix=vendor_prefix,
+            browser_name=browser_name,
+            keep_alive=True,
+            ignore_proxy=True,
+        )
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        return self._pool_manager
+
+    def close(self):
+        """Leaves the shared pool open for the other sessions, see SharedDriverService.stop."""
+
+
+class _SharedServiceDriver:
+    """This class implements the creation of a Chromium based driver's session with a
+    SharedDriverService, in place of ChromiumDriver's constructor, which starts a driver process
+    of its own, and of the session's quitting, which leaves the driver process running.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    BROWSER_NAME: str = ""
+    VENDOR_PREFIX: str = ""
+
+    def __init__(self, shared_service: SharedDriverService, options: ChromiumOptions):
+        # pylint: disable=super-init-not-called,non-parent-init-called
+        self.vendor_prefix = self.VENDOR_PREFIX
+        self.shared_service = shared_service
+        self.service = shared_service.service
+        self._released = False
+        url = shared_service.acquire()
+        try:
+            WebDriver.__init__(
+                self,
+                command_executor=PooledRemoteConnection(
+                    remote_server_addr=url,
+                    vendor_prefix=self.VENDOR_PREFIX,
+                    browser_name=self.BROWSER_NAME,
+                    pool_manager=shared_service.pool_manager,
+                ),
+                options=options,
+            )
+        except Exception:
+            self._release()
+            raise
+        self._is_remote = False
+
+    def _release(self):
+        if not self._released:
+            self._released = True
+            self.shared_service.release()
+
+    def quit(self):
+        """Quits the session and closes all associated windows, leaving the driver process
+        running."""
+        try:
+            WebDriver.quit(self)
+        finally:
+            self._release()
+
+
+class SharedServiceChrome(_SharedServiceDriver, Chrome):
+    """This class implements a Chrome driver whose session runs on a SharedDriverService."""
+
+    BROWSER_NAME = DesiredCapabilities.CHROME["browserName"]
+    VENDOR_PREFIX = "goog"
+
+
+class SharedServiceEdge(_SharedServiceDriver, Edge):
+    """This class implements an Edge driver whose session runs on a SharedDriverService."""
+
+    BROWSER_NAME = DesiredCapabilities.EDGE["browserName"]
+    VENDOR_PREFIX = "ms"
+
+
+# The default driver service of each browser type which can be shared
+SHAREABLE_SERVICES: Dict[str, Callable[[], Service]] = {
+    "chrome": ChromeService,
+    "edge": EdgeService,
+}
+_SHARED_SERVICES: Dict[str, SharedDriverService] = {}
+_SHARED_SERVICES_LOCK = threading.Lock()
+
+
+def get_shared_driver_service(
+    browser_name: str, pool_size: int = DEFAULT_CONNECTION_POOL_SIZE
+) -> SharedDriverService:
+    """Returns the process-wide shared driver service of the given browser type, creating it with
+    the browser type's default driver on first use. The pool_size is only applied when the service
+    is created.
+
+    Parameters
+    ----------
+    browser_name : str
+        One of SHAREABLE_SERVICES, i.e. "chrome" or "edge".
+    pool_size : int
+        Defaults to DEFAULT_CONNECTION_POOL_SIZE.
+
+    Returns
+    -------
+    SharedDriverService
+    """
+    if browser_name not in SHAREABLE_SERVICES:
+        raise ValueError(
+            f"The driver service of {browser_name} can't be shared! Shareable ones: "
+            f"{', '.join(sorted(SHAREABLE_SERVICES))}"
+        )
+    with _SHARED_SERVICES_LOCK:
+        if not _SHARED_SERVICES:
+            # Registered on first use rather than on import, so that it runs before the exit
+            # handlers registered earlier, e.g. the one closing the browser pools, whose sessions
+            # need the services until they quit
+            atexit.register(stop_shared_driver_services)
+        if browser_name not in _SHARED_SERVICES:
+            _SHARED_SERVICES[browser_name] = SharedDriverService(
+                service=SHAREABLE_SERVICES[browser_name](), pool_size=pool_size
+            )
+        return _SHARED_SERVICES[browser_name]
+
+
+def stop_shared_driver_services():
+    """Stops all driver services created with get_shared_driver_service."""
+    with _SHARED_SERVICES_LOCK:
+        services = list(_SHARED_SERVICES.values())
+        _SHARED_SERVICES.clear()
+    for service in services:
+        service.stop()
@@ -1,14 +1,26 @@
 """This module contains an implementation of an Edge browser."""
-import logging
 from enum import Enum
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from selenium.webdriver import Edge, EdgeOptions
+from selenium.webdriver.edge.service import Service
 
 from browsers.base_browser import BaseBrowser
-from settings import LOGGING_LEVEL
+from browsers.chromium_options import configure_chromium_options
+from browsers.driver_service import (
+    SharedDriverService,
+    SharedServiceEdge,
+    get_shared_driver_service,
+)
+from browsers.launch_profiles import LaunchProfile
+from logger import get_logger
+from settings import SHARE_DRIVER_SERVICES
 
-logging.basicConfig(level=LOGGING_LEVEL)
+if TYPE_CHECKING:
+    # Only for the annotations, as the proxy's http.server is only imported when it's used
+    from browsers.network import NetworkProxy
+
+LOGGER = get_logger(__name__)
 
 
 class EdgeOptionArguments(Enum):
@@ -18,31 +30,57 @@ class EdgeOptionArguments(Enum):
     --------
         browser = EdgeBrowser()
         browser = EdgeBrowser(options_args=[(EdgeOptionArguments.HEADLESS, )])
+        browser = EdgeBrowser(options_args=[(EdgeOptionArguments.WINDOW_SIZE, '640,480')])
     """
 
-    # TODO: Find out and add the window size argument values
+    # pylint: disable=duplicate-code
+    # Edge is Chromium based, hence its arguments are the same as Chrome's
+    WINDOW_SIZE = "window-size"
     HEADLESS = "headless"
+    DISABLE_EXTENSIONS = "disable-extensions"
+    DISABLE_BACKGROUND_TIMER_THROTTLING = "disable-background-timer-throttling"
+    DISABLE_BACKGROUNDING_OCCLUDED_WINDOWS = "disable-backgrounding-occluded-windows"
+    DISABLE_RENDERER_BACKGROUNDING = "disable-renderer-backgrounding"
+    PROCESS_PER_SITE = "process-per-site"
+    RENDERER_PROCESS_LIMIT = "renderer-process-limit"
+    DISABLE_DEV_SHM_USAGE = "disable-dev-shm-usage"
+    BLINK_SETTINGS = "blink-settings"
+    ENABLE_LOGGING = "enable-logging"
+    VERBOSITY = "v"
 
 
 class EdgeBrowser(BaseBrowser):
-    """This class implements a Microsoft Edge browser."""
+    """This class implements a Microsoft Edge browser.
+
+    The browser starts an msedgedriver process of its own, unless given a SharedDriverService, or
+    SHARE_DRIVER_SERVICES is enabled, in which case its session runs on the shared msedgedriver
+    process, see browsers/driver_service.py. A launch profile, see browsers/launch_profiles.py,
+    adds its option arguments before options_args. A NetworkProxy, see browsers/network.py,
+    makes the browser send its requests through the proxy.
+    """
 
     def __init__(
         self,
         options_args: Optional[List[Tuple[EdgeOptionArguments, Optional[Any]]]] = None,
+        service: Optional[Union[Service, SharedDriverService]] = None,
+        profile: Optional[LaunchProfile] = None,
+        network_proxy: Optional["NetworkProxy"] = None,
     ):
-        options = EdgeOptions()
-        if options_args:
-            for arg in options_args:
-                # TODO: add proper formatting of options with values as currently I can't find an
-                #  example of an option argument with value, i.e. window size, for Edge
-                options.add_argument(argument=arg[0].value)
+        options = configure_chromium_options(
+            options=EdgeOptions(),
+            arguments=EdgeOptionArguments,
+            options_args=options_args,
+            profile=profile,
+            network_proxy=network_proxy,
+        )
+        if service is None and SHARE_DRIVER_SERVICES:
+            service = get_shared_driver_service("edge")
+        if isinstance(service, SharedDriverService):
+            driver = SharedServiceEdge(shared_service=service, options=options)
         else:
-            # TODO: add default resolution arguments
-            pass
-
-        super().__init__(driver=Edge(options=options))
-        logging.info(
+            driver = Edge(options=options, service=service)
+        super().__init__(driver=driver, network_proxy=network_proxy)
+        LOGGER.info(
             "Started an Edge browser with the following options: %s.",
             options._arguments,
         )
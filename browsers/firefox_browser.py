@@ -1,17 +1,23 @@
 """This module contains an implementation of a Firefox browser."""
-import logging
 from enum import Enum
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from selenium.webdriver import Firefox, FirefoxOptions
+from selenium.webdriver.firefox.service import Service
 
 from browsers.base_browser import (
     DEFAULT_WINDOW_HEIGHT,
     DEFAULT_WINDOW_WIDTH,
     BaseBrowser,
 )
+from browsers.launch_profiles import LaunchProfile
+from logger import get_logger
 
-logging.basicConfig(level=logging.DEBUG)
+if TYPE_CHECKING:
+    # Only for the annotations, as the proxy's http.server is only imported when it's used
+    from browsers.network import NetworkProxy
+
+LOGGER = get_logger(__name__)
 
 
 class FirefoxOptionArguments(Enum):
@@ -34,16 +40,73 @@ class FirefoxOptionArguments(Enum):
     HEADLESS = "headless"
 
 
+def _profile_option_arguments(
+    profile: LaunchProfile,
+) -> List[Tuple[FirefoxOptionArguments, Optional[Any]]]:
+    """Translates the options of a launch profile which are command line arguments for Firefox."""
+    options_args: List[Tuple[FirefoxOptionArguments, Optional[Any]]] = []
+    if profile.headless:
+        options_args.append((FirefoxOptionArguments.HEADLESS,))
+    if profile.window_size:
+        options_args.extend(
+            [
+                (FirefoxOptionArguments.WIDTH, profile.window_size[0]),
+                (FirefoxOptionArguments.HEIGHT, profile.window_size[1]),
+            ]
+        )
+    return options_args
+
+
+def _profile_preferences(profile: LaunchProfile) -> Dict[str, Any]:
+    """Translates the options of a launch profile which are preferences for Firefox. Firefox has
+    no equivalent of reduce_shared_memory, hence it's ignored."""
+    preferences: Dict[str, Any] = {}
+    if profile.disable_extensions:
+        # No scope, e.g. the profile or the application, to load extensions from
+        preferences["extensions.enabledScopes"] = 0
+    if profile.disable_background_throttling:
+        preferences["dom.min_background_timeout_value"] = 4
+        preferences["dom.timeout.enable_budget_timer_throttling"] = False
+    if profile.renderer_process_limit:
+        preferences["dom.ipc.processCount"] = profile.renderer_process_limit
+        preferences["dom.ipc.processCount.webIsolated"] = profile.renderer_process_limit
+    if profile.load_images is False:
+        # Blocks images for all sites
+        preferences["permissions.default.image"] = 2
+    return preferences
+
+
 class FirefoxBrowser(BaseBrowser):
-    """This class implements a Firefox browser."""
+    """This class implements a Firefox browser.
+
+    Each browser starts a geckodriver process of its own, as geckodriver serves a single session,
+    hence its driver service can't be shared, see browsers/driver_service.py. A launch profile,
+    see browsers/launch_profiles.py, adds its option arguments before options_args and sets its
+    preferences. A NetworkProxy, see browsers/network.py, makes the browser send its requests
+    through the proxy, which is the only way to block requests in Firefox.
+    """
 
     def __init__(
         self,
         options_args: Optional[
             List[Tuple[FirefoxOptionArguments, Optional[Any]]]
         ] = None,
+        service: Optional[Service] = None,
+        profile: Optional[LaunchProfile] = None,
+        network_proxy: Optional["NetworkProxy"] = None,
     ):
         options = FirefoxOptions()
+        if profile is not None:
+            # The arguments given explicitly come last, hence they take precedence
+            options_args = _profile_option_arguments(profile=profile) + list(
+                options_args or []
+            )
+            for name, value in _profile_preferences(profile=profile).items():
+                options.set_preference(name, value)
+            if profile.page_load_strategy:
+                options.page_load_strategy = profile.page_load_strategy
+            if profile.verbose_logging:
+                options.log.level = "trace"
         if options_args:
             for arg in options_args:
                 arg_ = (
@@ -62,8 +125,15 @@ class FirefoxBrowser(BaseBrowser):
                 ]
             )
 
-        super().__init__(driver=Firefox(options=options))
-        logging.info(
+        if network_proxy is not None:
+            for name, value in network_proxy.firefox_preferences().items():
+                options.set_preference(name, value)
+
+        super().__init__(
+            driver=Firefox(options=options, service=service),
+            network_proxy=network_proxy,
+        )
+        LOGGER.info(
             "Started a Firefox browser with the following options: %s.",
             options._arguments,
         )
@@ -0,0 +1,255 @@
+"""This module contains an implementation of launch profiles, i.e. named sets of browser options
+which trade features of the browser for startup time, memory or debuggability, applied the same
+way by every browser.
+
+Examples
+--------
+    browser = ChromeBrowser(profile=get_launch_profile("ci-fast"))
+    browser = FirefoxBrowser(profile=get_launch_profile("ci-fast+low-memory"))
+    profile = LAUNCH_PROFILES["ci-fast"].combine(LaunchProfile(page_load_strategy="normal"))
+"""
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from browsers.base_browser import DEFAULT_WINDOW_HEIGHT, DEFAULT_WINDOW_WIDTH
+
+# The page load strategies of the WebDriver specification. "eager" returns from navigation once
+# the DOM is ready, without waiting for images and stylesheets, "none" as soon as it started
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+# Separates the names of the profiles to combine, e.g. "ci-fast+low-memory"
+PROFILE_SEPARATOR = "+"
+
+
+class LaunchProfile:
+    """This class implements a set of browser options, described independently of the browser.
+    Each browser translates the options into its own arguments and preferences, see
+    chromium_option_arguments and FirefoxBrowser. The options which are None are left to the
+    browser's defaults.
+
+    Parameters
+    ----------
+    name : str
+        Defaults to "custom".
+    headless : Optional[bool]
+        Runs the browser without a window.
+    window_size : Optional[Tuple[int, int]]
+        The width and height of the window.
+    disable_extensions : Optional[bool]
+        Doesn't load extensions.
+    disable_background_throttling : Optional[bool]
+        Keeps the timers and rendering of background and occluded pages running at full speed.
+    renderer_process_limit : Optional[int]
+        The maximum number of renderer (content) processes. Pages of the same site share one.
+    reduce_shared_memory : Optional[bool]
+        Keeps the browser's shared memory in /tmp instead of /dev/shm, which is small in
+        containers, e.g. 64MB in Docker by default. Chromium based browsers only, as Firefox has
+        no equivalent.
+    load_images : Optional[bool]
+        Whether images are loaded.
+    page_load_strategy : Optional[str]
+        One of PAGE_LOAD_STRATEGIES.
+    verbose_logging : Optional[bool]
+        Makes the browser log verbosely.
+
+    Examples
+    --------
+        LaunchProfile(name="fast-headless", headless=True, page_load_strategy="eager")
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        name: str = "custom",
+        headless: Optional[bool] = None,
+        window_size: Optional[Tuple[int, int]] = None,
+        disable_extensions: Optional[bool] = None,
+        disable_background_throttling: Optional[bool] = None,
+        renderer_process_limit: Optional[int] = None,
+        reduce_shared_memory: Optional[bool] = None,
+        load_images: Optional[bool] = None,
+        page_load_strategy: Optional[str] = None,
+        verbose_logging: Optional[bool] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        if window_size is not None and (len(window_size) != 2 or min(window_size) < 1):
+            raise ValueError(
+                f"The window size must be a positive width and height, got: {window_size}"
+            )
+        if renderer_process_limit is not None and renderer_process_limit < 1:
+            raise ValueError(
+                f"The renderer process limit must be at least 1, got: {renderer_process_limit}"
+            )
+        if (
+            page_load_strategy is not None
+            and page_load_strategy not in PAGE_LOAD_STRATEGIES
+        ):
+            raise ValueError(
+                f"The page load strategy must be one of {', '.join(PAGE_LOAD_STRATEGIES)}, "
+                f"got: {page_load_strategy}"
+            )
+        self.name = name
+        self.headless = headless
+        self.window_size = tuple(window_size) if window_size is not None else None
+        self.disable_extensions = disable_extensions
+        self.disable_background_throttling = disable_background_throttling
+        self.renderer_process_limit = renderer_process_limit
+        self.reduce_shared_memory = reduce_shared_memory
+        self.load_images = load_images
+        self.page_load_strategy = page_load_strategy
+        self.verbose_logging = verbose_logging
+
+    def __repr__(self) -> str:
+        options = ", ".join(
+            f"{name}={value!r}" for name, value in self.options().items()
+        )
+        return f"{type(self).__name__}(name={self.name!r}, {options})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LaunchProfile) and vars(self) == vars(other)
+
+    def __hash__(self) -> int:
+        return hash(repr(self))
+
+    def options(self) -> Dict[str, Any]:
+        """Returns the options which are set, i.e. not None.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name != "name" and value is not None
+        }
+
+    def combine(self, *profiles: "LaunchProfile") -> "LaunchProfile":
+        """Returns a profile with the options of this profile, overridden by the options which are
+        set in each of profiles in turn.
+
+        Parameters
+        ----------
+        profiles : LaunchProfile
+
+        Returns
+        -------
+        LaunchProfile
+        """
+        options = self.options()
+        for profile in profiles:
+            options.update(profile.options())
+        name = PROFILE_SEPARATOR.join(
+            [self.name] + [profile.name for profile in profiles]
+        )
+        return LaunchProfile(name=name, **options)
+
+
+LAUNCH_PROFILES: Dict[str, LaunchProfile] = {
+    # Starts and navigates as fast as possible, for CI runs
+    "ci-fast": LaunchProfile(
+        name="ci-fast",
+        headless=True,
+        window_size=(DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT),
+        disable_extensions=True,
+        disable_background_throttling=True,
+        load_images=False,
+        page_load_strategy="eager",
+    ),
+    # Fits as many sessions as possible on a node
+    "low-memory": LaunchProfile(
+        name="low-memory",
+        headless=True,
+        disable_extensions=True,
+        renderer_process_limit=2,
+        reduce_shared_memory=True,
+        load_images=False,
+    ),
+    # A visible browser which loads pages fully and logs verbosely, for debugging tests locally
+    "debug": LaunchProfile(
+        name="debug",
+        headless=False,
+        window_size=(DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT),
+        load_images=True,
+        page_load_strategy="normal",
+        verbose_logging=True,
+    ),
+}
+
+
+def get_launch_profile(name: str) -> LaunchProfile:
+    """Returns the launch profile of LAUNCH_PROFILES with the given name, or the combination of the
+    profiles separated by PROFILE_SEPARATOR, later ones overriding earlier ones.
+
+    Parameters
+    ----------
+    name : str
+        E.g. "ci-fast" or "ci-fast+low-memory".
+
+    Returns
+    -------
+    LaunchProfile
+    """
+    names = name.split(PROFILE_SEPARATOR)
+    unknown = [name_ for name_ in names if name_ not in LAUNCH_PROFILES]
+    if unknown:
+        raise ValueError(
+            f"Unknown launch profiles: {', '.join(unknown)}! Available ones: "
+            f"{', '.join(sorted(LAUNCH_PROFILES))}"
+        )
+    first, *others = [LAUNCH_PROFILES[name_] for name_ in names]
+    return first.combine(*others) if others else first
+
+
+def chromium_option_arguments(
+    profile: LaunchProfile, arguments: Type[Enum]
+) -> List[Tuple[Any, ...]]:
+    """Translates a launch profile into the option arguments of a Chromium based browser, i.e.
+    Chrome or Edge, which share their command line switches.
+
+    Parameters
+    ----------
+    profile : LaunchProfile
+    arguments : Type[Enum]
+        The option arguments enum of the browser, i.e. ChromeOptionArguments or
+        EdgeOptionArguments.
+
+    Returns
+    -------
+    List[Tuple[Any, ...]]
+        The option arguments, in the format of the browsers' options_args.
+    """
+    options_args: List[Tuple[Any, ...]] = []
+    if profile.headless:
+        options_args.append((arguments.HEADLESS,))
+    if profile.window_size:
+        options_args.append(
+            (
+                arguments.WINDOW_SIZE,
+                f"{profile.window_size[0]},{profile.window_size[1]}",
+            )
+        )
+    if profile.disable_extensions:
+        options_args.append((arguments.DISABLE_EXTENSIONS,))
+    if profile.disable_background_throttling:
+        options_args.extend(
+            [
+                (arguments.DISABLE_BACKGROUND_TIMER_THROTTLING,),
+                (arguments.DISABLE_BACKGROUNDING_OCCLUDED_WINDOWS,),
+                (arguments.DISABLE_RENDERER_BACKGROUNDING,),
+            ]
+        )
+    if profile.renderer_process_limit:
+        options_args.extend(
+            [
+                (arguments.PROCESS_PER_SITE,),
+                (arguments.RENDERER_PROCESS_LIMIT, profile.renderer_process_limit),
+            ]
+        )
+    if profile.reduce_shared_memory:
+        options_args.append((arguments.DISABLE_DEV_SHM_USAGE,))
+    if profile.load_images is False:
+        options_args.append((arguments.BLINK_SETTINGS, "imagesEnabled=false"))
+    if profile.verbose_logging:
+        options_args.extend([(arguments.ENABLE_LOGGING,), (arguments.VERBOSITY, 1)])
+    return options_args
@@ -0,0 +1,696 @@
+"""This module contains an implementation of the control of the network requests of the browsers,
+e.g. to block analytics, fonts, images and third-party widgets which tests never assert on, so that
+pages load faster.
+
+Chromium based browsers block requests through the DevTools protocol, see
+BaseBrowser.block_requests. Any browser can instead be launched with a NetworkProxy, a local HTTP
+proxy which blocks requests, serves static assets from a cache of its own and reports how many
+bytes and how much time that saved. Responses which set cookies are not cached, and the ones
+which are not cached are relayed as they arrive, so that e.g. server-sent events work. HTTPS
+requests are tunnelled through the proxy encrypted, hence they can only be blocked by host, and
+are neither typed nor cached.
+
+Examples
+--------
+    rules = NetworkRules(block_urls=["*google-analytics.com*"], block_resource_types=["Font"])
+    with NetworkProxy(rules=rules) as proxy:
+        browser = ChromeBrowser(network_proxy=proxy)
+        browser.open_url("http://localhost:8000")
+        print(proxy.stats.as_dict())
+"""
+import http.client
+import re
+import selectors
+import socket
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+# The resource types of requests, named as in the DevTools protocol
+RESOURCE_TYPES = (
+    "Document",
+    "Stylesheet",
+    "Image",
+    "Media",
+    "Font",
+    "Script",
+    "XHR",
+    "Fetch",
+    "Other",
+)
+# The resource types which are static assets, cached by default
+STATIC_RESOURCE_TYPES = ("Stylesheet", "Image", "Media", "Font", "Script")
+# The file extensions of each resource type, used to tell the type of a request by its URL
+RESOURCE_TYPE_EXTENSIONS = {
+    "Stylesheet": ("css",),
+    "Image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "Media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+    "Font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "Script": ("js", "mjs"),
+}
+# The resource type of each value of the Sec-Fetch-Dest request header
+FETCH_DESTINATION_RESOURCE_TYPES = {
+    "document": "Document",
+    "iframe": "Document",
+    "frame": "Document",
+    "style": "Stylesheet",
+    "image": "Image",
+    "audio": "Media",
+    "video": "Media",
+    "track": "Media",
+    "font": "Font",
+    "script": "Script",
+    "worker": "Script",
+    "sharedworker": "Script",
+    "serviceworker": "Script",
+    "empty": "Fetch",
+}
+# The headers which only apply to a single connection, hence are not forwarded by the proxy
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+# The maximum total size of the responses cached by a NetworkProxy
+DEFAULT_CACHE_SIZE = 64 * 2**20  # bytes
+DEFAULT_UPSTREAM_TIMEOUT = 30  # seconds
+# The rough size of a response of each resource type, used to estimate the bytes saved by blocking
+# requests of a type until the proxy has fetched responses of it
+ESTIMATED_RESPONSE_SIZES = {
+    "Document": 30 * 2**10,
+    "Stylesheet": 20 * 2**10,
+    "Image": 30 * 2**10,
+    "Media": 500 * 2**10,
+    "Font": 40 * 2**10,
+    "Script": 50 * 2**10,
+    "XHR": 5 * 2**10,
+    "Fetch": 5 * 2**10,
+    "Other": 10 * 2**10,
+}  # bytes
+# The request headers which make a response specific to the browser which sent the request
+PRIVATE_REQUEST_HEADERS = ("Cookie", "Authorization")
+# The Cache-Control directives of responses which must not be served from a shared cache
+UNSHAREABLE_CACHE_DIRECTIVES = {"no-store", "no-cache", "private"}
+# The statuses of responses which never have a body
+NO_BODY_STATUSES = (204, 304)
+# The maximum size of the pieces of the responses which are not cached, relayed as they arrive
+STREAM_CHUNK_SIZE = 64 * 2**10  # bytes
+
+
+def _pattern_to_regex(pattern: str) -> "re.Pattern[str]":
+    """Compiles a URL pattern, in which "*" matches any characters, like the DevTools protocol's
+    blocked URL patterns."""
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")))
+
+
+def resource_type_of(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    """Tells the resource type of a request by its Sec-Fetch-Dest header, if sent, or else by the
+    file extension of its URL, or else by its Accept header.
+
+    Parameters
+    ----------
+    url : str
+    headers : Optional[Dict[str, str]]
+        The request's headers, with lowercase names.
+
+    Returns
+    -------
+    str
+        One of RESOURCE_TYPES.
+    """
+    headers = headers or {}
+    destination = headers.get("sec-fetch-dest")
+    if destination in FETCH_DESTINATION_RESOURCE_TYPES:
+        return FETCH_DESTINATION_RESOURCE_TYPES[destination]
+    path = urlsplit(url).path.lower()
+    extension = path.rsplit(".", 1)[-1] if "." in path.rsplit("/", 1)[-1] else ""
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items():
+        if extension in extensions:
+            return resource_type
+    accept = headers.get("accept", "")
+    if accept.startswith("text/html"):
+        return "Document"
+    if accept.startswith("text/css"):
+        return "Stylesheet"
+    if accept.startswith("image/"):
+        return "Image"
+    return "Other"
+
+
+class NetworkRules:
+    """This class implements the rules of which requests are blocked and which responses are
+    cached.
+
+    Parameters
+    ----------
+    block_urls : Sequence[str]
+        The patterns of the URLs to block, in which "*" matches any characters, e.g.
+        "*google-analytics.com*" or "*.woff2".
+    block_resource_types : Sequence[str]
+        The resource types to block, see RESOURCE_TYPES.
+    cache_resource_types : Sequence[str]
+        The resource types whose responses a NetworkProxy caches. Defaults to
+        STATIC_RESOURCE_TYPES.
+    cache_urls : Sequence[str]
+        The patterns of other URLs whose responses a NetworkProxy caches.
+
+    Examples
+    --------
+        NetworkRules(block_urls=["*doubleclick.net*"], block_resource_types=["Image", "Font"])
+    """
+
+    def __init__(
+        self,
+        block_urls: Sequence[str] = (),
+        block_resource_types: Sequence[str] = (),
+        cache_resource_types: Sequence[str] = STATIC_RESOURCE_TYPES,
+        cache_urls: Sequence[str] = (),
+    ):
+        unknown = (set(block_resource_types) | set(cache_resource_types)) - set(
+            RESOURCE_TYPES
+        )
+        if unknown:
+            raise ValueError(
+                f"Unknown resource types: {', '.join(sorted(unknown))}! Available ones: "
+                f"{', '.join(RESOURCE_TYPES)}"
+            )
+        self.block_urls = tuple(block_urls)
+        self.block_resource_types = tuple(block_resource_types)
+        self.cache_resource_types = tuple(cache_resource_types)
+        self.cache_urls = tuple(cache_urls)
+        self._block_regexes = [_pattern_to_regex(pattern) for pattern in block_urls]
+        self._cache_regexes = [_pattern_to_regex(pattern) for pattern in cache_urls]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(block_urls={self.block_urls}, "
+            f"block_resource_types={self.block_resource_types}, "
+            f"cache_resource_types={self.cache_resource_types}, cache_urls={self.cache_urls})"
+        )
+
+    def is_blocked(self, url: str, resource_type: str) -> bool:
+        """Determines whether a request is blocked.
+
+        Returns
+        -------
+        bool
+        """
+        return resource_type in self.block_resource_types or any(
+            regex.fullmatch(url) for regex in self._block_regexes
+        )
+
+    def is_host_blocked(self, host: str) -> bool:
+        """Determines whether all HTTPS requests to a host are blocked, i.e. whether a pattern
+        matches the root URL of the host. Used for the requests tunnelled through a proxy, whose
+        URL is unknown.
+
+        Returns
+        -------
+        bool
+        """
+        url = f"https://{host}/"
+        return any(regex.fullmatch(url) for regex in self._block_regexes)
+
+    def is_cached(self, url: str, resource_type: str) -> bool:
+        """Determines whether the response to a request is cached.
+
+        Returns
+        -------
+        bool
+        """
+        return resource_type in self.cache_resource_types or any(
+            regex.fullmatch(url) for regex in self._cache_regexes
+        )
+
+    def blocked_url_patterns(self) -> List[str]:
+        """Returns the patterns of the blocked URLs, including the patterns of the file extensions
+        of the blocked resource types, for blocking by URL only, e.g. through the DevTools
+        protocol.
+
+        Returns
+        -------
+        List[str]
+        """
+        patterns = list(self.block_urls)
+        for resource_type in self.block_resource_types:
+            for extension in RESOURCE_TYPE_EXTENSIONS.get(resource_type, ()):
+                patterns.extend([f"*.{extension}", f"*.{extension}?*"])
+        return patterns
+
+
+class NetworkStats:
+    """This class contains the counters of a NetworkProxy. The bytes and time saved are those of
+    the responses served from the cache, i.e. the size of the response and how long it took to
+    fetch it originally, plus the bytes saved by blocking requests. The size of a blocked response
+    is unknown, as it's never fetched, hence it's estimated as the average size of the responses of
+    its resource type the proxy fetched, or ESTIMATED_RESPONSE_SIZES if it fetched none. The
+    estimated part of bytes_saved is also counted on its own, as blocked_bytes_saved."""
+
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked_requests = 0
+        self.blocked_tunnels = 0
+        self.tunnels = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_fetched = 0
+        self.bytes_saved = 0
+        self.blocked_bytes_saved = 0
+        self.time_saved = 0.0  # seconds
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the counters as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        counters = dict(vars(self))
+        counters["blocked_by_type"] = dict(self.blocked_by_type)
+        return counters
+
+
+class CachedResponse(NamedTuple):
+    """A response cached by a NetworkProxy."""
+
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    fetch_time: float  # seconds
+
+
+class ResponseCache:
+    """This class implements a cache of responses, keyed by URL, of up to max_size bytes in total,
+    evicting the least recently used ones first."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._responses: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Returns the cached response of url, if any.
+
+        Returns
+        -------
+        Optional[CachedResponse]
+        """
+        with self._lock:
+            response = self._responses.get(url)
+            if response is not None:
+                self._responses.move_to_end(url)
+            return response
+
+    def put(self, url: str, response: CachedResponse):
+        """Caches the response of url, unless it's larger than the cache."""
+        if len(response.body) > self.max_size:
+            return
+        with self._lock:
+            previous = self._responses.pop(url, None)
+            if previous is not None:
+                self.size -= len(previous.body)
+            self._responses[url] = response
+            self.size += len(response.body)
+            while self.size > self.max_size:
+                _, evicted = self._responses.popitem(last=False)
+                self.size -= len(evicted.body)
+
+    def clear(self):
+        """Removes all cached responses."""
+        with self._lock:
+            self._responses.clear()
+            self.size = 0
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests of the browser to a NetworkProxy."""
+
+    protocol_version = "HTTP/1.1"
+    # The status of the responses to blocked requests
+    BLOCKED_STATUS = 204
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        # Requests are counted in the proxy's stats instead of being logged
+        pass
+
+    @property
+    def proxy(self) -> "NetworkProxy":
+        """The proxy the request was sent to."""
+        return self.server.proxy  # type: ignore[attr-defined]
+
+    def _send(self, status: int, headers: List[Tuple[str, str]], body: bytes):
+        self.send_response(status)
+        for name, value in headers:
+            if (
+                name.lower() not in HOP_BY_HOP_HEADERS
+                and name.lower() != "content-length"
+            ):
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _request_upstream(
+        self, url: str, body: Optional[bytes]
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Sends the request to the server url points at and returns the connection and the
+        response, whose body is yet to be read."""
+        parts = urlsplit(url)
+        connection_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        connection = connection_cls(
+            parts.hostname, parts.port, timeout=self.proxy.upstream_timeout
+        )
+        headers = {
+            name: value
+            for name, value in self.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        try:
+            connection.request(self.command, path, body=body, headers=headers)
+            return connection, connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    def _stream(self, response: http.client.HTTPResponse) -> int:
+        """Relays the response to the browser as its body arrives, e.g. server-sent events or a
+        long poll, and returns the size of the body.
+
+        Returns
+        -------
+        int
+        """
+        self.send_response(response.status)
+        for name, value in response.getheaders():
+            if name.lower() not in HOP_BY_HOP_HEADERS:
+                self.send_header(name, value)
+        has_body = self.command != "HEAD" and response.status not in NO_BODY_STATUSES
+        # A body of unknown length is relayed in chunks, keeping the connection to the browser
+        chunked = has_body and response.getheader("Content-Length") is None
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        size = 0
+        while has_body:
+            data = response.read1(STREAM_CHUNK_SIZE)
+            size += len(data)
+            if chunked:
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            else:
+                self.wfile.write(data)
+            if not data:
+                break
+        return size
+
+    def _handle(self):
+        proxy = self.proxy
+        url = self.path
+        # Read even if the request is blocked, so that the next request on the connection is
+        # read from its start
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        if not urlsplit(url).hostname:
+            # Not a proxy request, whose target is an absolute URL
+            self._send(400, [], b"")
+            return
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        resource_type = resource_type_of(url=url, headers=headers)
+        rules = proxy.rules
+        with proxy.lock:
+            proxy.stats.requests += 1
+        if rules.is_blocked(url=url, resource_type=resource_type):
+            size = proxy.estimated_response_size(resource_type=resource_type)
+            with proxy.lock:
+                proxy.stats.blocked_requests += 1
+                proxy.stats.bytes_saved += size
+                proxy.stats.blocked_bytes_saved += size
+                proxy.stats.blocked_by_type[resource_type] = (
+                    proxy.stats.blocked_by_type.get(resource_type, 0) + 1
+                )
+            self._send(self.BLOCKED_STATUS, [], b"")
+            return
+
+        cacheable = self.command == "GET" and rules.is_cached(
+            url=url, resource_type=resource_type
+        )
+        cached = proxy.cache.get(url) if cacheable else None
+        if cached is not None:
+            with proxy.lock:
+                proxy.stats.cache_hits += 1
+                proxy.stats.bytes_saved += len(cached.body)
+                proxy.stats.time_saved += cached.fetch_time
+            self._send(cached.status, cached.headers, cached.body)
+            return
+        self._forward(
+            url=url, body=body, resource_type=resource_type, cacheable=cacheable
+        )
+
+    def _is_shareable(self, response: http.client.HTTPResponse) -> bool:
+        """Determines whether the response can be served to all browsers using the proxy, i.e.
+        it's neither specific to the browser which requested it, e.g. by its cookies, nor may it
+        differ between requests, as the cache is keyed by URL only."""
+        if any(name in self.headers for name in PRIVATE_REQUEST_HEADERS):
+            return False
+        directives = {
+            directive.split("=")[0].strip()
+            for directive in (response.getheader("Cache-Control") or "")
+            .lower()
+            .split(",")
+        }
+        return (
+            not directives & UNSHAREABLE_CACHE_DIRECTIVES
+            and response.getheader("Set-Cookie") is None
+            and response.getheader("Vary") is None
+        )
+
+    def _forward(
+        self, url: str, body: Optional[bytes], resource_type: str, cacheable: bool
+    ):
+        """Forwards the request upstream and relays the response to the browser, caching it if
+        it's cacheable and shareable, see _is_shareable."""
+        proxy = self.proxy
+        start = time.perf_counter()
+        try:
+            connection, response = self._request_upstream(url=url, body=body)
+        except OSError as exc:
+            LOGGER.warning("The proxy could not fetch %s: %s", url, exc)
+            self._send(502, [], b"")
+            return
+        if cacheable:
+            with proxy.lock:
+                proxy.stats.cache_misses += 1
+        stored = cacheable and response.status == 200 and self._is_shareable(response)
+        try:
+            if stored:
+                cached = CachedResponse(
+                    status=response.status,
+                    headers=response.getheaders(),
+                    body=response.read(),
+                    fetch_time=time.perf_counter() - start,
+                )
+                size = len(cached.body)
+                proxy.cache.put(url, cached)
+                self._send(cached.status, cached.headers, cached.body)
+            else:
+                size = self._stream(response=response)
+        except OSError as exc:
+            # The response may have been partly sent already, hence the connection is dropped
+            LOGGER.warning("The proxy could not relay %s: %s", url, exc)
+            self.close_connection = True
+            return
+        finally:
+            connection.close()
+        with proxy.lock:
+            proxy.stats.bytes_fetched += size
+        proxy.record_response_size(resource_type=resource_type, size=size)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _handle
+
+    def do_CONNECT(self):  # pylint: disable=invalid-name
+        """Tunnels an HTTPS connection to the host, unless it's blocked."""
+        proxy = self.proxy
+        host, _, port = self.path.rpartition(":")
+        if proxy.rules.is_host_blocked(host=host):
+            with proxy.lock:
+                proxy.stats.blocked_tunnels += 1
+            self._send(403, [], b"")
+            return
+        try:
+            upstream = socket.create_connection(
+                (host, int(port)), timeout=proxy.upstream_timeout
+            )
+        except OSError:
+            self._send(502, [], b"")
+            return
+        with proxy.lock:
+            proxy.stats.tunnels += 1
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        self.close_connection = True
+        self._relay(upstream=upstream)
+
+    def _relay(self, upstream: socket.socket):
+        """Relays the bytes between the browser and the host until either closes the connection."""
+        with upstream, selectors.DefaultSelector() as selector:
+            selector.register(self.connection, selectors.EVENT_READ, upstream)
+            selector.register(upstream, selectors.EVENT_READ, self.connection)
+            while True:
+                for key, _ in selector.select(timeout=self.proxy.upstream_timeout):
+                    data = key.fileobj.recv(65536)  # type: ignore[union-attr]
+                    if not data:
+                        return
+                    key.data.sendall(data)
+
+
+class NetworkProxy:
+    """This class implements a local HTTP proxy which applies NetworkRules to the requests of the
+    browsers launched with it, see the network_proxy argument of the browsers. The rules, cache and
+    stats are shared by all browsers using the proxy.
+
+    Examples
+    --------
+        proxy = NetworkProxy(rules=NetworkRules(block_resource_types=["Image"])).start()
+        browser = FirefoxBrowser(network_proxy=proxy)
+        ...
+        print(proxy.stats.as_dict())
+        proxy.stop()
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        rules: Optional[NetworkRules] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        upstream_timeout: float = DEFAULT_UPSTREAM_TIMEOUT,
+        port: int = 0,
+    ):
+        self.rules = rules or NetworkRules()
+        self.cache = ResponseCache(max_size=cache_size)
+        self.stats = NetworkStats()
+        self.upstream_timeout = upstream_timeout
+        self.lock = threading.Lock()
+        # The total size and number of the responses fetched, by resource type, see
+        # estimated_response_size
+        self._response_sizes: Dict[str, Tuple[int, int]] = {}
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _ProxyRequestHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.address}, rules={self.rules})"
+
+    @property
+    def address(self) -> str:
+        """The host and port of the proxy, e.g. "127.0.0.1:8080"."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "NetworkProxy":
+        """Starts serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        LOGGER.info("Started the network proxy %s.", self)
+        return self
+
+    def stop(self):
+        """Stops serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        LOGGER.info(
+            "Stopped the network proxy %s. Stats: %s",
+            self.address,
+            self.stats.as_dict(),
+        )
+
+    def __enter__(self) -> "NetworkProxy":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def record_response_size(self, resource_type: str, size: int):
+        """Records the size of a response fetched, see estimated_response_size."""
+        with self.lock:
+            total, count = self._response_sizes.get(resource_type, (0, 0))
+            self._response_sizes[resource_type] = (total + size, count + 1)
+
+    def estimated_response_size(self, resource_type: str) -> int:
+        """Estimates the size of a response of the given resource type, e.g. of a blocked
+        request, as the average size of the ones fetched so far, or else
+        ESTIMATED_RESPONSE_SIZES.
+
+        Returns
+        -------
+        int
+        """
+        with self.lock:
+            total, count = self._response_sizes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return ESTIMATED_RESPONSE_SIZES.get(resource_type, 0)
+
+    def reset_stats(self):
+        """Resets the counters, e.g. before measuring a single test."""
+        with self.lock:
+            self.stats = NetworkStats()
+
+    def chromium_arguments(self) -> List[str]:
+        """Returns the command line arguments which make a Chromium based browser send its
+        requests through the proxy, including the ones to localhost, which it bypasses by default.
+
+        Returns
+        -------
+        List[str]
+        """
+        return [
+            f"--proxy-server=http://{self.address}",
+            "--proxy-bypass-list=<-loopback>",
+        ]
+
+    def firefox_preferences(self) -> Dict[str, Any]:
+        """Returns the preferences which make Firefox send its requests through the proxy,
+        including the ones to localhost, which it bypasses by default.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        host, port = self._server.server_address[:2]
+        return {
+            "network.proxy.type": 1,
+            "network.proxy.http": host,
+            "network.proxy.http_port": port,
+            "network.proxy.ssl": host,
+            "network.proxy.ssl_port": port,
+            "network.proxy.no_proxies_on": "",
+            "network.proxy.allow_hijacking_localhost": True,
+        }
@@ -0,0 +1,484 @@
+"""This module contains an implementation of page readiness strategies, i.e. of when a page which
+was navigated to is usable, see the ready argument of BaseBrowser.open_url. Instead of waiting for
+the load event, i.e. for the slowest image or stylesheet, a single page application (SPA) is usually
+usable once its requests for data settled and it stopped rendering.
+
+Navigation itself returns according to the session's page load strategy, hence the strategies only
+return before the load event in browsers launched with the "eager" or "none" one, e.g. with the
+ci-fast launch profile, see browsers/launch_profiles.py.
+
+Examples
+--------
+    browser.open_url("https://example.com", ready="network-idle")
+    browser.open_url("https://example.com", ready="network-idle+dom-quiet")
+    browser.open_url("https://example.com", ready=ScriptReadiness("window.appReady === true"))
+    browser.open_url("https://example.com", ready=["interactive", lambda driver: ...])
+"""
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Set, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from logger import get_logger
+
+if TYPE_CHECKING:
+    from elements.waits import WaitPolicy
+
+LOGGER = get_logger(__name__)
+# The default timeout of waiting for a page to be ready, after the navigation returned
+DEFAULT_READY_TIMEOUT = 30  # seconds
+# How long there must be no requests in flight or finishing for the network to be idle
+DEFAULT_NETWORK_IDLE_TIME = 0.5  # seconds
+# How long the DOM must not change for it to be quiet
+DEFAULT_DOM_QUIET_TIME = 0.3  # seconds
+# Separates the names of the strategies to combine, e.g. "network-idle+dom-quiet"
+STRATEGY_SEPARATOR = "+"
+# Installs a tracker of the page's network and DOM activity, unless it's installed already. It
+# counts the fetch and XMLHttpRequest requests in flight and records when the last request
+# started or finished and when the DOM last changed. Chromium based browsers install it before
+# any of the page's scripts run, see ActivityReadiness.prepare, the others on the first check,
+# hence in the latter the requests which were in flight then are only noticed once they finish,
+# through the Resource Timing entries
+ACTIVITY_TRACKER_SCRIPT = """
+if (!window.__pageActivity) {
+    var tracker = {inflight: 0, lastNetwork: performance.now(), lastMutation: performance.now(),
+                   resources: 0};
+    var started = function () {
+        tracker.inflight++;
+        tracker.lastNetwork = performance.now();
+    };
+    var finished = function () {
+        tracker.inflight = Math.max(tracker.inflight - 1, 0);
+        tracker.lastNetwork = performance.now();
+    };
+    if (window.fetch) {
+        var fetch_ = window.fetch;
+        window.fetch = function () {
+            started();
+            try {
+                return fetch_.apply(this, arguments).then(
+                    function (response) { finished(); return response; },
+                    function (error) { finished(); throw error; }
+                );
+            } catch (error) {
+                finished();
+                throw error;
+            }
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished);
+        try {
+            return send.apply(this, arguments);
+        } catch (error) {
+            finished();
+            throw error;
+        }
+    };
+    new MutationObserver(function () { tracker.lastMutation = performance.now(); }).observe(
+        document, {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+    window.__pageActivity = tracker;
+}
+var activity = window.__pageActivity;
+var resources = performance.getEntriesByType('resource').length;
+if (resources !== activity.resources) {
+    activity.resources = resources;
+    activity.lastNetwork = performance.now();
+}
+"""
+
+# The handles of the windows of each driver in which the activity tracker is installed on every
+# navigation. The DevTools protocol installs it in the window current at the time only, hence
+# windows opened later, e.g. by BaseBrowser.reset, need it installed again
+_TRACKED_WINDOWS: "WeakKeyDictionary[WebDriver, Set[str]]" = WeakKeyDictionary()
+
+
+class ReadinessStrategy:
+    """This class implements the base of the strategies of when a page is ready."""
+
+    name = "custom"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name})"
+
+    def prepare(self, driver: WebDriver):
+        """Prepares the browser before navigating, e.g. installs scripts in the page to be loaded.
+
+        Parameters
+        ----------
+        driver : WebDriver
+        """
+
+    def is_ready(self, driver: WebDriver) -> bool:
+        """Determines whether the current page is ready.
+
+        Parameters
+        ----------
+        driver : WebDriver
+
+        Returns
+        -------
+        bool
+        """
+        raise NotImplementedError
+
+    async def is_ready_async(self, browser: Any) -> bool:
+        """The asyncio counterpart of is_ready, for an AsyncBaseBrowser.
+
+        Parameters
+        ----------
+        browser : AsyncBaseBrowser
+
+        Returns
+        -------
+        bool
+        """
+        raise NotImplementedError
+
+
+class ScriptReadiness(ReadinessStrategy):
+    """This class implements a strategy by which a page is ready once a JavaScript expression is
+    truthy, e.g. an application's own flag. It's checked with a single call to the browser, also
+    when combined with other script strategies, see AllReadiness.
+
+    Parameters
+    ----------
+    condition : str
+        A JavaScript expression, e.g. "window.appReady === true".
+    name : str
+        Defaults to condition.
+
+    Examples
+    --------
+        ScriptReadiness("document.querySelector('#app .loaded') !== null", name="app-loaded")
+    """
+
+    # A script run before the condition is evaluated, e.g. installing a tracker it reads
+    setup_script = ""
+
+    def __init__(self, condition: str, name: str = ""):
+        self.condition = condition
+        self.name = name or condition
+
+    def script(self) -> str:
+        """Returns the script which checks the condition.
+
+        Returns
+        -------
+        str
+        """
+        return f"{self.setup_script}\nreturn Boolean({self.condition});"
+
+    def is_ready(self, driver: WebDriver) -> bool:
+        return bool(driver.execute_script(self.script()))
+
+    async def is_ready_async(self, browser: Any) -> bool:
+        return bool(await browser.execute_script(self.script()))
+
+
+class DocumentReadiness(ScriptReadiness):
+    """This class implements a strategy by which a page is ready once its document reached a
+    ready state, i.e. "interactive", which is DOMContentLoaded, or "complete", which is load.
+
+    Parameters
+    ----------
+    ready_state : str
+        Defaults to "complete".
+    """
+
+    def __init__(self, ready_state: str = "complete"):
+        if ready_state not in ("interactive", "complete"):
+            raise ValueError(
+                f"The ready state must be interactive or complete, got: {ready_state}"
+            )
+        condition = (
+            "document.readyState === 'complete'"
+            if ready_state == "complete"
+            else "document.readyState !== 'loading'"
+        )
+        super().__init__(
+            condition=condition,
+            name="load" if ready_state == "complete" else ready_state,
+        )
+
+
+class ActivityReadiness(ScriptReadiness):
+    """This class implements the base of the strategies which read the tracker of the page's
+    network and DOM activity, see ACTIVITY_TRACKER_SCRIPT. The page is never ready while its
+    document is still loading."""
+
+    setup_script = ACTIVITY_TRACKER_SCRIPT
+
+    def prepare(self, driver: WebDriver):
+        """Installs the activity tracker before any of the page's scripts run in Chromium based
+        browsers, once per window, so that the requests started by the page's scripts right away
+        are counted too."""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return
+        handle = driver.current_window_handle
+        tracked = _TRACKED_WINDOWS.setdefault(driver, set())
+        if handle in tracked:
+            return
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": ACTIVITY_TRACKER_SCRIPT}
+        )
+        # The handles of the windows closed since, e.g. by BaseBrowser.reset, are dropped
+        tracked.intersection_update(driver.window_handles)
+        tracked.add(handle)
+        LOGGER.debug(
+            "Installed the page activity tracker for every navigation of window %s.",
+            handle,
+        )
+
+
+class NetworkIdleReadiness(ActivityReadiness):
+    """This class implements a strategy by which a page is ready once no fetch or XMLHttpRequest
+    request is in flight and no request started or finished for idle_time seconds.
+
+    Parameters
+    ----------
+    idle_time : float
+        Defaults to DEFAULT_NETWORK_IDLE_TIME.
+    """
+
+    def __init__(self, idle_time: float = DEFAULT_NETWORK_IDLE_TIME):
+        super().__init__(
+            condition=(
+                "document.readyState !== 'loading' && activity.inflight === 0 && "
+                f"performance.now() - activity.lastNetwork >= {idle_time * 1000:.0f}"
+            ),
+            name="network-idle",
+        )
+        self.idle_time = idle_time
+
+
+class DomQuietReadiness(ActivityReadiness):
+    """This class implements a strategy by which a page is ready once its DOM didn't change for
+    quiet_time seconds, e.g. a SPA finished rendering.
+
+    Parameters
+    ----------
+    quiet_time : float
+        Defaults to DEFAULT_DOM_QUIET_TIME.
+    """
+
+    def __init__(self, quiet_time: float = DEFAULT_DOM_QUIET_TIME):
+        super().__init__(
+            condition=(
+                "document.readyState !== 'loading' && "
+                f"performance.now() - activity.lastMutation >= {quiet_time * 1000:.0f}"
+            ),
+            name="dom-quiet",
+        )
+        self.quiet_time = quiet_time
+
+
+class PredicateReadiness(ReadinessStrategy):
+    """This class implements a strategy by which a page is ready once an application specific
+    predicate returns a truthy value. It's called with the driver, or with the AsyncBaseBrowser,
+    in which case it may also be a coroutine function. NoSuchElementException is treated as not
+    ready.
+
+    Parameters
+    ----------
+    predicate : Callable[[Any], Any]
+    name : str
+        Defaults to the predicate's name.
+
+    Examples
+    --------
+        PredicateReadiness(lambda driver: driver.find_element(By.ID, "app").is_displayed())
+    """
+
+    def __init__(self, predicate: Callable[[Any], Any], name: str = ""):
+        self.predicate = predicate
+        self.name = name or getattr(predicate, "__name__", repr(predicate))
+
+    def is_ready(self, driver: WebDriver) -> bool:
+        return bool(self.predicate(driver))
+
+    async def is_ready_async(self, browser: Any) -> bool:
+        result = self.predicate(browser)
+        if isinstance(result, Awaitable):
+            result = await result
+        return bool(result)
+
+
+class AllReadiness(ReadinessStrategy):
+    """This class implements a strategy by which a page is ready once all of strategies consider
+    it ready. Consecutive script strategies are checked with a single call to the browser.
+
+    Parameters
+    ----------
+    strategies : Sequence[ReadinessStrategy]
+    """
+
+    def __init__(self, strategies: Sequence[ReadinessStrategy]):
+        # Combinations are flattened, so that their script strategies are combined with the others
+        self.strategies: Tuple[ReadinessStrategy, ...] = tuple(
+            strategy_
+            for strategy in strategies
+            for strategy_ in (
+                strategy.strategies
+                if isinstance(strategy, AllReadiness)
+                else (strategy,)
+            )
+        )
+        self.name = STRATEGY_SEPARATOR.join(
+            strategy.name for strategy in self.strategies
+        )
+        self._checks: List[ReadinessStrategy] = []
+        scripts: List[ScriptReadiness] = []
+        for strategy in self.strategies + (None,):
+            if isinstance(strategy, ScriptReadiness):
+                scripts.append(strategy)
+                continue
+            if scripts:
+                self._checks.append(_combine_scripts(scripts))
+                scripts = []
+            if strategy is not None:
+                self._checks.append(strategy)
+
+    def prepare(self, driver: WebDriver):
+        for strategy in self.strategies:
+            strategy.prepare(driver)
+
+    def is_ready(self, driver: WebDriver) -> bool:
+        return all(check.is_ready(driver) for check in self._checks)
+
+    async def is_ready_async(self, browser: Any) -> bool:
+        for check in self._checks:
+            if not await check.is_ready_async(browser):
+                return False
+        return True
+
+
+def _combine_scripts(strategies: Sequence[ScriptReadiness]) -> ScriptReadiness:
+    """Returns a script strategy which is ready once all of strategies are, with the setup script
+    of each of their classes run once."""
+    if len(strategies) == 1:
+        return strategies[0]
+    combined = ScriptReadiness(
+        condition=" && ".join(f"({strategy.condition})" for strategy in strategies),
+        name=STRATEGY_SEPARATOR.join(strategy.name for strategy in strategies),
+    )
+    setup_scripts = []
+    for strategy in strategies:
+        if strategy.setup_script and strategy.setup_script not in setup_scripts:
+            setup_scripts.append(strategy.setup_script)
+    combined.setup_script = "\n".join(setup_scripts)
+    return combined
+
+
+# The strategies which can be referred to by name
+READINESS_STRATEGIES: Dict[str, Callable[[], ReadinessStrategy]] = {
+    # The load event, i.e. what navigation waits for with the "normal" page load strategy
+    "load": DocumentReadiness,
+    # DOMContentLoaded, i.e. what navigation waits for with the "eager" page load strategy
+    "interactive": lambda: DocumentReadiness(ready_state="interactive"),
+    "network-idle": NetworkIdleReadiness,
+    "dom-quiet": DomQuietReadiness,
+}
+Ready = Union[
+    str,
+    ReadinessStrategy,
+    Callable[[Any], Any],
+    Sequence[Union[str, ReadinessStrategy]],
+]
+
+
+def get_readiness_strategy(ready: Ready) -> ReadinessStrategy:
+    """Returns the strategy described by ready.
+
+    Parameters
+    ----------
+    ready : Ready
+        A name of READINESS_STRATEGIES, or names separated by STRATEGY_SEPARATOR, e.g.
+        "network-idle+dom-quiet", a strategy, a predicate, see PredicateReadiness, or a sequence
+        of them, all of which must be ready.
+
+    Returns
+    -------
+    ReadinessStrategy
+    """
+    if isinstance(ready, ReadinessStrategy):
+        return ready
+    if isinstance(ready, str):
+        names = ready.split(STRATEGY_SEPARATOR)
+        unknown = [name for name in names if name not in READINESS_STRATEGIES]
+        if unknown:
+            raise ValueError(
+                f"Unknown readiness strategies: {', '.join(unknown)}! Available ones: "
+                f"{', '.join(sorted(READINESS_STRATEGIES))}"
+            )
+        strategies = [READINESS_STRATEGIES[name]() for name in names]
+    elif callable(ready):
+        return PredicateReadiness(predicate=ready)
+    else:
+        strategies = [get_readiness_strategy(ready_) for ready_ in ready]
+    return strategies[0] if len(strategies) == 1 else AllReadiness(strategies)
+
+
+def _ready_wait_policy(timeout: float) -> "WaitPolicy":
+    # Imported on use, as elements.waits imports asyncio, which the browsers don't need otherwise
+    # pylint: disable=import-outside-toplevel
+    from elements.waits import WaitPolicy
+
+    # A script may fail while the page is being replaced, e.g. by a client side redirect
+    return WaitPolicy(
+        timeout=timeout,
+        ignored_exceptions=(NoSuchElementException, JavascriptException),
+    )
+
+
+def wait_until_ready(
+    driver: WebDriver,
+    strategy: ReadinessStrategy,
+    timeout: float = DEFAULT_READY_TIMEOUT,
+):
+    """Waits until the current page is ready according to strategy.
+
+    Parameters
+    ----------
+    driver : WebDriver
+    strategy : ReadinessStrategy
+    timeout : float
+        Defaults to DEFAULT_READY_TIMEOUT.
+
+    Raises
+    ------
+    TimeoutException
+        If the page was not ready within the timeout.
+    """
+    _ready_wait_policy(timeout=timeout).until(
+        lambda: strategy.is_ready(driver),
+        message=f"The page was not ready ({strategy.name}) within {timeout} seconds!",
+    )
+
+
+async def wait_until_ready_async(
+    browser: Any, strategy: ReadinessStrategy, timeout: float = DEFAULT_READY_TIMEOUT
+):
+    """The asyncio counterpart of wait_until_ready, for an AsyncBaseBrowser.
+
+    Parameters
+    ----------
+    browser : AsyncBaseBrowser
+    strategy : ReadinessStrategy
+    timeout : float
+        Defaults to DEFAULT_READY_TIMEOUT.
+
+    Raises
+    ------
+    TimeoutException
+        If the page was not ready within the timeout.
+    """
+    await _ready_wait_policy(timeout=timeout).until_async(
+        lambda: strategy.is_ready_async(browser),
+        message=f"The page was not ready ({strategy.name}) within {timeout} seconds!",
+    )
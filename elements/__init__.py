@@ -1,9 +1,36 @@
-"""__init__ for elements/"""
-from elements.base_web_element import BaseWebElement
-from elements.button import Button
-from elements.checkbox import Checkbox
-from elements.collection import Collection
-from elements.dropdowns import MultiSelectDropdown, SingleSelectDropdown
-from elements.input import Input
-from elements.link import Link
-from elements.table import Table
+"""__init__ for elements/
+
+The element classes are imported lazily, on first access, see lazy_imports.py. Hence importing
+the package, e.g. in a test worker which only needs a few of them, doesn't import every element
+module. The import paths are the same as before, e.g. `from elements import Table`.
+"""
+from typing import TYPE_CHECKING
+
+from lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from elements.base_web_element import BaseWebElement
+    from elements.button import Button
+    from elements.checkbox import Checkbox
+    from elements.collection import Collection
+    from elements.dropdowns import MultiSelectDropdown, SingleSelectDropdown
+    from elements.input import Input
+    from elements.link import Link
+    from elements.table import Table
+
+# The module each lazily imported name is defined in
+_LAZY_IMPORTS = {
+    "BaseWebElement": "elements.base_web_element",
+    "Button": "elements.button",
+    "Checkbox": "elements.checkbox",
+    "Collection": "elements.collection",
+    "MultiSelectDropdown": "elements.dropdowns.multi_select_dropdown",
+    "SingleSelectDropdown": "elements.dropdowns.single_select_dropdown",
+    "Input": "elements.input",
+    "Link": "elements.link",
+    "Table": "elements.table",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
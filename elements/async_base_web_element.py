@@ -0,0 +1,208 @@
+"""This module contains an implementation of a base web element class for asyncio based browsers,
+see browsers/async_browser.py."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar, Union
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from browsers.async_browser import AsyncBaseBrowser, AsyncWebElement
+from elements.waits import WaitPolicy, get_default_wait_policy
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+T = TypeVar("T")
+
+
+class AsyncBaseWebElement:
+    """This class implements the asyncio counterpart of BaseWebElement. Unlike BaseWebElement, a
+    found element is not checked for being stale before every use, which would cost a call to the
+    browser. Instead, an action on a stale element finds the element again and is retried once.
+
+    Examples
+    --------
+        button = AsyncBaseWebElement(parent=browser, locator=(By.CSS_SELECTOR, "button"))
+        await button.click()
+        print(await button.text())
+    """
+
+    WAIT_POLICY: Optional[WaitPolicy] = None
+
+    def __init__(
+        self,
+        parent: Optional[
+            Union[AsyncBaseWebElement, AsyncWebElement, AsyncBaseBrowser]
+        ] = None,
+        locator: Optional[Tuple[By, str]] = None,
+        web_element: Optional[AsyncWebElement] = None,
+    ):
+        self._parent = parent
+        self.locator = locator
+        self.web_element = web_element
+        self.wait_policy: Optional[WaitPolicy] = type(self).WAIT_POLICY
+
+    @property
+    def browser(self) -> AsyncBaseBrowser:
+        """Returns the browser the element belongs to, resolved from its parent chain.
+
+        Returns
+        -------
+        AsyncBaseBrowser
+        """
+        if self.web_element is not None:
+            return self.web_element.parent
+        if isinstance(self._parent, AsyncBaseWebElement):
+            return self._parent.browser
+        if isinstance(self._parent, AsyncWebElement):
+            return self._parent.parent
+        return self._parent
+
+    async def get_parent(self) -> Union[AsyncBaseBrowser, AsyncWebElement]:
+        """Returns the parent as either an AsyncBaseBrowser or AsyncWebElement object.
+
+        Returns
+        -------
+        Union[AsyncBaseBrowser, AsyncWebElement]
+        """
+        if isinstance(self._parent, AsyncBaseWebElement):
+            return await self._parent.find_element()
+        return self._parent
+
+    async def find_element(self, wait_until_is_present: bool = True) -> AsyncWebElement:
+        """Finds an element and returns it as an AsyncWebElement object.
+
+        Parameters
+        ----------
+        wait_until_is_present : bool
+            Controls whether the method first waits for the web element to be present.
+            Defaults to True.
+
+        Returns
+        -------
+        AsyncWebElement
+        """
+        if self.web_element is not None:
+            return self.web_element
+        if not self.locator:
+            raise UserWarning("Neither a web element nor a locator was provided!")
+
+        parent = await self.get_parent()
+        if wait_until_is_present:
+            wait_policy = self.wait_policy or get_default_wait_policy()
+            web_element = await wait_policy.until_async(
+                method=lambda: parent.find_element(*self.locator),
+                message=f"Could not wait for the element with locator {self.locator} to be "
+                f"present! Tried for {wait_policy.timeout} seconds",
+            )
+        else:
+            web_element = await parent.find_element(*self.locator)
+
+        LOGGER.info("Got element with locator: %s.", self.locator)
+        self.web_element = web_element
+        return web_element
+
+    async def _with_element(
+        self, action: Callable[[AsyncWebElement], Awaitable[T]]
+    ) -> T:
+        """Performs action on the web element, finding the element again and retrying once if
+        it turns out to be stale.
+
+        Returns
+        -------
+        T
+            The value returned by action.
+        """
+        # pylint: disable=duplicate-code
+        web_element = await self.find_element()
+        try:
+            return await action(web_element)
+        except StaleElementReferenceException as exc:
+            if not self.locator:
+                raise UserWarning(
+                    "The web element is stale and a locator was not provided, "
+                    "hence it is not possible to find it!"
+                ) from exc
+            self.web_element = None
+            return await action(await self.find_element())
+
+    async def click(self):
+        """Clicks on the element."""
+        await self._with_element(lambda web_element: web_element.click())
+        LOGGER.info("Clicked on element with locator: %s.", self.locator)
+
+    async def text(self) -> str:
+        """Returns the text of the element.
+
+        Returns
+        -------
+        str
+        """
+        return await self._with_element(lambda web_element: web_element.text())
+
+    async def get_attribute_value(self, attribute_name: str) -> Optional[str]:
+        """Returns the value of the element's attribute specified by attribute_name: str.
+
+        Returns
+        -------
+        Optional[str]
+        """
+        return await self._with_element(
+            lambda web_element: web_element.get_attribute(name=attribute_name)
+        )
+
+    async def is_enabled(self) -> bool:
+        """Determines whether the element is enabled or not.
+
+        Returns
+        -------
+        bool
+        """
+        return await self._with_element(lambda web_element: web_element.is_enabled())
+
+    async def enter_value(self, value: Union[str, int], clear_first: bool = True):
+        """Types in given value into the element, e.g. an input.
+
+        Parameters
+        ----------
+        value : Union[str, int]
+            The value, i.e. characters, to type in the element.
+        clear_first : bool
+            Controls whether the element's value would first be cleared. Defaults to True.
+        """
+        if clear_first:
+            await self._with_element(lambda web_element: web_element.clear())
+        await self._with_element(lambda web_element: web_element.send_keys(value))
+        LOGGER.info(
+            "Entered the value: %s to the element with locator: %s", value, self.locator
+        )
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Synchronously executes JavaScript with the web element passed as arguments[0],
+        followed by args.
+
+        Returns
+        -------
+        Any
+            The value returned by the script.
+        """
+        return await self._with_element(
+            lambda web_element: web_element.parent.execute_script(
+                script, web_element, *args
+            )
+        )
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        """Asynchronously executes JavaScript with the web element passed as arguments[0],
+        followed by args and the script's callback.
+
+        Returns
+        -------
+        Any
+            The value the script passed to its callback.
+        """
+        return await self._with_element(
+            lambda web_element: web_element.parent.execute_async_script(
+                script, web_element, *args
+            )
+        )
@@ -1,24 +1,38 @@
 """This module contains an implementation of a base web element class."""
 from __future__ import annotations
 
-import logging
-from typing import Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.wait import WebDriverWait
 
-from settings import LOGGING_LEVEL
+from elements.element_cache import driver_of, get_element_cache
+from elements.element_properties import (
+    READ_PROPERTIES_SCRIPT,
+    ElementProperties,
+    validate_property_names,
+)
+from elements.locator_chain import find_locator_chain
+from elements.waits import WaitPolicy, get_default_wait_policy
+from instrumentation.actions import instrumented
+from logger import get_logger, log_timing
+from settings import DEFAULT_WAIT_TIMEOUT, get_global_driver
 
-logging.basicConfig(level=LOGGING_LEVEL)
-DEFAULT_DISPLAYED_WAIT = 60  # seconds
+LOGGER = get_logger(__name__)
+DEFAULT_DISPLAYED_WAIT = DEFAULT_WAIT_TIMEOUT  # seconds
 
 
 class BaseWebElement:
     """This class implements a base web element class to be inherited by specific web elements,
-    such as buttons, dropdowns, tables, etc."""
+    such as buttons, dropdowns, tables, etc.
+
+    The element waits to be present according to its wait_policy, which defaults to the class's
+    WAIT_POLICY, if set, or else to the default wait policy (see elements/waits.py).
+    """
+
+    WAIT_POLICY: Optional[WaitPolicy] = None
 
     def __init__(
         self,
@@ -29,6 +43,9 @@ class BaseWebElement:
         self._parent = parent
         self.locator = locator
         self.web_element = web_element
+        # The DOM epoch at which web_element was found, used when the element cache is enabled
+        self._cache_epoch: Optional[str] = None
+        self.wait_policy: Optional[WaitPolicy] = type(self).WAIT_POLICY
 
     @property
     def parent(self) -> Union[WebDriver, WebElement]:
@@ -39,9 +56,86 @@ class BaseWebElement:
         Union[WebDriver, WebElement]
         """
         if isinstance(self._parent, BaseWebElement):
-            return self._parent.find_element()
+            return self._parent.find_element_with_ancestors()
         return self._parent
 
+    @property
+    def driver(self) -> WebDriver:
+        """Returns the WebDriver the element belongs to, resolved from the element's own parent
+        chain without a call to the browser. Falls back to the driver of the current context, see
+        settings.get_global_driver, only if the chain doesn't lead to one.
+
+        Returns
+        -------
+        WebDriver
+        """
+        if self.web_element:
+            return self.web_element.parent
+        if isinstance(self._parent, BaseWebElement):
+            return self._parent.driver
+        if self._parent is not None:
+            return driver_of(self._parent)
+        return get_global_driver()
+
+    def _can_be_chained(self) -> bool:
+        """Determines whether the element can be found as part of a locator chain, i.e. whether
+        it has a locator and is found the default way."""
+        return (
+            self.locator is not None
+            and type(self).find_element is BaseWebElement.find_element
+        )
+
+    @instrumented
+    def find_element_with_ancestors(self) -> WebElement:
+        """Finds the element together with all of its ancestors which haven't been found yet, with
+        a single call to the browser instead of one lookup per ancestor, and returns it as a
+        WebElement object. The ancestors keep the web elements found for later use.
+
+        Returns
+        -------
+        WebElement
+        """
+        # pylint: disable=protected-access
+        chain: List[BaseWebElement] = []
+        node = self
+        while (
+            isinstance(node, BaseWebElement)
+            and not node.web_element
+            and node._can_be_chained()
+        ):
+            chain.append(node)
+            node = node._parent
+        if len(chain) < 2 or node is None:
+            return self.find_element()
+
+        chain.reverse()
+
+        def find_chain(
+            root: Union[WebDriver, WebElement],
+        ) -> Tuple[List[WebElement], str]:
+            driver = driver_of(root)
+            cache = get_element_cache(driver=driver)
+            epoch = cache.current_epoch(driver=driver) if cache is not None else None
+            web_elements = find_locator_chain(
+                driver=driver,
+                root=root if isinstance(root, WebElement) else None,
+                locators=[element.locator for element in chain],
+                wait_policy=self.wait_policy or get_default_wait_policy(),
+            )
+            return web_elements, epoch
+
+        # A root trusted by the element cache may turn out to be stale, see _with_element
+        web_elements, epoch = (
+            node._with_element(find_chain)
+            if isinstance(node, BaseWebElement)
+            else find_chain(node)
+        )
+        for element, web_element in zip(chain, web_elements):
+            element.web_element = web_element
+            element._cache_epoch = epoch
+        return self.web_element
+
+    @instrumented
     def find_element(self, wait_until_is_present: bool = True) -> WebElement:
         """Finds an element and returns it as a WebElement object.
 
@@ -54,44 +148,219 @@ class BaseWebElement:
         Returns
         -------
         WebElement
+            With the element cache enabled, the element may have become stale since the DOM epoch
+            was last read, see elements/element_cache.py, hence actions on it are to be performed
+            with _with_element, which finds it again then.
         """
         if self.web_element:
-            # Check if the element is stale first before returning it
-            try:
-                _ = self.web_element.location
-            except StaleElementReferenceException as exc:
-                if not self.locator:
-                    raise UserWarning(
-                        "The web element is stale and a locator was not provided, "
-                        "hence it is not possible to find it!"
-                    ) from exc
-            else:
+            driver = driver_of(self.web_element)
+            cache = get_element_cache(driver=driver)
+            # With the element cache enabled, the element is trusted without checking whether
+            # it's stale, given that no elements were removed from the page since it was found
+            if cache is not None and cache.is_current(
+                epoch=self._cache_epoch, driver=driver
+            ):
                 return self.web_element
+            # Elements without a locator can't be found again, hence they are still checked
+            if cache is None or not self.locator:
+                # Check if the element is stale first before returning it
+                try:
+                    _ = self.web_element.location
+                except StaleElementReferenceException as exc:
+                    if not self.locator:
+                        raise UserWarning(
+                            "The web element is stale and a locator was not provided, "
+                            "hence it is not possible to find it!"
+                        ) from exc
+                else:
+                    if cache is not None:
+                        self._cache_epoch = cache.current_epoch(driver=driver)
+                    return self.web_element
 
-        if wait_until_is_present:
-            logging.info(
-                "Starting to wait for element with locator %s to be present",
-                self.locator,
-            )
-            WebDriverWait(self.parent, DEFAULT_DISPLAYED_WAIT).until(
-                method=lambda parent: parent.find_element(*self.locator),
-                message=f"Could not wait for the element with locator {self.locator} to be "
-                f"present! Tried for {DEFAULT_DISPLAYED_WAIT} seconds",
+        self.web_element, self._cache_epoch = self._with_parent(
+            lambda parent: self._find_in(
+                parent=parent, wait_until_is_present=wait_until_is_present
             )
-
-        logging.info("Got element with locator: %s.", self.locator)
-        self.web_element = self.parent.find_element(*self.locator)
+        )
         return self.web_element
 
+    def _find_in(
+        self, parent: Union[WebDriver, WebElement], wait_until_is_present: bool
+    ) -> Tuple[WebElement, Optional[str]]:
+        """Finds the element in parent and returns it together with the DOM epoch at which it was
+        found, if the element cache is enabled."""
+        cache = get_element_cache(driver=driver_of(parent))
+        # The epoch is read before finding the element, so that any removal of elements in
+        # the meantime results in a miss
+        epoch = (
+            cache.current_epoch(driver=driver_of(parent)) if cache is not None else None
+        )
+        # Elements are found all the time, hence the event is sampled
+        with log_timing(
+            LOGGER,
+            "find_element",
+            "Got element with locator: %s",
+            self.locator,
+            sample=True,
+            locator=self.locator,
+        ):
+            if wait_until_is_present:
+                LOGGER.debug(
+                    "Starting to wait for element with locator %s to be present",
+                    self.locator,
+                )
+                wait_policy = self.wait_policy or get_default_wait_policy()
+                # The wait returns the element it found, hence there is no need to find it again
+                web_element = wait_policy.until(
+                    method=lambda: parent.find_element(*self.locator),
+                    message=f"Could not wait for the element with locator {self.locator} to "
+                    f"be present! Tried for {wait_policy.timeout} seconds",
+                )
+            else:
+                web_element = parent.find_element(*self.locator)
+        return web_element, epoch
+
+    def _with_element(self, action: Callable[[WebElement], Any]) -> Any:
+        """Performs action on the web element. With the element cache enabled, a trusted element
+        may turn out to be stale if the page changed since the epoch was last read, in which case
+        the element is found again and the action is retried once.
+
+        Returns
+        -------
+        Any
+            The value returned by action.
+        """
+        web_element = self.find_element_with_ancestors()
+        try:
+            return action(web_element)
+        except StaleElementReferenceException:
+            cache = get_element_cache(driver=driver_of(web_element))
+            if cache is None or not self.locator:
+                raise
+            cache.invalidate()
+            self.web_element = None
+            return action(self.find_element_with_ancestors())
+
+    def _with_parent(
+        self, action: Callable[[Union[WebDriver, WebElement]], Any]
+    ) -> Any:
+        """Performs action on the parent, e.g. finds the element in it, retrying once if a parent
+        trusted by the element cache turns out to be stale, see _with_element.
+
+        Returns
+        -------
+        Any
+            The value returned by action.
+        """
+        if isinstance(self._parent, BaseWebElement):
+            # pylint: disable=protected-access
+            return self._parent._with_element(action)
+        return action(self._parent)
+
+    def _invalidate_element_cache(self):
+        """Makes the element cache, if enabled, read the DOM epoch again on next use. To be
+        called after actions which may change the page, such as clicks."""
+        if self.web_element:
+            cache = get_element_cache(driver=driver_of(self.web_element))
+            if cache is not None:
+                cache.invalidate()
+
+    @instrumented
     def get_attribute_value(self, attribute_name: str):
         """Returns the value of the tag's attribute specified by attribute_name: str."""
-        return self.find_element().get_attribute(name=attribute_name)
+        return self._with_element(
+            lambda web_element: web_element.get_attribute(name=attribute_name)
+        )
+
+    @instrumented
+    def read(self, *properties: str) -> ElementProperties:
+        """Reads multiple properties of the web element with a single call to the browser, instead
+        of one call per property.
+
+        Parameters
+        ----------
+        properties : str
+            The names of the properties to read: "text", "tag", "value", "enabled", "displayed",
+            "selected", "rect", or an attribute, DOM property or computed CSS value prefixed with
+            "attr:", "prop:" or "css:" respectively, e.g. "attr:class".
+
+        Returns
+        -------
+        ElementProperties
+
+        Examples
+        --------
+            properties = element.read("text", "attr:class", "attr:aria-expanded", "enabled")
+            if properties.enabled and properties.attr("aria-expanded") == "true":
+                ...
+        """
+        validate_property_names(names=properties)
+        return ElementProperties(
+            values=self.execute_script(READ_PROPERTIES_SCRIPT, list(properties))
+        )
+
+    @instrumented
+    def execute_script(self, script: str, *args):
+        """Synchronously executes JavaScript in the context of the web element's browser. The web
+        element itself is passed to the script as arguments[0], followed by args.
+
+        Parameters
+        ----------
+        script : str
+            The JavaScript to execute.
+        args
+            Any additional arguments passed to the script as arguments[1:].
+
+        Returns
+        -------
+        Any
+            The value returned by the script.
+        """
+        # WebElement.parent is the WebDriver instance the element was found with
+        return self._with_element(
+            lambda web_element: web_element.parent.execute_script(
+                script, web_element, *args
+            )
+        )
+
+    @instrumented
+    def execute_async_script(self, script: str, *args):
+        """Asynchronously executes JavaScript in the context of the web element's browser. The
+        web element itself is passed to the script as arguments[0], followed by args, and the
+        script signals it's done by calling the callback passed as the last argument.
+
+        Parameters
+        ----------
+        script : str
+            The JavaScript to execute.
+        args
+            Any additional arguments passed to the script before the callback.
+
+        Returns
+        -------
+        Any
+            The value the script passed to the callback.
+        """
+        return self._with_element(
+            lambda web_element: web_element.parent.execute_async_script(
+                script, web_element, *args
+            )
+        )
 
+    @instrumented
     def click(self):
         """Clicks on the WebElement."""
-        self.find_element().click()
-        logging.info("Clicked on element with locator: %s.", self.locator)
+        with log_timing(
+            LOGGER,
+            "click",
+            "Clicked on element with locator: %s",
+            self.locator,
+            locator=self.locator,
+        ):
+            self._with_element(lambda web_element: web_element.click())
+        self._invalidate_element_cache()
 
+    @instrumented
     def is_enabled(self) -> bool:
         """Determines whether the web element is enabled or not.
 
@@ -99,9 +368,10 @@ class BaseWebElement:
         -------
         bool
         """
-        return self.find_element().is_enabled()
+        return self._with_element(lambda web_element: web_element.is_enabled())
 
     @property
+    @instrumented
     def element_screenshot_as_base64(self) -> str:
         """Returns a screenshot of the web element as a base64 encoded string.
 
@@ -109,10 +379,11 @@ class BaseWebElement:
         -------
         str
         """
-        logging.info("Taking a screenshot of element with locator: %s.", self.locator)
-        return self.find_element().screenshot_as_base64
+        LOGGER.info("Taking a screenshot of element with locator: %s.", self.locator)
+        return self._with_element(lambda web_element: web_element.screenshot_as_base64)
 
     @property
+    @instrumented
     def text(self) -> str:
         """The text of the web element.
 
@@ -120,4 +391,4 @@ class BaseWebElement:
         -------
         str
         """
-        return self.find_element().text
+        return self._with_element(lambda web_element: web_element.text)
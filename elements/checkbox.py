@@ -1,7 +1,6 @@
 """This module contains an implementation of a checkbox type of element in a given UI."""
 from __future__ import annotations
 
-import logging
 from typing import Optional, Tuple, Union
 
 from selenium.webdriver.common.by import By
@@ -9,9 +8,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
-from settings import LOGGING_LEVEL
+from instrumentation.actions import instrumented
+from logger import get_logger
 
-logging.basicConfig(level=LOGGING_LEVEL)
+LOGGER = get_logger(__name__)
 
 
 class Checkbox(BaseWebElement):
@@ -35,6 +35,7 @@ class Checkbox(BaseWebElement):
     ):
         super().__init__(parent=parent, locator=locator, web_element=web_element)
 
+    @instrumented
     def is_checked(self) -> bool:
         """Determines whether the checkbox is checked or not
 
@@ -42,8 +43,9 @@ class Checkbox(BaseWebElement):
         -------
         bool
         """
-        return self.find_element().is_selected()
+        return self._with_element(lambda web_element: web_element.is_selected())
 
+    @instrumented
     def check(self) -> Checkbox:
         """Checks the checkbox if it's not already checked.
 
@@ -54,9 +56,10 @@ class Checkbox(BaseWebElement):
         """
         if not self.is_checked():
             self.click()
-            logging.info("Checked checkbox element with locator: %s", self.locator)
+            LOGGER.info("Checked checkbox element with locator: %s", self.locator)
         return self
 
+    @instrumented
     def uncheck(self) -> Checkbox:
         """Unchecks the checkbox if it's already checked.
 
@@ -67,5 +70,5 @@ class Checkbox(BaseWebElement):
         """
         if self.is_checked():
             self.click()
-            logging.info("Unchecked checkbox element with locator: %s", self.locator)
+            LOGGER.info("Unchecked checkbox element with locator: %s", self.locator)
         return self
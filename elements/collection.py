@@ -1,22 +1,61 @@
 """This module contains an implementation of a collection of web elements, i.e. multiple elements
 with a common locator under a given parent"""
-import logging
-from typing import List, Tuple, Type, Union
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, Union, overload
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
-from settings import LOGGING_LEVEL
+from elements.element_cache import driver_of
+from elements.locator_chain import LOCATOR_FUNCTIONS, to_script_locator
+from instrumentation.actions import instrumented
+from logger import get_logger
 
-logging.basicConfig(level=LOGGING_LEVEL)
+LOGGER = get_logger(__name__)
+
+# All collection scripts find the elements of the collection first.
+# arguments: parent element (null for the whole page), locator strategy, locator value, ...
+_FIND_COLLECTION = LOCATOR_FUNCTIONS + """
+var elements = findAll(arguments[0] || document, arguments[1], arguments[2]);
+function textOf(element) {
+    return (element.innerText || element.textContent || '').trim();
+}
+"""
+COLLECTION_COUNT_SCRIPT = _FIND_COLLECTION + "return elements.length;"
+# arguments: ..., index (negative indexes count from the end)
+COLLECTION_ITEM_SCRIPT = _FIND_COLLECTION + """
+var index = arguments[3] < 0 ? elements.length + arguments[3] : arguments[3];
+return elements[index] || null;
+"""
+COLLECTION_TEXTS_SCRIPT = _FIND_COLLECTION + "return elements.map(textOf);"
+# arguments: ..., attribute name
+COLLECTION_ATTRIBUTES_SCRIPT = _FIND_COLLECTION + """
+var name = arguments[3];
+return elements.map(function (element) { return element.getAttribute(name); });
+"""
+# arguments: ..., text, exact match, case sensitive
+COLLECTION_FILTER_BY_TEXT_SCRIPT = _FIND_COLLECTION + """
+var exact = arguments[4], caseSensitive = arguments[5];
+var text = caseSensitive ? arguments[3] : arguments[3].toLowerCase();
+return elements.filter(function (element) {
+    var elementText = caseSensitive ? textOf(element) : textOf(element).toLowerCase();
+    return exact ? elementText === text : elementText.indexOf(text) !== -1;
+});
+"""
 
 
 class Collection:
     """This class implements a Collection, which represents multiple elements with a common
     locator situated under a given parent.
 
+    The collection is a lazy sequence: its elements are only looked up when it's indexed or
+    iterated over, and children_cls objects are only created for the elements actually accessed.
+    Every access reflects the page at the time of the access, e.g. len() counts the elements
+    present when it's called and an iteration goes over the elements present when it starts, as
+    the elements found are not kept between accesses. The bulk accessors texts, attributes and
+    filter_by_text each take a single call to the browser, regardless of the number of elements.
+
     Examples
     --------
         row_data_cells = Collection(
@@ -27,6 +66,11 @@ class Collection:
             children_locator=(By.CSS_SELECTOR, 'input[type="checkbox"]',
             children_cls=Input,
         )
+        len(checkboxes)
+        checkboxes[0].check()
+        items = Collection(parent=some_list, children_locator=(By.CSS_SELECTOR, "li"))
+        items.texts()
+        items.filter_by_text("Sofia")
     """
 
     def __init__(
@@ -49,9 +93,10 @@ class Collection:
         Union[WebDriver, WebElement]
         """
         if isinstance(self._parent, BaseWebElement):
-            return self._parent.find_element()
+            return self._parent.find_element_with_ancestors()
         return self._parent
 
+    @instrumented
     def find_elements(self) -> List[BaseWebElement]:
         """Finds all elements with the parent and locator, specified in the constructor, and
         returns them as a list of objects of type children_cls.
@@ -61,9 +106,125 @@ class Collection:
         List[BaseWebElement]
         """
         cls_elements = [
-            self.children_cls(web_element=elem)
-            for elem in self.parent.find_elements(*self.children_locator)
+            self.children_cls(web_element=elem) for elem in self._find_web_elements()
         ]
-        logging.info("Got a Collection with the following elements: %s", cls_elements)
+        LOGGER.info(
+            "Got a Collection of %s elements with locator: %s",
+            len(cls_elements),
+            self.children_locator,
+            # Collections are found per row of a table, etc., hence the event is sampled
+            extra={"sample": True},
+        )
         self.web_elements = cls_elements
         return cls_elements
+
+    def _with_parent(
+        self, action: Callable[[Union[WebDriver, WebElement]], Any]
+    ) -> Any:
+        """Performs action on the parent, retrying once if a parent trusted by the element cache
+        turns out to be stale, see BaseWebElement._with_element."""
+        if isinstance(self._parent, BaseWebElement):
+            # pylint: disable=protected-access
+            return self._parent._with_element(action)
+        return action(self._parent)
+
+    def _find_web_elements(self) -> List[WebElement]:
+        """Looks up the web elements of the collection."""
+        return self._with_parent(
+            lambda parent: parent.find_elements(*self.children_locator)
+        )
+
+    def _execute_script(self, script: str, *args) -> Any:
+        """Executes one of the collection scripts with the collection's parent and locator."""
+        by, value = to_script_locator(self.children_locator)
+        return self._with_parent(
+            lambda parent: driver_of(parent).execute_script(
+                script,
+                parent if isinstance(parent, WebElement) else None,
+                by,
+                value,
+                *args,
+            )
+        )
+
+    @instrumented
+    def __len__(self) -> int:
+        return self._execute_script(COLLECTION_COUNT_SCRIPT)
+
+    def __iter__(self) -> Iterator[BaseWebElement]:
+        for web_element in self._find_web_elements():
+            yield self.children_cls(web_element=web_element)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseWebElement: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BaseWebElement]: ...
+
+    @instrumented
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self.children_cls(web_element=web_element)
+                for web_element in self._find_web_elements()[index]
+            ]
+        # A single element is looked up on its own, without looking up all the others
+        web_element = self._execute_script(COLLECTION_ITEM_SCRIPT, index)
+        if web_element is None:
+            raise IndexError(
+                f"Collection with locator {self.children_locator} has no element at index {index}!"
+            )
+        return self.children_cls(web_element=web_element)
+
+    @instrumented
+    def texts(self) -> List[str]:
+        """Returns the texts of all elements of the collection.
+
+        Returns
+        -------
+        List[str]
+        """
+        return self._execute_script(COLLECTION_TEXTS_SCRIPT)
+
+    @instrumented
+    def attributes(self, name: str) -> List[Optional[str]]:
+        """Returns the values of the attribute specified by name of all elements of the collection.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        List[Optional[str]]
+        """
+        return self._execute_script(COLLECTION_ATTRIBUTES_SCRIPT, name)
+
+    @instrumented
+    def filter_by_text(
+        self, text: str, exact: bool = False, case_sensitive: bool = False
+    ) -> List[BaseWebElement]:
+        """Returns the elements of the collection whose text contains, or equals, the given text,
+        as objects of type children_cls.
+
+        Parameters
+        ----------
+        text : str
+            The text to look for.
+        exact : bool
+            Controls whether the element's text must equal text, rather than contain it.
+            Defaults to False.
+        case_sensitive : bool
+            Controls whether the texts are compared case-sensitively. Defaults to False.
+
+        Returns
+        -------
+        List[BaseWebElement]
+        """
+        return [
+            self.children_cls(web_element=web_element)
+            for web_element in self._execute_script(
+                COLLECTION_FILTER_BY_TEXT_SCRIPT, text, exact, case_sensitive
+            )
+        ]
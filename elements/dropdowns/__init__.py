@@ -1,3 +1,21 @@
-"""__init__ for dropdown/"""
-from elements.dropdowns.multi_select_dropdown import MultiSelectDropdown
-from elements.dropdowns.single_select_dropdown import SingleSelectDropdown
+"""__init__ for dropdown/
+
+The dropdown classes are imported lazily, on first access, see elements/__init__.py.
+"""
+from typing import TYPE_CHECKING
+
+from lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from elements.dropdowns.multi_select_dropdown import MultiSelectDropdown
+    from elements.dropdowns.single_select_dropdown import SingleSelectDropdown
+
+# The module each lazily imported name is defined in
+_LAZY_IMPORTS = {
+    "MultiSelectDropdown": "elements.dropdowns.multi_select_dropdown",
+    "SingleSelectDropdown": "elements.dropdowns.single_select_dropdown",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
@@ -0,0 +1,248 @@
+"""The module contains the asyncio counterparts of the single select and multi select dropdowns."""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, Union
+
+from selenium.webdriver.common.by import By
+
+from browsers.async_browser import AsyncBaseBrowser, AsyncWebElement
+from elements.async_base_web_element import AsyncBaseWebElement
+from elements.dropdowns.base_dropdown import BaseExpandedDropdown
+from elements.dropdowns.multi_select_dropdown import (
+    MultiSelectDropdown,
+    MultiSelectExpandedDropdown,
+)
+from elements.dropdowns.single_select_dropdown import SingleSelectDropdown
+from elements.locator_chain import LOCATOR_FUNCTIONS, to_script_locator
+from elements.waits import WaitPolicy
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Finds the options under an expanded dropdown and reads their texts.
+# arguments: expanded dropdown, options locator strategy, options locator value
+OPTIONS_SCRIPT = LOCATOR_FUNCTIONS + """
+var options = findAll(arguments[0], arguments[1], arguments[2]), texts = [];
+for (var i = 0; i < options.length; i++) {
+    texts.push((options[i].innerText || options[i].textContent || '').trim());
+}
+return {options: options, texts: texts};
+"""
+
+
+class AsyncBaseDropdown(AsyncBaseWebElement):
+    """This class implements the asyncio counterpart of BaseDropdown."""
+
+    def __init__(
+        self,
+        locator: Tuple[By, str],
+        expanded_locator: Tuple[By, str],
+        expanded_options_loc: Tuple[By, str],
+        parent: Optional[
+            Union[AsyncBaseWebElement, AsyncWebElement, AsyncBaseBrowser]
+        ] = None,
+        web_element: Optional[AsyncWebElement] = None,
+    ):
+        super().__init__(parent=parent, locator=locator, web_element=web_element)
+        self._expanded_locator = expanded_locator
+        self._expanded_options_locator = expanded_options_loc
+
+    @property
+    def expanded(self) -> AsyncBaseWebElement:
+        """The expanded container of the dropdown.
+
+        Returns
+        -------
+        AsyncBaseWebElement
+        """
+        return AsyncBaseWebElement(parent=self.browser, locator=self._expanded_locator)
+
+    async def is_expanded(self) -> bool:
+        """Determines whether the dropdown is currently expanded or not.
+
+        Returns
+        -------
+        bool
+        """
+        expanded = await self.get_attribute_value(attribute_name="aria-expanded")
+        return "true" in (expanded or "").lower()
+
+    async def expand_dropdown(self) -> AsyncBaseWebElement:
+        """Expands the dropdown, by clicking on it, and returns its expanded container.
+
+        Returns
+        -------
+        AsyncBaseWebElement
+        """
+        if not await self.is_expanded():
+            await self.click()
+            LOGGER.info("Expanded dropdown with locator: %s.", self.locator)
+        return self.expanded
+
+    async def options(self) -> List[Tuple[str, AsyncWebElement]]:
+        """Waits for the options of the expanded dropdown to be present and have a text, and
+        returns them together with their texts, read with a single call to the browser per poll.
+
+        Returns
+        -------
+        List[Tuple[str, AsyncWebElement]]
+            The text and web element of each option.
+        """
+        expanded = self.expanded
+        by, value = to_script_locator(self._expanded_options_locator)
+
+        async def read_options():
+            data = await expanded.execute_script(OPTIONS_SCRIPT, by, value)
+            if data["options"] and all(data["texts"]):
+                return list(zip(data["texts"], data["options"]))
+            return None
+
+        return await WaitPolicy(
+            timeout=BaseExpandedDropdown.OPTIONS_VALUES_TIMEOUT
+        ).until_async(
+            method=read_options,
+            message=f"The options of dropdown with locator {self.locator} did not load within "
+            f"{BaseExpandedDropdown.OPTIONS_VALUES_TIMEOUT} seconds!",
+        )
+
+
+class AsyncSingleSelectDropdown(AsyncBaseDropdown):
+    """This class implements the asyncio counterpart of SingleSelectDropdown.
+
+    Examples
+    --------
+        dropdown = AsyncSingleSelectDropdown(parent=browser)
+        await dropdown.select_option("Sofia")
+    """
+
+    def __init__(
+        self,
+        parent: Optional[
+            Union[AsyncBaseWebElement, AsyncWebElement, AsyncBaseBrowser]
+        ] = None,
+        locator: Tuple[By, str] = SingleSelectDropdown.DEFAULT_LOCATOR,
+        web_element: Optional[AsyncWebElement] = None,
+        expanded_locator: Tuple[
+            By, str
+        ] = SingleSelectDropdown.DEFAULT_EXPANDED_LOCATOR,
+        expanded_options_loc: Tuple[
+            By, str
+        ] = SingleSelectDropdown.DEFAULT_EXPANDED_OPTIONS_LOCATOR,
+    ):
+        # pylint: disable=duplicate-code
+        super().__init__(
+            parent=parent,
+            locator=locator,
+            expanded_locator=expanded_locator,
+            expanded_options_loc=expanded_options_loc,
+            web_element=web_element,
+        )
+
+    async def select_option(self, option_value: Union[str, int]):
+        """Selects an option from the dropdown if it's not already set.
+
+        Parameters
+        ----------
+        option_value : Union[str, int]
+            The option to select.
+        """
+        option_value = str(option_value)
+        if (await self.text()).lower() == option_value.lower():
+            return
+
+        await self.expand_dropdown()
+        option = [
+            web_element
+            for text, web_element in await self.options()
+            if text.lower() == option_value.lower()
+        ]
+        if not option:
+            raise UserWarning(f"The option with value: {option_value}, was not found!")
+
+        await option[0].click()
+        LOGGER.info(
+            "Selected option: %s, of dropdown with locator: %s.",
+            option_value,
+            self.locator,
+        )
+
+
+class AsyncMultiSelectDropdown(AsyncBaseDropdown):
+    """This class implements the asyncio counterpart of MultiSelectDropdown.
+
+    Examples
+    --------
+        dropdown = AsyncMultiSelectDropdown(parent=browser)
+        await dropdown.select_options(["Sofia", "Plovdiv"])
+    """
+
+    def __init__(
+        self,
+        parent: Optional[
+            Union[AsyncBaseWebElement, AsyncWebElement, AsyncBaseBrowser]
+        ] = None,
+        locator: Tuple[By, str] = MultiSelectDropdown.DEFAULT_LOCATOR,
+        web_element: Optional[AsyncWebElement] = None,
+        expanded_locator: Tuple[By, str] = MultiSelectDropdown.DEFAULT_EXPANDED_LOCATOR,
+        expanded_options_loc: Tuple[
+            By, str
+        ] = MultiSelectDropdown.DEFAULT_EXPANDED_OPTIONS_LOCATOR,
+        apply_button_locator: Tuple[
+            By, str
+        ] = MultiSelectExpandedDropdown.DEFAULT_APPLY_BUTTON_LOCATOR,
+    ):
+        # pylint: disable=duplicate-code
+        super().__init__(
+            parent=parent,
+            locator=locator,
+            expanded_locator=expanded_locator,
+            expanded_options_loc=expanded_options_loc,
+            web_element=web_element,
+        )
+        self._apply_button_locator = apply_button_locator
+
+    async def select_options(self, options_values: List[Union[str, int]]):
+        """Selects the options from the dropdown which are not already selected and applies the
+        selection.
+
+        Parameters
+        ----------
+        options_values : List[Union[str, int]]
+            The options to select.
+        """
+        # The selected options are a comma-separated string value of the dropdown, as in
+        # MultiSelectDropdown
+        selected = (await self.text()).lower().split(", ")
+        missing = [
+            str(value) for value in options_values if str(value).lower() not in selected
+        ]
+        if not missing:
+            return
+
+        expanded = await self.expand_dropdown()
+        options = await self.options()
+        for option in missing:
+            filtered = [
+                web_element
+                for text, web_element in options
+                if option.lower() in text.lower()
+            ]
+            if not filtered:
+                raise UserWarning(
+                    f"The option {option} was not found in dropdown with locator: {self.locator}"
+                )
+            await filtered[0].click()
+            LOGGER.info(
+                "Selected option: %s, for multi-select dropdown with locator: %s",
+                option,
+                self.locator,
+            )
+
+        await AsyncBaseWebElement(
+            parent=expanded, locator=self._apply_button_locator
+        ).click()
+        LOGGER.info(
+            "Applied the options: %s, selected for the multi-select dropdown with locator: %s",
+            options_values,
+            self.locator,
+        )
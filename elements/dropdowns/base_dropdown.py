@@ -1,20 +1,73 @@
 """This module contains an abstraction of base dropdown."""
 from __future__ import annotations
 
-import logging
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import List, NamedTuple, Optional, Tuple, Union
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
-from elements.collection import Collection
-from settings import LOGGING_LEVEL
-
-logging.basicConfig(level=LOGGING_LEVEL)
+from elements.element_properties import ElementProperties
+from elements.locator_chain import LOCATOR_FUNCTIONS, to_script_locator
+from instrumentation.actions import instrumented
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Defines waitForOptions, which finds the options under an expanded dropdown and passes them to
+# resolve on every mutation under the expanded dropdown and, as a fallback, on a fixed interval.
+# As soon as resolve returns a value other than undefined, it's passed to the callback done, or
+# null is passed on timeout.
+OPTIONS_WAIT_FUNCTION = LOCATOR_FUNCTIONS + """
+function optionText(option) {
+    return (option.innerText || option.textContent || '').trim();
+}
+function waitForOptions(container, by, value, timeout, interval, resolve, done) {
+    var deadline = Date.now() + timeout, finished = false, observer, timer;
+    function finish(result) {
+        if (finished) { return; }
+        finished = true;
+        if (observer) { observer.disconnect(); }
+        clearTimeout(timer);
+        done(result);
+    }
+    function check() {
+        var result = resolve(findAll(container, by, value));
+        if (result !== undefined) {
+            finish(result);
+        } else if (Date.now() > deadline) {
+            finish(null);
+        }
+        return finished;
+    }
+    function poll() {
+        if (!check()) { timer = setTimeout(poll, interval); }
+    }
+    if (!check()) {
+        observer = new MutationObserver(check);
+        observer.observe(container, {
+            childList: true, subtree: true, characterData: true, attributes: true
+        });
+        timer = setTimeout(poll, interval);
+    }
+}
+"""
+# Waits for the options to be present and all have a text, and returns them with their texts.
+# arguments: expanded dropdown, options locator strategy, options locator value, timeout (ms),
+# polling interval (ms), callback
+OPTIONS_WAIT_SCRIPT = OPTIONS_WAIT_FUNCTION + """
+var args = Array.prototype.slice.call(arguments, 0, 5);
+waitForOptions.apply(null, args.concat([function (options) {
+    var texts = options.map(optionText);
+    if (options.length && texts.every(function (text) { return text; })) {
+        return {options: options, texts: texts};
+    }
+}, arguments[arguments.length - 1]]));
+"""
 
 
 class BaseDropdown(BaseWebElement, metaclass=ABCMeta):
@@ -38,18 +91,28 @@ class BaseDropdown(BaseWebElement, metaclass=ABCMeta):
         """An abstract method which needs to be implemented by each type of dropdown - single
         select, multi select, etc."""
 
-    def is_expanded(self) -> bool:
+    @instrumented
+    def is_expanded(self, properties: Optional[ElementProperties] = None) -> bool:
         """Determines whether the dropdown is currently expanded or not.
 
+        Parameters
+        ----------
+        properties : Optional[ElementProperties]
+            Properties of the dropdown already read with read(...), including
+            "attr:aria-expanded", in which case no call to the browser is made. Defaults to None.
+
         Returns
         -------
         bool
         """
-        return (
-            "true" in self.get_attribute_value(attribute_name="aria-expanded").lower()
-        )
+        if properties is None:
+            properties = self.read("attr:aria-expanded")
+        return "true" in (properties.attr("aria-expanded") or "").lower()
 
-    def expand_dropdown(self, on_hover: bool = False):
+    @instrumented
+    def expand_dropdown(
+        self, on_hover: bool = False, properties: Optional[ElementProperties] = None
+    ):
         """Expands the dropdown and returns its expanded container.
 
         Parameters
@@ -57,26 +120,39 @@ class BaseDropdown(BaseWebElement, metaclass=ABCMeta):
         on_hover : bool
             Controls whether the dropdown is expanded via a hover. If False, then the dropdown
             button is clicked, instead of hovered on. Defaults to False.
+        properties : Optional[ElementProperties]
+            See is_expanded. Defaults to None.
         """
-        from settings import GLOBAL_DRIVER
-
-        if not self.is_expanded():
+        if not self.is_expanded(properties=properties):
             if on_hover:
-                ActionChains(GLOBAL_DRIVER).move_to_element(
-                    self.find_element()
-                ).perform()
+                self._with_element(
+                    lambda web_element: ActionChains(self.driver)
+                    .move_to_element(web_element)
+                    .perform()
+                )
+                self._invalidate_element_cache()
             else:
                 self.click()
-            logging.info("Expanded dropdown with locator: %s.", self.locator)
+            LOGGER.info("Expanded dropdown with locator: %s.", self.locator)
         return self.expanded
 
 
+class DropdownOption(NamedTuple):
+    """An option of an expanded dropdown together with its text, as returned by
+    BaseExpandedDropdown.options."""
+
+    text: str
+    element: BaseWebElement
+
+
 class BaseExpandedDropdown(BaseWebElement):
     """This class contains an abstraction of a base expanded dropdown."""
 
     # Maximum time to wait for the options to have a value as some sites tend to load slowly
     OPTIONS_VALUES_TIMEOUT = 10  # seconds
-    OPTIONS_VALUES_INTERVAL = 1  # seconds
+    # The options are checked on every change of the expanded dropdown, as well as on this
+    # interval, in case a change isn't observable, e.g. a text set via CSS
+    OPTIONS_VALUES_INTERVAL = 0.1  # seconds
 
     def __init__(
         self,
@@ -88,7 +164,48 @@ class BaseExpandedDropdown(BaseWebElement):
         super().__init__(parent=parent, locator=locator, web_element=web_element)
         self.options_locator = options_locator
 
+    @instrumented
+    def options(self) -> List[DropdownOption]:
+        """Waits for the options of the dropdown to be present and all have a text, and returns
+        them together with their texts. The wait happens in the browser and returns as soon as
+        the options are loaded, hence it takes a single call to the browser.
+
+        Returns
+        -------
+        List[DropdownOption]
+
+        Raises
+        ------
+        TimeoutException
+            If the options did not load within OPTIONS_VALUES_TIMEOUT seconds.
+        """
+        by, value = to_script_locator(self.options_locator)
+        timeout = type(self).OPTIONS_VALUES_TIMEOUT
+        # The options are looked up under the expanded dropdown container. If it's not a parent
+        # of the options, change OPTIONS_WAIT_SCRIPT to look them up in the document instead
+        loaded = self.execute_async_script(
+            OPTIONS_WAIT_SCRIPT,
+            by,
+            value,
+            timeout * 1000,
+            type(self).OPTIONS_VALUES_INTERVAL * 1000,
+        )
+        if loaded is None:
+            raise TimeoutException(
+                f"The options with locator {self.options_locator} of expanded dropdown with "
+                f"locator {self.locator} did not load within {timeout} seconds!"
+            )
+
+        LOGGER.info(
+            "Got the options of expanded dropdown with locator: %s.", self.locator
+        )
+        return [
+            DropdownOption(text=text, element=BaseWebElement(web_element=web_element))
+            for text, web_element in zip(loaded["texts"], loaded["options"])
+        ]
+
     @property
+    @instrumented
     def options_as_web_elements(self) -> List[BaseWebElement]:
         """
 
@@ -97,33 +214,10 @@ class BaseExpandedDropdown(BaseWebElement):
         List[BaseWebElement]
             The options of the dropdown as a list of BaseWebElement[s].
         """
-        import time
-
-        self.find_element()
-
-        # The waiting mechanism below is added to support some slow sites which tend to take some
-        # time before the list of dropdown options actually loads together with the option values,
-        # after expanding the dropdown
-        timeout = time.time() + type(self).OPTIONS_VALUES_TIMEOUT
-        while time.time() < timeout:
-            options = Collection(
-                # If the expanded dropdown container element is not a child of the dropdown itself,
-                # modify the parent argument to pass the driver instead (import the global one)
-                parent=self.find_element(),
-                children_locator=self.options_locator,
-            ).find_elements()
-            filtered = list(filter(lambda opt: not opt.text, options))
-
-            if not options or filtered:
-                time.sleep(type(self).OPTIONS_VALUES_INTERVAL)
-            else:
-                logging.info(
-                    "Got the options of expanded dropdown with locator: %s.",
-                    self.locator,
-                )
-                return options
+        return [option.element for option in self.options()]
 
     @property
+    @instrumented
     def options_as_strings(self) -> List[str]:
         """
 
@@ -132,4 +226,4 @@ class BaseExpandedDropdown(BaseWebElement):
         List[str]
             The options of the dropdown as a list of strings.
         """
-        return [element.text for element in self.options_as_web_elements]
+        return [option.text for option in self.options()]
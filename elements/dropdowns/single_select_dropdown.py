@@ -1,18 +1,64 @@
 """The module contains an abstraction implementation of a single select dropdown type of element."""
 from __future__ import annotations
 
-import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, Tuple, Union
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
-from elements.dropdowns.base_dropdown import BaseDropdown, BaseExpandedDropdown
-from settings import LOGGING_LEVEL
+from elements.dropdowns.base_dropdown import (
+    OPTIONS_WAIT_FUNCTION,
+    BaseDropdown,
+    BaseExpandedDropdown,
+)
+from elements.locator_chain import to_script_locator
+from instrumentation.actions import instrumented
+from logger import get_logger, log_timing
 
-logging.basicConfig(level=LOGGING_LEVEL)
+LOGGER = get_logger(__name__)
+# The maximum number of options whose index SingleSelectDropdown.option_index remembers
+OPTION_INDEX_CACHE_SIZE = 512
+
+# The key of an option in the OptionIndexCache: dropdown locator, options locator, normalized text
+_OptionKey = Tuple[Tuple[By, str], Tuple[By, str], str]
+
+# Waits for the option with the given normalized text and returns it with its index. The option
+# at the hint index is checked first. If all options are loaded and none matches, index is -1.
+# arguments: expanded dropdown, options locator strategy, options locator value, timeout (ms),
+# polling interval (ms), normalized text, hint index or null, callback
+FIND_OPTION_SCRIPT = OPTIONS_WAIT_FUNCTION + """
+var args = Array.prototype.slice.call(arguments, 0, 5), text = arguments[5], hint = arguments[6];
+function normalize(value) {
+    return value.replace(/\\s+/g, ' ').toLowerCase();
+}
+waitForOptions.apply(null, args.concat([function (options) {
+    if (hint !== null && options[hint] && normalize(optionText(options[hint])) === text) {
+        return {option: options[hint], index: hint};
+    }
+    var loaded = options.length > 0;
+    for (var i = 0; i < options.length; i++) {
+        var optionValue = optionText(options[i]);
+        if (!optionValue) {
+            loaded = false;
+        } else if (normalize(optionValue) === text) {
+            return {option: options[i], index: i};
+        }
+    }
+    if (loaded) {
+        return {option: null, index: -1};
+    }
+}, arguments[arguments.length - 1]]));
+"""
+
+
+def _normalize_option_text(text: str) -> str:
+    """Normalizes an option's text for comparison, the same way FIND_OPTION_SCRIPT does."""
+    return " ".join(text.split()).lower()
 
 
 class SingleSelectExpandedDropdown(BaseExpandedDropdown):
@@ -33,6 +79,92 @@ class SingleSelectExpandedDropdown(BaseExpandedDropdown):
             web_element=web_element,
         )
 
+    @instrumented
+    def find_option(
+        self, option_value: str, hint_index: Optional[int] = None
+    ) -> Tuple[int, Optional[BaseWebElement]]:
+        """Waits for the options of the dropdown to load and finds the option whose text matches
+        option_value, case-insensitively and ignoring extra whitespace, with a single call to the
+        browser, regardless of the number of options.
+
+        Parameters
+        ----------
+        option_value : str
+            The text of the option.
+        hint_index : Optional[int]
+            The index at which the option is expected to be, e.g. where it was last time, which is
+            checked before all other options. Defaults to None.
+
+        Returns
+        -------
+        Tuple[int, Optional[BaseWebElement]]
+            The index of the option and the option itself, or -1 and None if it's not found.
+
+        Raises
+        ------
+        TimeoutException
+            If the options did not load within OPTIONS_VALUES_TIMEOUT seconds.
+        """
+        by, value = to_script_locator(self.options_locator)
+        timeout = type(self).OPTIONS_VALUES_TIMEOUT
+        found = self.execute_async_script(
+            FIND_OPTION_SCRIPT,
+            by,
+            value,
+            timeout * 1000,
+            type(self).OPTIONS_VALUES_INTERVAL * 1000,
+            _normalize_option_text(option_value),
+            hint_index,
+        )
+        if found is None:
+            raise TimeoutException(
+                f"The options with locator {self.options_locator} of expanded dropdown with "
+                f"locator {self.locator} did not load within {timeout} seconds!"
+            )
+        if found["option"] is None:
+            return -1, None
+        return found["index"], BaseWebElement(web_element=found["option"])
+
+
+class OptionIndexCache:
+    """This class implements a cache of the index at which each option was found, of up to
+    max_size options, evicting the least recently used ones first. It's safe to use from multiple
+    threads, e.g. by dropdowns of different browsers."""
+
+    def __init__(self, max_size: int = OPTION_INDEX_CACHE_SIZE):
+        self.max_size = max_size
+        self._indexes: "OrderedDict[_OptionKey, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def get(self, key: _OptionKey) -> Optional[int]:
+        """Returns the index at which the option was found last time, if any.
+
+        Returns
+        -------
+        Optional[int]
+        """
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+            return index
+
+    def put(self, key: _OptionKey, index: int):
+        """Remembers the index at which the option was found."""
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_size:
+                self._indexes.popitem(last=False)
+
+    def discard(self, key: _OptionKey):
+        """Forgets the index of the option, e.g. once it's no longer found."""
+        with self._lock:
+            self._indexes.pop(key, None)
+
 
 class SingleSelectDropdown(BaseDropdown):
     """This class implements an abstraction of a single-select dropdown.
@@ -55,6 +187,12 @@ class SingleSelectDropdown(BaseDropdown):
     )
     DEFAULT_EXPANDED_OPTIONS_LOCATOR = (By.CSS_SELECTOR, 'li[class*="dropdown-item"]')
 
+    # The index at which each option was found last time, per dropdown and options locator, which
+    # is checked first on next selection. Shared by all dropdowns, as dropdowns with the same
+    # locators usually have the same options, e.g. a country list, and bounded, see
+    # OPTION_INDEX_CACHE_SIZE
+    option_index = OptionIndexCache()
+
     def __init__(
         self,
         parent: Optional[Union[BaseWebElement, WebElement, WebDriver]] = None,
@@ -80,38 +218,52 @@ class SingleSelectDropdown(BaseDropdown):
         -------
         SingleSelectExpandedDropdown
         """
-        from settings import GLOBAL_DRIVER
-
         return SingleSelectExpandedDropdown(
-            parent=GLOBAL_DRIVER,
+            parent=self.driver,
             locator=self._expanded_locator,
             options_locator=self._expanded_options_locator,
         )
 
+    @instrumented
     def select_option(self, option_value: Union[str, int]):
         """Selects an option from the dropdown if it's not already set.
 
+        The option is found in the browser with a single call, regardless of the number of
+        options, see SingleSelectExpandedDropdown.find_option.
+
         Parameters
         ----------
         option_value : Union[str, int]
             The option to select.
         """
+        option_value = str(option_value)
+        properties = self.read("text", "attr:aria-expanded")
         # Do nothing if the currently selected option is the one received as an argument
-        if self.text.lower() == option_value.lower():
+        if _normalize_option_text(properties.text or "") == _normalize_option_text(
+            option_value
+        ):
             return
 
-        option = list(
-            filter(
-                lambda opt: opt.text.lower() == option_value.lower(),
-                self.expand_dropdown().options_as_web_elements,
-            )
+        key = (
+            self.locator,
+            self._expanded_options_locator,
+            _normalize_option_text(option_value),
         )
-        if not len(option):
-            raise UserWarning(f"The option with value: {option_value}, was not found!")
-
-        option[0].click()
-        logging.info(
-            "Selected option: %s, of dropdown with locator: %s.",
+        with log_timing(
+            LOGGER,
+            "select_option",
+            "Selected option: %s, of dropdown with locator: %s",
             option_value,
             self.locator,
-        )
+            locator=self.locator,
+        ):
+            index, option = self.expand_dropdown(properties=properties).find_option(
+                option_value=option_value, hint_index=type(self).option_index.get(key)
+            )
+            if option is None:
+                type(self).option_index.discard(key)
+                raise UserWarning(
+                    f"The option with value: {option_value}, was not found!"
+                )
+            type(self).option_index.put(key, index)
+            option.click()
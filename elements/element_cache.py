@@ -0,0 +1,146 @@
+"""This module contains an implementation of an opt-in cache of web elements, which trusts the
+elements found in a page for as long as no elements were removed from the page since."""
+import time
+from typing import Dict, Optional, Union
+from weakref import WeakKeyDictionary
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from settings import DOM_EPOCH_MAX_AGE
+
+# Returns the page's DOM epoch, which changes whenever an element is removed from the page, i.e.
+# whenever a previously found element may have become stale. The epoch is tracked by a
+# MutationObserver installed on first use and is prefixed with a random id, so a navigation, which
+# drops the observer together with the page, always results in a new epoch
+DOM_EPOCH_SCRIPT = """
+if (!window.__domEpoch) {
+    var epoch = {id: Math.random().toString(36).slice(2), count: 0};
+    new MutationObserver(function (mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var removed = mutations[i].removedNodes;
+            for (var j = 0; j < removed.length; j++) {
+                if (removed[j].nodeType === Node.ELEMENT_NODE) {
+                    epoch.count++;
+                    return;
+                }
+            }
+        }
+    }).observe(document, {childList: true, subtree: true});
+    window.__domEpoch = epoch;
+}
+return window.__domEpoch.id + ':' + window.__domEpoch.count;
+"""
+
+_ELEMENT_CACHES: "WeakKeyDictionary[WebDriver, ElementCache]" = WeakKeyDictionary()
+
+
+class ElementCache:
+    """This class implements a cache of the web elements found with a given driver. Instead of
+    checking whether a found element is stale before every use, which costs a call to the browser
+    per check, the cache compares the page's DOM epoch with the epoch at which the element was
+    found. The epoch itself is read at most once per max_epoch_age seconds, and whenever the
+    framework performed an action which may have changed the page, e.g. a click.
+
+    Examples
+    --------
+        cache = enable_element_cache(driver=browser.driver)
+        ...
+        print(cache.stats)
+    """
+
+    def __init__(self, max_epoch_age: float = DOM_EPOCH_MAX_AGE):
+        self.max_epoch_age = max_epoch_age
+        self.hits = 0
+        self.misses = 0
+        self.epoch_reads = 0
+        self._epoch: Optional[str] = None
+        self._epoch_read_at = 0.0
+
+    def current_epoch(self, driver: WebDriver) -> str:
+        """Returns the page's current DOM epoch, reading it from the browser only if the last
+        read one is older than max_epoch_age or was invalidated.
+
+        Returns
+        -------
+        str
+        """
+        now = time.monotonic()
+        if self._epoch is None or now - self._epoch_read_at > self.max_epoch_age:
+            self._epoch = driver.execute_script(DOM_EPOCH_SCRIPT)
+            self._epoch_read_at = now
+            self.epoch_reads += 1
+        return self._epoch
+
+    def is_current(self, epoch: Optional[str], driver: WebDriver) -> bool:
+        """Determines whether an element found at the given epoch can still be trusted, and
+        counts the outcome as a hit or a miss.
+
+        Returns
+        -------
+        bool
+        """
+        if epoch is not None and epoch == self.current_epoch(driver=driver):
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def invalidate(self):
+        """Forces the epoch to be read from the browser on next use. To be called after actions
+        which may change the page."""
+        self._epoch = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and epoch read counters of the cache.
+
+        Returns
+        -------
+        Dict[str, int]
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "epoch_reads": self.epoch_reads,
+        }
+
+    def reset_stats(self):
+        """Resets the hit, miss and epoch read counters of the cache."""
+        self.hits = self.misses = self.epoch_reads = 0
+
+
+def driver_of(parent: Union[WebDriver, WebElement]) -> WebDriver:
+    """Returns the WebDriver of a parent, which is either the WebDriver itself or a WebElement
+    found with it."""
+    return parent.parent if isinstance(parent, WebElement) else parent
+
+
+def enable_element_cache(
+    driver: WebDriver, max_epoch_age: float = DOM_EPOCH_MAX_AGE
+) -> ElementCache:
+    """Enables the element cache for all elements found with the given driver.
+
+    Returns
+    -------
+    ElementCache
+        The driver's cache, which exposes the hit/miss counters.
+    """
+    if driver not in _ELEMENT_CACHES:
+        _ELEMENT_CACHES[driver] = ElementCache(max_epoch_age=max_epoch_age)
+    return _ELEMENT_CACHES[driver]
+
+
+def disable_element_cache(driver: WebDriver):
+    """Disables the element cache for the given driver."""
+    _ELEMENT_CACHES.pop(driver, None)
+
+
+def get_element_cache(driver: WebDriver) -> Optional[ElementCache]:
+    """Returns the element cache of the given driver, or None if it's not enabled.
+
+    Returns
+    -------
+    Optional[ElementCache]
+    """
+    return _ELEMENT_CACHES.get(driver) if driver is not None else None
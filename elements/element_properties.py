@@ -0,0 +1,128 @@
+"""This module contains an implementation of reading multiple properties of a web element with a
+single call to the browser, see BaseWebElement.read."""
+from typing import Any, Dict, Iterator, Mapping, Sequence
+
+# The properties which can be read by name. Attributes, DOM properties and computed CSS values are
+# read with the "attr:", "prop:" and "css:" prefixes respectively, e.g. "attr:class"
+PROPERTY_NAMES = ("text", "tag", "value", "enabled", "displayed", "selected", "rect")
+PROPERTY_PREFIXES = ("attr:", "prop:", "css:")
+BOOLEAN_PROPERTIES = ("enabled", "displayed", "selected")
+
+# Reads the given properties of an element. arguments: element, list of property names.
+# "displayed" approximates WebElement.is_displayed: the element is displayed if it has a layout
+# box, isn't hidden via visibility and none of its ancestors is fully transparent
+READ_PROPERTIES_SCRIPT = """
+var element = arguments[0], names = arguments[1], values = {};
+function isDisplayed(el) {
+    if (!el.getClientRects().length) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+        return false;
+    }
+    for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+        if (window.getComputedStyle(node).opacity === '0') {
+            return false;
+        }
+    }
+    return true;
+}
+for (var i = 0; i < names.length; i++) {
+    var name = names[i], value = null;
+    if (name === 'text') {
+        value = (element.innerText || element.textContent || '').trim();
+    } else if (name === 'tag') {
+        value = element.tagName.toLowerCase();
+    } else if (name === 'value') {
+        value = element.value === undefined ? null : element.value;
+    } else if (name === 'enabled') {
+        value = !(element.matches && element.matches(':disabled'));
+    } else if (name === 'displayed') {
+        value = isDisplayed(element);
+    } else if (name === 'selected') {
+        value = !!(element.checked || element.selected);
+    } else if (name === 'rect') {
+        var rect = element.getBoundingClientRect();
+        value = {x: rect.x, y: rect.y, width: rect.width, height: rect.height};
+    } else if (name.indexOf('attr:') === 0) {
+        value = element.getAttribute(name.slice(5));
+    } else if (name.indexOf('prop:') === 0) {
+        value = element[name.slice(5)];
+    } else if (name.indexOf('css:') === 0) {
+        value = window.getComputedStyle(element).getPropertyValue(name.slice(4));
+    }
+    values[name] = value;
+}
+return values;
+"""
+
+
+def validate_property_names(names: Sequence[str]):
+    """Raises a ValueError if any of the names is not a property which can be read.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        The names of the properties, e.g. ["text", "attr:class", "enabled"].
+    """
+    invalid = [
+        name
+        for name in names
+        if name not in PROPERTY_NAMES and not name.startswith(PROPERTY_PREFIXES)
+    ]
+    if invalid:
+        raise ValueError(
+            f"Cannot read the properties: {invalid}! Supported are {PROPERTY_NAMES} and names "
+            f"prefixed with {PROPERTY_PREFIXES}."
+        )
+
+
+class ElementProperties(Mapping):
+    """This class implements a read-only record of the properties of a web element, as returned by
+    BaseWebElement.read. The values are accessible by property name, and the named properties also
+    as attributes.
+
+    Examples
+    --------
+        properties = element.read("text", "attr:class", "enabled")
+        properties.text
+        properties["attr:class"]
+        properties.attr("class")
+    """
+
+    def __init__(self, values: Dict[str, Any]):
+        self._values = {
+            name: bool(value) if name in BOOLEAN_PROPERTIES else value
+            for name, value in values.items()
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        return self._values[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__["_values"][name]
+        except KeyError as exc:
+            raise AttributeError(f"The property {name} was not read!") from exc
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values})"
+
+    def attr(self, name: str) -> Any:
+        """Returns the value of the attribute, which was read as "attr:<name>"."""
+        return self[f"attr:{name}"]
+
+    def prop(self, name: str) -> Any:
+        """Returns the value of the DOM property, which was read as "prop:<name>"."""
+        return self[f"prop:{name}"]
+
+    def css(self, name: str) -> Any:
+        """Returns the computed CSS value, which was read as "css:<name>"."""
+        return self[f"css:{name}"]
@@ -1,7 +1,6 @@
 """This module contains an implementation of an input type of element in a given UI."""
 from __future__ import annotations
 
-import logging
 from typing import Optional, Tuple, Union
 
 from selenium.webdriver.common.action_chains import ActionChains
@@ -11,9 +10,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
-from settings import LOGGING_LEVEL
+from instrumentation.actions import instrumented
+from logger import get_logger, log_timing
 
-logging.basicConfig(level=LOGGING_LEVEL)
+LOGGER = get_logger(__name__)
 
 
 class Input(BaseWebElement):
@@ -37,6 +37,7 @@ class Input(BaseWebElement):
     ):
         super().__init__(parent=parent, locator=locator, web_element=web_element)
 
+    @instrumented
     def clear_input(self) -> Input:
         """Clears the input of any characters currently typed in. The method clears the input
         value by doing a triple click to select all text and then clicking the backspace button.
@@ -47,17 +48,18 @@ class Input(BaseWebElement):
         Input
             Returns the instance itself to allow for a fluent interface.
         """
-        from settings import GLOBAL_DRIVER
-
-        ActionChains(GLOBAL_DRIVER).double_click(
-            on_element=self.find_element()
-        ).click().perform()
-        self.web_element.send_keys(Keys.BACK_SPACE)
-        logging.info(
-            "Cleared the input of Input element with locator: %s", self.locator
+        self._with_element(
+            lambda web_element: ActionChains(self.driver)
+            .double_click(on_element=web_element)
+            .click()
+            .perform()
         )
+        self.web_element.send_keys(Keys.BACK_SPACE)
+        self._invalidate_element_cache()
+        LOGGER.info("Cleared the input of Input element with locator: %s", self.locator)
         return self
 
+    @instrumented
     def enter_value(self, value: Union[str, int], clear_first: bool = True) -> Input:
         """Types in given value into the input.
 
@@ -73,16 +75,21 @@ class Input(BaseWebElement):
         Input
             Returns the instance itself to allow for a fluent interface.
         """
-        clear_first and self.clear_input()
-        self.find_element().send_keys(value)
-        logging.info(
+        with log_timing(
+            LOGGER,
+            "enter_value",
             "Entered the value: %s to the Input element with locator: %s",
             value,
             self.locator,
-        )
+            locator=self.locator,
+        ):
+            clear_first and self.clear_input()
+            self._with_element(lambda web_element: web_element.send_keys(value))
+        self._invalidate_element_cache()
         return self
 
     @property
+    @instrumented
     def current_input(self) -> str:
         """Retrieves and returns the current input value via the 'value' attribute.
 
@@ -90,7 +97,7 @@ class Input(BaseWebElement):
         -------
         str
         """
-        logging.info(
+        LOGGER.info(
             "Retrieving the value of Input element with locator: %s", self.locator
         )
         return self.get_attribute_value(attribute_name="value")
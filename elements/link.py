@@ -6,6 +6,8 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
+from elements.element_properties import ElementProperties
+from instrumentation.actions import instrumented
 
 
 class Link(BaseWebElement):
@@ -29,15 +31,25 @@ class Link(BaseWebElement):
     ):
         super().__init__(parent=parent, locator=locator, web_element=web_element)
 
-    def is_active(self) -> bool:
+    @instrumented
+    def is_active(self, properties: Optional[ElementProperties] = None) -> bool:
         """Determines whether the link is active or not, i.e. is it currently selected or not.
 
+        Parameters
+        ----------
+        properties : Optional[ElementProperties]
+            Properties of the link already read with read(...), including "attr:class", in which
+            case no call to the browser is made. Defaults to None.
+
         Returns
         -------
         bool
         """
-        return "active" in self.get_attribute_value("class").lower()
+        if properties is None:
+            properties = self.read("attr:class")
+        return "active" in (properties.attr("class") or "").lower()
 
+    @instrumented
     def open_link(self):
         """Opens the link by clicking on the element."""
         if not self.is_active():
@@ -0,0 +1,140 @@
+"""This module contains an implementation of finding a chain of nested elements, i.e. an element
+and its ancestors identified by their own locators, with a single call to the browser.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from elements.waits import WaitPolicy
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Functions to find the first or all elements matching a locator under a given context node,
+# mirroring WebDriver's find_element(s) for the css selector, xpath and link text strategies
+LOCATOR_FUNCTIONS = """
+function linksByText(context, text, partial) {
+    var links = context.querySelectorAll('a'), matches = [];
+    for (var i = 0; i < links.length; i++) {
+        var linkText = (links[i].innerText || links[i].textContent || '').trim();
+        if (partial ? linkText.indexOf(text) !== -1 : linkText === text) {
+            matches.push(links[i]);
+        }
+    }
+    return matches;
+}
+function findAll(context, by, value) {
+    if (by === 'css selector') {
+        return Array.prototype.slice.call(context.querySelectorAll(value));
+    }
+    if (by === 'xpath') {
+        var result = (context.ownerDocument || context).evaluate(
+            value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        ), nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (by === 'link text' || by === 'partial link text') {
+        return linksByText(context, value, by === 'partial link text');
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function findFirst(context, by, value) {
+    if (by === 'css selector') {
+        return context.querySelector(value);
+    }
+    if (by === 'xpath') {
+        return (context.ownerDocument || context).evaluate(
+            value, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return findAll(context, by, value)[0] || null;
+}
+"""
+
+# Finds each locator's first match under the previous one's, starting from the root element, or
+# the document if the root is null. arguments: root, list of [by, value] locators. Returns the
+# elements found and the index of the locator which could not be found, if any
+LOCATOR_CHAIN_SCRIPT = LOCATOR_FUNCTIONS + """
+var context = arguments[0] || document, locators = arguments[1], found = [];
+for (var i = 0; i < locators.length; i++) {
+    context = findFirst(context, locators[i][0], locators[i][1]);
+    if (!context) {
+        return {found: found, failedStep: i};
+    }
+    found.push(context);
+}
+return {found: found, failedStep: null};
+"""
+
+
+def to_script_locator(locator: Tuple[By, str]) -> Tuple[str, str]:
+    """Converts a locator to one the locator scripts support, the same way WebDriver converts the
+    id, name, class name and tag name strategies to CSS selectors.
+
+    Returns
+    -------
+    Tuple[str, str]
+    """
+    by, value = locator
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return by, value
+
+
+def find_locator_chain(
+    driver: WebDriver,
+    root: Optional[WebElement],
+    locators: Sequence[Tuple[By, str]],
+    wait_policy: WaitPolicy,
+) -> List[WebElement]:
+    """Finds a chain of nested elements with a single call to the browser per attempt, waiting
+    for the whole chain to be present according to wait_policy.
+
+    Parameters
+    ----------
+    driver : WebDriver
+        The driver to execute the lookup with.
+    root : Optional[WebElement]
+        The element under which the first locator is looked up, or None for the whole page.
+    locators : Sequence[Tuple[By, str]]
+        The locators of the elements, outermost first. Each one is looked up under the element
+        found with the previous one.
+    wait_policy : WaitPolicy
+        How long to wait for the chain to be present and how often to poll for it.
+
+    Returns
+    -------
+    List[WebElement]
+        The elements found, outermost first.
+    """
+    script_locators = [list(to_script_locator(locator)) for locator in locators]
+    failed_step = [0]
+
+    def find_chain():
+        result = driver.execute_script(LOCATOR_CHAIN_SCRIPT, root, script_locators)
+        if result["failedStep"] is not None:
+            failed_step[0] = result["failedStep"]
+            return False
+        return result["found"]
+
+    try:
+        web_elements = wait_policy.until(method=find_chain)
+    except TimeoutException as exc:
+        raise TimeoutException(
+            f"Could not wait for the element with locator {locators[failed_step[0]]} to be "
+            f"present! Tried for {wait_policy.timeout} seconds"
+        ) from exc
+    LOGGER.info("Got elements with locator chain: %s.", locators)
+    return web_elements
@@ -1,18 +1,225 @@
 """This module contains an implementation of a table type of element in a given UI."""
 from __future__ import annotations
 
-import logging
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from elements.base_web_element import BaseWebElement
 from elements.collection import Collection
-from settings import LOGGING_LEVEL
+from instrumentation.actions import instrumented
+from logger import get_logger
 
-logging.basicConfig(level=LOGGING_LEVEL)
+LOGGER = get_logger(__name__)
+
+# Reads the text, and optionally a set of attributes, of every header and body cell of a table in
+# a single call. arguments: table, header cells selector, body rows selector, body cells selector,
+# attribute names
+TABLE_SNAPSHOT_SCRIPT = """
+var table = arguments[0], attributes = arguments[4] || [];
+function readCell(cell) {
+    var record = {text: (cell.innerText || cell.textContent || '').trim(), attributes: {}};
+    for (var i = 0; i < attributes.length; i++) {
+        record.attributes[attributes[i]] = cell.getAttribute(attributes[i]);
+    }
+    return record;
+}
+var headers = [], rows = [];
+var headerCells = table.querySelectorAll(arguments[1]);
+for (var i = 0; i < headerCells.length; i++) {
+    headers.push(readCell(headerCells[i]));
+}
+var bodyRows = table.querySelectorAll(arguments[2]);
+for (var r = 0; r < bodyRows.length; r++) {
+    var cells = bodyRows[r].querySelectorAll(arguments[3]), row = [];
+    for (var c = 0; c < cells.length; c++) {
+        row.push(readCell(cells[c]));
+    }
+    rows.push(row);
+}
+return {headers: headers, rows: rows};
+"""
+
+# Looks up a single cell of a table, or returns null if the row or the cell doesn't exist.
+# arguments: table, row index (0-based, null for the header row), column index (0-based), header
+# cells selector, body rows selector, body cells selector
+TABLE_CELL_SCRIPT = """
+var table = arguments[0], rowIndex = arguments[1], columnIndex = arguments[2];
+var row = rowIndex === null ? table : table.querySelectorAll(arguments[4])[rowIndex];
+if (!row) {
+    return null;
+}
+return row.querySelectorAll(rowIndex === null ? arguments[3] : arguments[5])[columnIndex] || null;
+"""
+
+# Returns the version of a table, which changes whenever the table's DOM changes. The version is
+# tracked by a MutationObserver installed on the table on first use and is prefixed with a random
+# id, so that a re-rendered table element never reports the version of the one it replaced
+TABLE_VERSION_FUNCTION = """
+function tableVersion(table) {
+    if (!table.__tableVersion) {
+        var version = {id: Math.random().toString(36).slice(2), count: 0};
+        new MutationObserver(function () { version.count++; }).observe(
+            table, {childList: true, subtree: true, characterData: true}
+        );
+        table.__tableVersion = version;
+    }
+    return table.__tableVersion.id + ':' + table.__tableVersion.count;
+}
+"""
+
+# Reads the titles of a table's columns together with the table's version.
+# arguments: table, header cells selector
+TABLE_HEADERS_SCRIPT = TABLE_VERSION_FUNCTION + """
+var headerCells = arguments[0].querySelectorAll(arguments[1]), titles = [];
+for (var i = 0; i < headerCells.length; i++) {
+    titles.push((headerCells[i].innerText || headerCells[i].textContent || '').trim());
+}
+return {version: tableVersion(arguments[0]), titles: titles};
+"""
+
+# Looks up the header cell and body cells of a single column, given that the table's version is
+# still the expected one (pass null to skip the check). The header is null if the version differs.
+# arguments: table, expected version, column index (0-based), header cells selector, body rows
+# selector, body cells selector
+TABLE_COLUMN_SCRIPT = TABLE_VERSION_FUNCTION + """
+var table = arguments[0], index = arguments[2], version = tableVersion(table);
+if (arguments[1] !== null && arguments[1] !== version) {
+    return {version: version, header: null, cells: []};
+}
+var header = table.querySelectorAll(arguments[3])[index] || null;
+var rows = table.querySelectorAll(arguments[4]), cells = [];
+for (var r = 0; r < rows.length; r++) {
+    cells.push(rows[r].querySelectorAll(arguments[5])[index] || null);
+}
+return {version: version, header: header, cells: cells};
+"""
+
+# Reads up to a batch size of the rendered body rows, which come after the cursor. A row's key is
+# the numeric value of its key attribute, e.g. aria-rowindex in virtualized grids, or its 1-based
+# position if the attribute is not set. A value of the attribute which is not a number is returned
+# as invalidKey, instead of the rows. arguments: table, body rows selector, body cells selector,
+# key attribute name (or null), cursor (the key of the last row read, or null), batch size
+TABLE_ROWS_BATCH_SCRIPT = TABLE_VERSION_FUNCTION + """
+var table = arguments[0], keyAttribute = arguments[3], cursor = arguments[4];
+var rows = table.querySelectorAll(arguments[1]), batch = [], keyed = false;
+for (var i = 0; i < rows.length && batch.length < arguments[5]; i++) {
+    var rawKey = keyAttribute ? rows[i].getAttribute(keyAttribute) : null;
+    keyed = rawKey !== null;
+    var key = keyed ? Number(rawKey) : i + 1;
+    if (keyed && (rawKey.trim() === '' || !isFinite(key))) {
+        return {rows: [], keyed: true, invalidKey: rawKey, version: tableVersion(table)};
+    }
+    if (cursor !== null && key <= cursor) {
+        continue;
+    }
+    var cells = rows[i].querySelectorAll(arguments[2]), texts = [];
+    for (var c = 0; c < cells.length; c++) {
+        texts.push((cells[c].innerText || cells[c].textContent || '').trim());
+    }
+    batch.push({key: key, cells: texts});
+}
+return {rows: batch, keyed: keyed, invalidKey: null, version: tableVersion(table)};
+"""
+
+# Scrolls the nearest scrollable container of the body rows, e.g. the viewport of a virtualized
+# grid, so that the last rendered row is at its bottom, and waits for the table to render more
+# rows. The page itself is never scrolled. Resolves with false straight away if there is no such
+# container or it's scrolled to the end already, or after the timeout if the table did not change.
+# arguments: table, body rows selector, timeout (ms)
+TABLE_SCROLL_SCRIPT = """
+var table = arguments[0], done = arguments[arguments.length - 1];
+var rows = table.querySelectorAll(arguments[1]);
+if (!rows.length) {
+    done(false);
+    return;
+}
+var last = rows[rows.length - 1], container = null;
+for (var node = last.parentNode; node && node !== document.body; node = node.parentNode) {
+    var overflow = window.getComputedStyle(node).overflowY;
+    if ((overflow === 'auto' || overflow === 'scroll') && node.scrollHeight > node.clientHeight) {
+        container = node;
+        break;
+    }
+}
+if (!container) {
+    done(false);
+    return;
+}
+var timer, observer = new MutationObserver(function () {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(true);
+});
+observer.observe(table, {childList: true, subtree: true, characterData: true});
+var before = container.scrollTop;
+container.scrollTop += Math.max(
+    last.getBoundingClientRect().bottom - container.getBoundingClientRect().bottom, 1
+);
+if (container.scrollTop === before) {
+    observer.disconnect();
+    done(false);
+    return;
+}
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(false);
+}, arguments[2]);
+"""
+
+# Waits for the table's version to differ from the given one, e.g. after opening another page of
+# the table. arguments: table, version, timeout (ms)
+TABLE_CHANGE_SCRIPT = TABLE_VERSION_FUNCTION + """
+var table = arguments[0], version = arguments[1], done = arguments[arguments.length - 1];
+var deadline = Date.now() + arguments[2];
+(function check() {
+    if (tableVersion(table) !== version) {
+        done(true);
+    } else if (Date.now() > deadline) {
+        done(false);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+
+class TableRow(NamedTuple):
+    """A lightweight record of a table's body row, as yielded by Table.iter_rows."""
+
+    # The row's key attribute value, e.g. aria-rowindex, or its 1-based position on the page
+    index: int
+    # The texts of the row's cells
+    cells: Tuple[str, ...]
+
+
+def _filter_column_by_title(
+    columns: List[TableColumn], column_title: str
+) -> TableColumn:
+    """Returns the column whose header title matches column_title, case-insensitively.
+
+    Raises
+    ------
+    IndexError
+        If a column with the given title is not found.
+    """
+    try:
+        col = list(
+            filter(
+                lambda col: col.column_title.lower() == column_title.lower(),
+                columns,
+            )
+        )[0]
+    except IndexError as exc:
+        raise IndexError(f"A column with title {column_title} was not found!") from exc
+    LOGGER.info("Got table column with title: %s.", column_title)
+    return col
 
 
 class TableColumn(BaseWebElement):
@@ -40,6 +247,7 @@ class TableColumn(BaseWebElement):
         """
         return self.header_cell.text
 
+    @instrumented
     def get_cell_by_row_index(self, row_index: int) -> BaseWebElement:
         """Gets and returns the cell at row identified by row_index.
 
@@ -57,6 +265,7 @@ class TableColumn(BaseWebElement):
         """
         return self.body_cells[row_index - 1]
 
+    @instrumented
     def get_cell_text_by_row_index(self, row_index: int) -> str:
         """Gets and returns the text of the cell located at the row identified by row_index.
 
@@ -73,6 +282,146 @@ class TableColumn(BaseWebElement):
         return self.get_cell_by_row_index(row_index=row_index).text
 
 
+class TableSnapshotCell(BaseWebElement):
+    """This class implements a table cell whose text and attributes were read as part of a
+    TableSnapshot. They are answered from memory, while the live web element is only looked up
+    when it's actually needed, e.g. when clicking on the cell."""
+
+    def __init__(
+        self,
+        table: Table,
+        row_index: Optional[int],
+        column_index: int,
+        text: str,
+        attributes: Optional[Dict[str, Optional[str]]] = None,
+    ):
+        super().__init__(parent=table)
+        self.row_index = row_index
+        self.column_index = column_index
+        self._text = text
+        self._attributes = attributes or {}
+
+    def find_element(self, wait_until_is_present: bool = True) -> WebElement:
+        """Looks up the cell's web element on first use and returns it as a WebElement object.
+
+        Parameters
+        ----------
+        wait_until_is_present : bool
+            Not used, as the cell is known to exist at the time the snapshot was taken. Kept for
+            compatibility with BaseWebElement.find_element.
+
+        Returns
+        -------
+        WebElement
+
+        Raises
+        ------
+        StaleElementReferenceException
+            If the cell's row or the cell itself was removed from the table since the snapshot.
+        """
+        if self.web_element is None:
+            table = self._parent
+            web_element = table.execute_script(
+                TABLE_CELL_SCRIPT,
+                self.row_index,
+                self.column_index,
+                table.HEADER_CELLS_SELECTOR,
+                table.BODY_ROWS_SELECTOR,
+                table.BODY_CELLS_SELECTOR,
+            )
+            if web_element is None:
+                row = (
+                    "header row"
+                    if self.row_index is None
+                    else f"row {self.row_index + 1}"
+                )
+                raise StaleElementReferenceException(
+                    f"The cell in the {row} and column {self.column_index + 1} of table with "
+                    f"locator {table.locator} is no longer present! Take a new snapshot."
+                )
+            self.web_element = web_element
+        return self.web_element
+
+    def get_attribute_value(self, attribute_name: str):
+        """Returns the value of the cell's attribute specified by attribute_name: str. Attributes
+        captured by the snapshot are returned without a call to the browser."""
+        if attribute_name in self._attributes:
+            return self._attributes[attribute_name]
+        return super().get_attribute_value(attribute_name=attribute_name)
+
+    @property
+    def text(self) -> str:
+        """The text of the cell at the time the snapshot was taken.
+
+        Returns
+        -------
+        str
+        """
+        return self._text
+
+
+class TableSnapshot:
+    """This class implements an in-memory copy of a table's header and body cells, read via a
+    single call to the browser. See Table.snapshot.
+
+    Examples
+    --------
+        snapshot = table.snapshot()
+        snapshot.get_column_by_column_title("Name").get_cell_text_by_row_index(3)
+        snapshot.get_column_by_column_title("Name").get_cell_by_row_index(3).click()
+    """
+
+    def __init__(
+        self,
+        header_cells: List[TableSnapshotCell],
+        rows: List[List[TableSnapshotCell]],
+    ):
+        self.header_cells = header_cells
+        self.rows = rows
+
+    @property
+    def column_titles(self) -> List[str]:
+        """Returns the titles of the table's columns.
+
+        Returns
+        -------
+        List[str]
+        """
+        return [h_cell.text for h_cell in self.header_cells]
+
+    @property
+    def columns(self) -> List[TableColumn]:
+        """Returns the columns of the table.
+
+        Returns
+        -------
+        List[TableColumn]
+            The table's columns as a list of TableColumn objects.
+        """
+        return [
+            TableColumn(
+                header_cell=h_cell,
+                body_cells=[row[index] for row in self.rows],
+            )
+            for index, h_cell in enumerate(self.header_cells)
+        ]
+
+    def get_column_by_column_title(self, column_title: str) -> TableColumn:
+        """Gets and returns the column with a header title specified by column_title.
+
+        Parameters
+        ----------
+        column_title : str
+            The header title of the column.
+
+        Returns
+        -------
+        TableColumn
+            The column as TableColumn object.
+        """
+        return _filter_column_by_title(columns=self.columns, column_title=column_title)
+
+
 class Table(BaseWebElement):
     """This class implements an abstraction of a table type of element in a UI.
 
@@ -80,22 +429,246 @@ class Table(BaseWebElement):
     --------
         table = Table(parent=some_browser.driver)
         table = Table(parent=some_element)
+        table = Table(parent=some_element, snapshot_mode=True)
+
+    When snapshot_mode is True, columns, and hence get_column_by_column_title, are answered from a
+    TableSnapshot, i.e. with a single call to the browser, which also reads the cell attributes
+    listed in snapshot_attributes.
     """
 
     # A default locator to allow for a simpler interface where the user only passes the
     # parent element. Set the value to a common selector for table elements in your project
     DEFAULT_LOCATOR = (By.CSS_SELECTOR, "table")
+    # Selectors of the table's cells, relative to the table element and its rows respectively
+    HEADER_CELLS_SELECTOR = "thead > tr > th"
+    BODY_ROWS_SELECTOR = "tbody > tr"
+    BODY_CELLS_SELECTOR = "td"
+    # How many times a column lookup is retried when the table changes in the meantime, before
+    # the lookup is done without checking the table's version
+    COLUMN_LOOKUP_ATTEMPTS = 3
+    # The default number of rows read per call by iter_rows
+    ROWS_BATCH_SIZE = 50
+    # The default key attribute of rows in virtualized tables, used by iter_rows to tell apart rows
+    # which were already read from newly rendered ones
+    ROW_KEY_ATTRIBUTE = "aria-rowindex"
+    # How long iter_rows waits for more rows to be rendered after scrolling or opening another page
+    ROWS_LOAD_TIMEOUT = 2  # seconds
 
     def __init__(
         self,
         parent: Optional[Union[BaseWebElement, WebElement, WebDriver]] = None,
         locator: Tuple[By, str] = DEFAULT_LOCATOR,
         web_element: Optional[WebElement] = None,
+        snapshot_mode: bool = False,
+        snapshot_attributes: Optional[Sequence[str]] = None,
     ):
         super().__init__(parent=parent, locator=locator, web_element=web_element)
+        self.snapshot_mode = snapshot_mode
+        self.snapshot_attributes = snapshot_attributes
+        # Maps the casefolded column titles to their 0-based column index. Built on first lookup
+        # and rebuilt whenever the table's version differs from _column_index_version
+        self._column_index: Optional[Dict[str, int]] = None
+        self._column_index_version: Optional[str] = None
+
+    def _build_column_index(self):
+        """Reads the column titles of the table and maps them to their column index."""
+        data = self.execute_script(TABLE_HEADERS_SCRIPT, self.HEADER_CELLS_SELECTOR)
+        column_index: Dict[str, int] = {}
+        for index, title in enumerate(data["titles"]):
+            # The first column with a given title wins, as with a lookup through the columns
+            column_index.setdefault(title.casefold(), index)
+        self._column_index = column_index
+        self._column_index_version = data["version"]
+        LOGGER.info(
+            "Indexed the columns of table with locator: %s, at version: %s.",
+            self.locator,
+            self._column_index_version,
+        )
+
+    def invalidate_column_index(self):
+        """Drops the column title index, so that the next column lookup rebuilds it. Only needed
+        when the table is changed in a way its version does not reflect."""
+        self._column_index = None
+        self._column_index_version = None
+
+    @instrumented
+    def snapshot(self, attributes: Optional[Sequence[str]] = None) -> TableSnapshot:
+        """Reads the text of all header and body cells of the table, and optionally the given
+        attributes of each cell, with a single call to the browser.
+
+        Parameters
+        ----------
+        attributes : Optional[Sequence[str]]
+            The names of the cell attributes to read, e.g. ["class", "aria-selected"]. Defaults
+            to the snapshot_attributes set in the constructor.
+
+        Returns
+        -------
+        TableSnapshot
+        """
+        attributes = list(attributes or self.snapshot_attributes or [])
+        data = self.execute_script(
+            TABLE_SNAPSHOT_SCRIPT,
+            self.HEADER_CELLS_SELECTOR,
+            self.BODY_ROWS_SELECTOR,
+            self.BODY_CELLS_SELECTOR,
+            attributes,
+        )
+        header_cells = [
+            TableSnapshotCell(
+                table=self,
+                row_index=None,
+                column_index=col_index,
+                text=cell["text"],
+                attributes=cell["attributes"],
+            )
+            for col_index, cell in enumerate(data["headers"])
+        ]
+        rows = [
+            [
+                TableSnapshotCell(
+                    table=self,
+                    row_index=row_index,
+                    column_index=col_index,
+                    text=cell["text"],
+                    attributes=cell["attributes"],
+                )
+                for col_index, cell in enumerate(row)
+            ]
+            for row_index, row in enumerate(data["rows"])
+        ]
+        LOGGER.info(
+            "Took a snapshot of table with locator: %s, with %s columns and %s rows.",
+            self.locator,
+            len(header_cells),
+            len(rows),
+        )
+        return TableSnapshot(header_cells=header_cells, rows=rows)
+
+    def iter_rows(
+        self,
+        batch_size: Optional[int] = None,
+        next_page: Optional[BaseWebElement] = None,
+        row_key_attribute: Optional[str] = ROW_KEY_ATTRIBUTE,
+        load_timeout: Optional[float] = None,
+        virtual_scroll: bool = False,
+    ) -> Iterator[TableRow]:
+        """Yields the table's body rows, reading them in batches with one call to the browser per
+        batch. Once the rendered rows are exhausted, the rows' scrollable container is scrolled to
+        make a virtualized table render more rows, if virtual_scroll is True, and then the
+        next_page element, if any, is clicked to open the next page of the table. Only the key of
+        the last row read is kept in memory, so huge tables can be iterated in constant memory.
+
+        Parameters
+        ----------
+        batch_size : Optional[int]
+            The maximum number of rows to read per call. Defaults to ROWS_BATCH_SIZE.
+        next_page : Optional[BaseWebElement]
+            An element, e.g. a "Next" button, which opens the next page of the table when
+            clicked. Iteration stops once it's missing or disabled. Defaults to None.
+        row_key_attribute : Optional[str]
+            The row attribute whose numeric value identifies a row regardless of how many rows
+            are rendered before it. Rows without it are identified by their position on the page.
+            Defaults to ROW_KEY_ATTRIBUTE.
+        load_timeout : Optional[float]
+            How long to wait for more rows after scrolling or opening the next page, in seconds.
+            Defaults to ROWS_LOAD_TIMEOUT.
+        virtual_scroll : bool
+            Whether the table is virtualized, i.e. renders only the rows in view of its scrollable
+            container. Its rows must have the row_key_attribute, as their positions change when
+            scrolling. Defaults to False.
+
+        Yields
+        ------
+        TableRow
+
+        Raises
+        ------
+        ValueError
+            If virtual_scroll is True and the rows don't have the row_key_attribute, if a row's
+            row_key_attribute is not a number, or if the keys of the rows don't increase, hence
+            reading the next batch would not make progress.
+        """
+        batch_size = batch_size or self.ROWS_BATCH_SIZE
+        timeout_ms = int((load_timeout or self.ROWS_LOAD_TIMEOUT) * 1000)
+        cursor: Optional[int] = None
+        while True:
+            batch = self.execute_script(
+                TABLE_ROWS_BATCH_SCRIPT,
+                self.BODY_ROWS_SELECTOR,
+                self.BODY_CELLS_SELECTOR,
+                row_key_attribute,
+                cursor,
+                batch_size,
+            )
+            if batch["invalidKey"] is not None:
+                raise ValueError(
+                    f"A row of table with locator {self.locator} has the {row_key_attribute} "
+                    f"{batch['invalidKey']!r}, which is not a number!"
+                )
+            for row in batch["rows"]:
+                yield TableRow(index=row["key"], cells=tuple(row["cells"]))
+            if batch["rows"]:
+                last_key = batch["rows"][-1]["key"]
+                if cursor is not None and last_key <= cursor:
+                    raise ValueError(
+                        f"The keys of the rows of table with locator {self.locator} don't "
+                        f"increase, the last row read has the key {last_key} after {cursor}!"
+                    )
+                cursor = last_key
+            if len(batch["rows"]) == batch_size:
+                continue
+
+            if virtual_scroll and batch["rows"] and not batch["keyed"]:
+                raise ValueError(
+                    f"The rows of virtualized table with locator {self.locator} must have the "
+                    f"{row_key_attribute} attribute!"
+                )
+            if (
+                virtual_scroll
+                and batch["keyed"]
+                and self.execute_async_script(
+                    TABLE_SCROLL_SCRIPT, self.BODY_ROWS_SELECTOR, timeout_ms
+                )
+            ):
+                continue
+            if next_page is not None and self._open_next_page(
+                next_page=next_page, version=batch["version"], timeout_ms=timeout_ms
+            ):
+                LOGGER.info(
+                    "Opened the next page of table with locator: %s.", self.locator
+                )
+                # Positions start over on every page, unlike the values of the key attribute
+                cursor = cursor if batch["keyed"] else None
+                continue
+            return
+
+    def _open_next_page(
+        self, next_page: BaseWebElement, version: str, timeout_ms: int
+    ) -> bool:
+        """Clicks on the next_page element, if present and enabled, and waits for the table to
+        change.
+
+        Returns
+        -------
+        bool
+            Whether the table changed after opening the next page.
+        """
+        try:
+            next_page.find_element(wait_until_is_present=False)
+        except NoSuchElementException:
+            return False
+        if (
+            not next_page.is_enabled()
+            or next_page.get_attribute_value("aria-disabled") == "true"
+        ):
+            return False
+        next_page.click()
+        return self.execute_async_script(TABLE_CHANGE_SCRIPT, version, timeout_ms)
 
     @property
-    def columns(self):
+    @instrumented
+    def columns(self) -> List[TableColumn]:
         """Returns the columns of the table.
 
         Returns
@@ -103,27 +676,34 @@ class Table(BaseWebElement):
         List[TableColumn]
             The table's columns as a list of TableColumn objects.
         """
-        columns: List = []
+        if self.snapshot_mode:
+            return self.snapshot().columns
 
         header_cells = Collection(
-            parent=self, children_locator=(By.CSS_SELECTOR, "thead > tr > th")
+            parent=self, children_locator=(By.CSS_SELECTOR, self.HEADER_CELLS_SELECTOR)
         ).find_elements()
         body_rows = Collection(
-            parent=self, children_locator=(By.CSS_SELECTOR, "tbody > tr")
+            parent=self, children_locator=(By.CSS_SELECTOR, self.BODY_ROWS_SELECTOR)
         ).find_elements()
-        for h_cell in header_cells:
-            kwargs = {"header_cell": h_cell}
-            body_cells = []
-            for row in body_rows:
-                row_data_cells = Collection(
-                    parent=row, children_locator=(By.CSS_SELECTOR, "td")
-                ).find_elements()
-                body_cells.append(row_data_cells[header_cells.index(h_cell)])
-            kwargs["body_cells"] = body_cells
-            columns.append(TableColumn(**kwargs))
-
-        return columns
+        # Each row's data cells are looked up only once and shared by all columns
+        rows_data_cells = [
+            Collection(
+                parent=row, children_locator=(By.CSS_SELECTOR, self.BODY_CELLS_SELECTOR)
+            ).find_elements()
+            for row in body_rows
+        ]
+
+        return [
+            TableColumn(
+                header_cell=h_cell,
+                body_cells=[
+                    row_data_cells[index] for row_data_cells in rows_data_cells
+                ],
+            )
+            for index, h_cell in enumerate(header_cells)
+        ]
 
+    @instrumented
     def get_column_by_column_title(self, column_title: str) -> TableColumn:
         """Gets and returns the column with a header title specified by column_title.
 
@@ -137,17 +717,55 @@ class Table(BaseWebElement):
         TableColumn
             The column as TableColumn object.
         """
-        try:
-            col = list(
-                filter(
-                    lambda col: col.column_title.lower() == column_title.lower(),
-                    self.columns,
-                )
-            )[0]
-            logging.info("Got table column with title: %s.", column_title)
-        except IndexError as exc:
+        if self.snapshot_mode:
+            return self.snapshot().get_column_by_column_title(column_title=column_title)
+
+        title = column_title.casefold()
+        # Only the lookups of the column count as attempts, not rebuilding an outdated index
+        attempt = 0
+        while True:
+            fresh_index = self._column_index is None
+            if fresh_index:
+                self._build_column_index()
+            if title not in self._column_index:
+                if fresh_index:
+                    raise IndexError(
+                        f"A column with title {column_title} was not found!"
+                    )
+                # The index may be outdated, hence rebuild it before giving up
+                self.invalidate_column_index()
+                continue
+
+            attempt += 1
+            # Don't check the version on the last attempt, so tables which change constantly
+            # can still be looked up
+            expected_version = (
+                self._column_index_version
+                if attempt < self.COLUMN_LOOKUP_ATTEMPTS
+                else None
+            )
+            data = self.execute_script(
+                TABLE_COLUMN_SCRIPT,
+                expected_version,
+                self._column_index[title],
+                self.HEADER_CELLS_SELECTOR,
+                self.BODY_ROWS_SELECTOR,
+                self.BODY_CELLS_SELECTOR,
+            )
+            if data["header"] is not None:
+                break
+            # Once out of attempts, give up only if the index was just rebuilt
+            if attempt >= self.COLUMN_LOOKUP_ATTEMPTS and fresh_index:
+                raise IndexError(f"A column with title {column_title} was not found!")
+            self.invalidate_column_index()
+
+        if None in data["cells"]:
             raise IndexError(
-                f"A column with title {column_title} was not found!"
-            ) from exc
-        else:
-            return col
+                f"Row {data['cells'].index(None) + 1} of table with locator {self.locator} "
+                f"does not have a cell in column {column_title}!"
+            )
+        LOGGER.info("Got table column with title: %s.", column_title)
+        return TableColumn(
+            header_cell=BaseWebElement(web_element=data["header"]),
+            body_cells=[BaseWebElement(web_element=cell) for cell in data["cells"]],
+        )
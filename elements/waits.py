@@ -0,0 +1,177 @@
+"""This module contains an implementation of the waiting mechanism used when finding elements. It
+polls often at first, so elements which appear quickly are returned with little latency, and then
+backs off, so long waits don't flood the browser with commands."""
+import time
+from typing import Awaitable, Callable, Iterator, Optional, Sequence, Type, TypeVar
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from settings import (
+    DEFAULT_POLL_BACKOFF,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_WAIT_TIMEOUT,
+    MAX_POLL_INTERVAL,
+)
+
+T = TypeVar("T")
+
+
+class WaitPolicy:
+    """This class implements a policy of how long to wait for a condition and how often to poll
+    for it in the meantime.
+
+    Examples
+    --------
+        WaitPolicy(timeout=10)
+        # Polls every 0.25 seconds, like WebDriverWait with a fixed poll frequency
+        WaitPolicy(timeout=10, poll_interval=0.25, backoff=1)
+        set_default_wait_policy(WaitPolicy(timeout=30))
+        button.wait_policy = WaitPolicy(timeout=5)
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = MAX_POLL_INTERVAL,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+        ignored_exceptions: Sequence[Type[Exception]] = (NoSuchElementException,),
+    ):
+        if (
+            timeout < 0
+            or poll_interval <= 0
+            or max_poll_interval < poll_interval
+            or backoff < 1
+        ):
+            raise ValueError(
+                "The wait timeout must not be negative, the poll interval must be positive and "
+                "not greater than the maximum poll interval, and the backoff must be at least 1!"
+            )
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.ignored_exceptions = tuple(ignored_exceptions)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(timeout={self.timeout}, poll_interval={self.poll_interval}, "
+            f"max_poll_interval={self.max_poll_interval}, backoff={self.backoff})"
+        )
+
+    def poll_intervals(self) -> Iterator[float]:
+        """Yields the intervals to sleep for between polls, growing from poll_interval to
+        max_poll_interval by a factor of backoff.
+
+        Yields
+        ------
+        float
+        """
+        interval = self.poll_interval
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_poll_interval)
+
+    def until(self, method: Callable[[], T], message: str = "") -> T:
+        """Calls method until it returns a truthy value, which is then returned, or until the
+        timeout expires. The ignored exceptions raised by method are treated as a falsy value.
+
+        Parameters
+        ----------
+        method : Callable[[], T]
+            The condition to wait for.
+        message : str
+            The message of the TimeoutException raised if the timeout expires.
+
+        Returns
+        -------
+        T
+            The value returned by method.
+
+        Raises
+        ------
+        TimeoutException
+            If method did not return a truthy value within the timeout.
+        """
+        end_time = time.monotonic() + self.timeout
+        intervals = self.poll_intervals()
+        last_exception: Optional[Exception] = None
+        while True:
+            try:
+                value = method()
+            except self.ignored_exceptions as exc:
+                last_exception = exc
+            else:
+                if value:
+                    return value
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message) from last_exception
+            time.sleep(min(next(intervals), remaining))
+
+    async def until_async(
+        self, method: Callable[[], Awaitable[T]], message: str = ""
+    ) -> T:
+        """The asyncio counterpart of until, which awaits method and sleeps without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        method : Callable[[], Awaitable[T]]
+            The condition to wait for.
+        message : str
+            The message of the TimeoutException raised if the timeout expires.
+
+        Returns
+        -------
+        T
+            The value returned by method.
+
+        Raises
+        ------
+        TimeoutException
+            If method did not return a truthy value within the timeout.
+        """
+        # Imported on use, as the elements import this module and most tests never wait async
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        end_time = time.monotonic() + self.timeout
+        intervals = self.poll_intervals()
+        last_exception: Optional[Exception] = None
+        while True:
+            try:
+                value = await method()
+            except self.ignored_exceptions as exc:
+                last_exception = exc
+            else:
+                if value:
+                    return value
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message) from last_exception
+            await asyncio.sleep(min(next(intervals), remaining))
+
+
+_DEFAULT_WAIT_POLICY = WaitPolicy()
+
+
+def get_default_wait_policy() -> WaitPolicy:
+    """Returns the wait policy used by elements which don't have one of their own.
+
+    Returns
+    -------
+    WaitPolicy
+    """
+    return _DEFAULT_WAIT_POLICY
+
+
+def set_default_wait_policy(policy: WaitPolicy):
+    """Sets the wait policy used by elements which don't have one of their own.
+
+    Parameters
+    ----------
+    policy : WaitPolicy
+    """
+    # pylint: disable=global-statement
+    global _DEFAULT_WAIT_POLICY
+    _DEFAULT_WAIT_POLICY = policy
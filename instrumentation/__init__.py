@@ -0,0 +1,12 @@
+"""__init__ for instrumentation package"""
+from instrumentation.actions import Action, current_action, instrumented
+from instrumentation.recorder import (
+    CommandRecord,
+    CommandRecorder,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_command_recorder,
+    instrument_driver,
+    is_instrumentation_enabled,
+    uninstrument_driver,
+)
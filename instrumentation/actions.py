@@ -0,0 +1,88 @@
+"""This module keeps track of the framework method, e.g. find_element or select_options, and the
+element currently being acted on, so that each WebDriver command can be attributed to them, see
+instrumentation/recorder.py."""
+import functools
+from contextvars import ContextVar
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+_Method = TypeVar("_Method", bound=Callable)
+
+
+class Action(NamedTuple):
+    """A framework method called on an element, which issues WebDriver commands."""
+
+    # The class name of the element, e.g. Table
+    element: str
+    # The element's locator, if any, as a string
+    locator: Optional[str]
+    # The name of the method, e.g. columns
+    method: str
+
+
+# The outermost instrumented method being called in the current thread or asyncio task
+_CURRENT_ACTION: "ContextVar[Optional[Action]]" = ContextVar(
+    "current_action", default=None
+)
+# Whether the instrumented methods keep track of the current action. Read on every call of an
+# instrumented method, hence a module global, see track_actions
+_TRACKING = False
+
+
+def track_actions(enabled: bool):
+    """Controls whether the instrumented methods keep track of the current action. When disabled,
+    calling an instrumented method only costs an extra function call.
+
+    Parameters
+    ----------
+    enabled : bool
+    """
+    global _TRACKING  # pylint: disable=global-statement
+    _TRACKING = enabled
+
+
+def current_action() -> Optional[Action]:
+    """Returns the action of the current thread or asyncio task, if any.
+
+    Returns
+    -------
+    Optional[Action]
+    """
+    return _CURRENT_ACTION.get()
+
+
+def _locator_of(element) -> Optional[str]:
+    """Returns the locator, or the children locator of a collection, of element as a string."""
+    locator = getattr(element, "locator", None) or getattr(
+        element, "children_locator", None
+    )
+    return f"{locator[0]}={locator[1]}" if locator else None
+
+
+def instrumented(method: _Method) -> _Method:
+    """Decorates a method of an element, or a browser, so that the WebDriver commands issued while
+    it's called are attributed to it. Methods called by an instrumented method, e.g. find_element
+    by click, are attributed to the outermost one.
+
+    Examples
+    --------
+        class Table(BaseWebElement):
+            @property
+            @instrumented
+            def columns(self) -> List[TableColumn]:
+                ...
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _TRACKING or _CURRENT_ACTION.get() is not None:
+            return method(self, *args, **kwargs)
+        token = _CURRENT_ACTION.set(
+            Action(element=type(self).__name__, locator=_locator_of(self), method=name)
+        )
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _CURRENT_ACTION.reset(token)
+
+    return wrapper
@@ -0,0 +1,146 @@
+"""This module contains a pytest plugin which fails the tests issuing more WebDriver commands than
+their budget, with a breakdown of the commands by element and framework method. A test's budget
+is given by its max_roundtrips marker or else by a budget file, which maps node ids, or fnmatch
+patterns of node ids, to budgets; the longest matching pattern wins. Only the commands issued by
+the test function itself are counted, not those of its fixtures.
+
+Examples
+--------
+    @pytest.mark.max_roundtrips(20)
+    def test_search(browser):
+        ...
+
+    pytest -p instrumentation.budgets --roundtrip-budgets budgets.json tests/
+
+with budgets.json containing e.g.:
+
+    {"tests/test_tables.py::*": 50, "tests/test_tables.py::test_sorting": 80}
+"""
+import json
+from collections import Counter
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional
+
+import pytest
+
+from instrumentation.recorder import (
+    CommandRecord,
+    enable_instrumentation,
+    get_command_recorder,
+)
+
+MARKER = "max_roundtrips"
+# The number of element and method combinations listed in the breakdown of a failure
+BREAKDOWN_SIZE = 10
+
+
+def format_breakdown(records: List[CommandRecord]) -> str:
+    """Formats the commands by element and framework method, and by command name, the most
+    frequent first.
+
+    Returns
+    -------
+    str
+    """
+    by_action = Counter(
+        (
+            f"{record.element}.{record.method} ({record.locator})"
+            if record.method
+            else "(driver)"
+        )
+        for record in records
+    )
+    lines = [
+        f"    {count:>5}  {action}"
+        for action, count in by_action.most_common(BREAKDOWN_SIZE)
+    ]
+    if len(by_action) > BREAKDOWN_SIZE:
+        lines.append(f"    ... and {len(by_action) - BREAKDOWN_SIZE} more")
+    by_command = Counter(record.command for record in records)
+    lines.append(
+        "By command: "
+        + ", ".join(f"{command} {count}" for command, count in by_command.most_common())
+    )
+    return "\n".join(lines)
+
+
+class RoundTripBudgets:
+    """This class implements a pytest plugin which enforces the round trip budgets of the tests,
+    see the module's docstring."""
+
+    def __init__(self, budgets: Dict[str, int]):
+        self.budgets = budgets
+        enable_instrumentation()
+        # The index of the first command record of each running test
+        self._first_records: Dict[str, int] = {}
+
+    def budget_of(self, item: pytest.Item) -> Optional[int]:
+        """Returns the budget of a test, if any.
+
+        Returns
+        -------
+        Optional[int]
+        """
+        marker = item.get_closest_marker(MARKER)
+        if marker is not None:
+            return int(marker.args[0] if marker.args else marker.kwargs["n"])
+        patterns = [
+            pattern for pattern in self.budgets if fnmatchcase(item.nodeid, pattern)
+        ]
+        if not patterns:
+            return None
+        return self.budgets[max(patterns, key=len)]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        """Marks where the commands of the test function start."""
+        self._first_records[item.nodeid] = len(get_command_recorder().records)
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        """Fails a passed test if the test function issued more commands than its budget."""
+        outcome = yield
+        report: pytest.TestReport = outcome.get_result()
+        first_record = self._first_records.pop(item.nodeid, None)
+        if call.when != "call" or first_record is None or not report.passed:
+            return
+        budget = self.budget_of(item)
+        records = get_command_recorder().records[first_record:]
+        if budget is None or len(records) <= budget:
+            return
+        report.outcome = "failed"
+        report.longrepr = (
+            f"The test issued {len(records)} WebDriver commands, exceeding its budget of "
+            f"{budget}:\n{format_breakdown(records)}"
+        )
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Adds the budget file option."""
+    group = parser.getgroup("roundtrip budgets")
+    group.addoption(
+        "--roundtrip-budgets",
+        default=None,
+        help="A JSON file mapping test node ids, or fnmatch patterns of them, to the maximum "
+        "number of WebDriver commands each test may issue.",
+    )
+    parser.addini(
+        "roundtrip_budgets", "The default of --roundtrip-budgets.", default=None
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    """Registers the max_roundtrips marker and the plugin enforcing the budgets."""
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}(n): fail the test if it issues more than n WebDriver commands.",
+    )
+    path = config.getoption("roundtrip_budgets") or config.getini("roundtrip_budgets")
+    budgets = {}
+    if path:
+        with open(path, encoding="utf-8") as file:
+            budgets = json.load(file)
+    config.pluginmanager.register(
+        RoundTripBudgets(budgets=budgets), "instrumentation-roundtrip-budgets"
+    )
@@ -0,0 +1,457 @@
+"""This module implements the collection of the performance metrics of the pages the browsers
+navigate to, i.e. their Navigation Timing, Resource Timing, paint and largest contentful paint
+(LCP) metrics and JS heap size, and their aggregation per URL into percentile reports, which can
+be checked against thresholds. Hence the functional tests double as a front-end performance
+regression signal.
+
+The metrics are collected once a page was opened, see BaseBrowser.open_url, hence the LCP is the
+largest paint up to then. The JS heap size is only reported by Chromium based browsers. Collecting
+the metrics costs one WebDriver command per page opened.
+
+Examples
+--------
+    enable_page_metrics()
+    browser = ChromeBrowser()
+    browser.open_url("https://example.com", ready="network-idle")
+    recorder = get_page_metrics_recorder()
+    recorder.report()["https://example.com"]["largest_contentful_paint"]["p75"]
+    recorder.export_csv("page_metrics.csv")
+    recorder.assert_thresholds({"*": {"largest_contentful_paint": 2500, "ttfb:p95": 800}})
+
+    python -m instrumentation.page_metrics run-1.json run-2.json --thresholds thresholds.json
+"""
+import json
+import sys
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from instrumentation.recorder import BaseRecorder, _percentile
+from logger import get_logger
+from settings import PAGE_METRICS_ENABLED
+
+LOGGER = get_logger(__name__)
+# The metrics collected of each page, in milliseconds since the start of the navigation unless
+# stated otherwise. A metric the browser doesn't report, or which didn't happen yet, e.g. the load
+# event with the "eager" page load strategy, is left out
+PAGE_METRICS = (
+    # Navigation Timing
+    "ttfb",
+    "dns",  # duration
+    "connect",  # duration
+    "dom_interactive",
+    "dom_content_loaded",
+    "load",
+    "transfer_size",  # bytes
+    # Paint Timing
+    "first_paint",
+    "first_contentful_paint",
+    "largest_contentful_paint",
+    # Resource Timing, of at most the 250 resources the browsers buffer by default
+    "resources",  # count
+    "resource_transfer_size",  # bytes
+    "slowest_resource",  # duration
+    # Chromium based browsers only
+    "js_heap_used",  # bytes
+)
+# The percentiles of each metric in a report
+REPORT_PERCENTILES = (50, 75, 95)
+# The statistic of a report a threshold applies to, unless given, see check_thresholds. The 75th
+# percentile is the one the Core Web Vitals are assessed by
+DEFAULT_THRESHOLD_STATISTIC = "p75"
+# How long to wait for the buffered LCP entries to be delivered to the observer
+LCP_TIMEOUT = 0.1  # seconds
+# Collects the metrics of the current page, see PAGE_METRICS. The LCP is only available through a
+# PerformanceObserver, which delivers the buffered entries asynchronously, hence the script is
+# asynchronous
+PAGE_METRICS_SCRIPT = f"""
+var done = arguments[arguments.length - 1];
+var metrics = {{}};
+var navigation = performance.getEntriesByType('navigation')[0];
+if (navigation) {{
+    metrics.ttfb = navigation.responseStart;
+    metrics.dns = navigation.domainLookupEnd - navigation.domainLookupStart;
+    metrics.connect = navigation.connectEnd - navigation.connectStart;
+    metrics.dom_interactive = navigation.domInteractive || null;
+    metrics.dom_content_loaded = navigation.domContentLoadedEventEnd || null;
+    metrics.load = navigation.loadEventEnd || null;
+    metrics.transfer_size = navigation.transferSize;
+}}
+performance.getEntriesByType('paint').forEach(function (entry) {{
+    metrics[entry.name.replace(/-/g, '_')] = entry.startTime;
+}});
+var resources = performance.getEntriesByType('resource');
+metrics.resources = resources.length;
+metrics.resource_transfer_size = 0;
+metrics.slowest_resource = 0;
+resources.forEach(function (entry) {{
+    metrics.resource_transfer_size += entry.transferSize || 0;
+    metrics.slowest_resource = Math.max(metrics.slowest_resource, entry.duration);
+}});
+if (performance.memory) {{
+    metrics.js_heap_used = performance.memory.usedJSHeapSize;
+}}
+var finished = false;
+var finish = function () {{
+    if (!finished) {{
+        finished = true;
+        done(metrics);
+    }}
+}};
+var entryTypes = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+if (entryTypes.indexOf('largest-contentful-paint') === -1) {{
+    finish();
+    return;
+}}
+new PerformanceObserver(function (list, observer) {{
+    var entries = list.getEntries();
+    metrics.largest_contentful_paint = entries[entries.length - 1].startTime;
+    observer.disconnect();
+    finish();
+}}).observe({{type: 'largest-contentful-paint', buffered: true}});
+// No entries are delivered if nothing was painted yet
+setTimeout(finish, {LCP_TIMEOUT * 1000:.0f});
+"""
+# Whether the browsers collect the metrics of the pages they open, see enable_page_metrics
+_ENABLED = PAGE_METRICS_ENABLED
+
+
+class PageMetricsRecord(NamedTuple):
+    """The performance metrics of a page opened by a browser."""
+
+    # The test which opened the page, if known, see PageMetricsRecorder.current_test
+    test: Optional[str]
+    # The URL the page was opened with, see BaseBrowser.open_url
+    url: str
+    # See PAGE_METRICS
+    metrics: Dict[str, float]
+
+
+def collect_page_metrics(driver: WebDriver) -> Dict[str, float]:
+    """Returns the performance metrics of the driver's current page, see PAGE_METRICS.
+
+    Parameters
+    ----------
+    driver : WebDriver
+
+    Returns
+    -------
+    Dict[str, float]
+    """
+    metrics = driver.execute_async_script(PAGE_METRICS_SCRIPT) or {}
+    return {
+        name: value
+        for name, value in metrics.items()
+        if name in PAGE_METRICS and value is not None
+    }
+
+
+def _parse_threshold(spec: str) -> Tuple[str, str]:
+    """Splits a threshold's specification, e.g. "ttfb:p95", into its metric and statistic."""
+    metric, _, statistic = spec.partition(":")
+    statistic = statistic or DEFAULT_THRESHOLD_STATISTIC
+    statistics = [f"p{percentile}" for percentile in REPORT_PERCENTILES] + ["max"]
+    if metric not in PAGE_METRICS or statistic not in statistics:
+        raise ValueError(
+            f"Invalid threshold: {spec}! It must be a metric of {', '.join(PAGE_METRICS)}, "
+            f"optionally followed by one of :{', :'.join(statistics)}"
+        )
+    return metric, statistic
+
+
+class PageMetricsRecorder(BaseRecorder[PageMetricsRecord]):
+    """This class implements a recorder of the performance metrics of the pages opened by the
+    browsers while page metrics are enabled, see enable_page_metrics."""
+
+    RECORD_TYPE = PageMetricsRecord
+
+    @property
+    def urls(self) -> List[str]:
+        """The URLs of the recorded pages, in order of their first record.
+
+        Returns
+        -------
+        List[str]
+        """
+        return list(dict.fromkeys(record.url for record in self.records))
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Aggregates the recorded metrics per URL.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, float]]]
+            For each URL, the number of values of each metric and their REPORT_PERCENTILES
+            percentiles and maximum, e.g. report["https://example.com"]["ttfb"]["p95"].
+        """
+        values: Dict[str, Dict[str, List[float]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for record in self.records:
+            for metric, value in record.metrics.items():
+                values[record.url][metric].append(value)
+        return {
+            url: {
+                metric: {
+                    "count": len(values[url][metric]),
+                    **{
+                        f"p{percentile}": _percentile(values[url][metric], percentile)
+                        for percentile in REPORT_PERCENTILES
+                    },
+                    "max": max(values[url][metric]),
+                }
+                for metric in PAGE_METRICS
+                if metric in values[url]
+            }
+            for url in self.urls
+        }
+
+    def check_thresholds(self, thresholds: Dict[str, Dict[str, float]]) -> List[str]:
+        """Checks the report against thresholds.
+
+        Parameters
+        ----------
+        thresholds : Dict[str, Dict[str, float]]
+            Maps URLs, or fnmatch patterns of them, to the thresholds of their metrics, each
+            given as the metric's name, for its DEFAULT_THRESHOLD_STATISTIC, or as the name
+            followed by a statistic, e.g. "ttfb:p95". If multiple patterns match a URL and give a
+            threshold of the same metric and statistic, the longest one wins.
+
+        Returns
+        -------
+        List[str]
+            A description of each threshold exceeded.
+        """
+        violations = []
+        for url, metrics in self.report().items():
+            applied: Dict[Tuple[str, str], Tuple[str, float]] = {}
+            for pattern in sorted(thresholds, key=len):
+                if not fnmatchcase(url, pattern):
+                    continue
+                for spec, threshold in thresholds[pattern].items():
+                    applied[_parse_threshold(spec)] = (spec, threshold)
+            for (metric, statistic), (spec, threshold) in applied.items():
+                if metric in metrics and metrics[metric][statistic] > threshold:
+                    violations.append(
+                        f"{url}: {metric} {statistic} is {metrics[metric][statistic]:.0f}, "
+                        f"exceeding its threshold of {threshold} ({spec})"
+                    )
+        return violations
+
+    def assert_thresholds(self, thresholds: Dict[str, Dict[str, float]]):
+        """Checks the report against thresholds, see check_thresholds.
+
+        Parameters
+        ----------
+        thresholds : Dict[str, Dict[str, float]]
+
+        Raises
+        ------
+        AssertionError
+            If any threshold is exceeded.
+        """
+        violations = self.check_thresholds(thresholds=thresholds)
+        if violations:
+            raise AssertionError(
+                "Page metrics thresholds exceeded:\n" + "\n".join(violations)
+            )
+
+    def export_json(self, path: str):
+        """Writes the records and the report to a JSON file, which can be merged with the files
+        of other runs, see load_json.
+
+        Parameters
+        ----------
+        path : str
+        """
+        report = {
+            "records": [record._asdict() for record in self.records],
+            "report": self.report(),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        LOGGER.info("Exported the page metrics report to: %s.", path)
+
+    def export(self, path: str):
+        """Writes the report to a CSV file if path ends with ".csv", or else to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+        """
+        if path.endswith(".csv"):
+            self.export_csv(path=path)
+        else:
+            self.export_json(path=path)
+
+    def export_csv(self, path: str):
+        """Writes the report to a CSV file, with a row per URL and metric.
+
+        Parameters
+        ----------
+        path : str
+        """
+        # Imported on use, as the browsers import this module, see record_page_metrics
+        import csv  # pylint: disable=import-outside-toplevel
+
+        statistics = [f"p{percentile}" for percentile in REPORT_PERCENTILES] + ["max"]
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["url", "metric", "count", *statistics])
+            for url, metrics in self.report().items():
+                for metric, values in metrics.items():
+                    writer.writerow(
+                        [url, metric, values["count"]]
+                        + [values[statistic] for statistic in statistics]
+                    )
+        LOGGER.info("Exported the page metrics report to: %s.", path)
+
+
+_RECORDER = PageMetricsRecorder()
+
+
+def get_page_metrics_recorder() -> PageMetricsRecorder:
+    """Returns the recorder the browsers record the metrics of the pages they open with.
+
+    Returns
+    -------
+    PageMetricsRecorder
+    """
+    return _RECORDER
+
+
+def record_page_metrics(
+    driver: WebDriver, url: str, recorder: Optional[PageMetricsRecorder] = None
+) -> Optional[PageMetricsRecord]:
+    """Collects the metrics of the driver's current page and records them. A failure to collect
+    them is logged rather than raised, so that it doesn't fail the test opening the page.
+
+    Parameters
+    ----------
+    driver : WebDriver
+    url : str
+        The URL the page was opened with.
+    recorder : Optional[PageMetricsRecorder]
+        Defaults to None, meaning the recorder returned by get_page_metrics_recorder.
+
+    Returns
+    -------
+    Optional[PageMetricsRecord]
+        The record, or None if the metrics could not be collected.
+    """
+    recorder = recorder or get_page_metrics_recorder()
+    try:
+        metrics = collect_page_metrics(driver=driver)
+    except WebDriverException as exc:
+        LOGGER.warning("Could not collect the page metrics of %s: %s", url, exc.msg)
+        return None
+    record = PageMetricsRecord(test=recorder.current_test, url=url, metrics=metrics)
+    recorder.record(record)
+    return record
+
+
+def enable_page_metrics():
+    """Makes the browsers collect the metrics of the pages they open from now on, see
+    settings.PAGE_METRICS_ENABLED."""
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = True
+
+
+def disable_page_metrics():
+    """Makes the browsers stop collecting the metrics of the pages they open."""
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = False
+
+
+def is_page_metrics_enabled() -> bool:
+    """Determines whether the browsers collect the metrics of the pages they open.
+
+    Returns
+    -------
+    bool
+    """
+    return _ENABLED
+
+
+def load_thresholds(path: str) -> Dict[str, Dict[str, float]]:
+    """Loads the thresholds of check_thresholds from a JSON file, validating them.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+    """
+    with open(path, encoding="utf-8") as file:
+        thresholds = json.load(file)
+    for specs in thresholds.values():
+        for spec in specs:
+            _parse_threshold(spec)
+    return thresholds
+
+
+def _format_report(report: Dict[str, Dict[str, Dict[str, float]]]) -> Iterable[str]:
+    for url, metrics in report.items():
+        yield url
+        for metric, values in metrics.items():
+            statistics = "  ".join(
+                f"{statistic} {value:>10.0f}"
+                for statistic, value in values.items()
+                if statistic != "count"
+            )
+            yield f"    {metric:<26} {values['count']:>5} values  {statistics}"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Merges the page metrics of runs, written by export_json, prints their report per URL and
+    checks it against thresholds.
+
+    Returns
+    -------
+    int
+        0 if no threshold is exceeded, or else 1.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(
+        prog="python -m instrumentation.page_metrics", description=__doc__
+    )
+    parser.add_argument("runs", nargs="+", help="The JSON files of the runs.")
+    parser.add_argument(
+        "--json", default=None, help="A JSON file to write the merged report to."
+    )
+    parser.add_argument(
+        "--csv", default=None, help="A CSV file to write the merged report to."
+    )
+    parser.add_argument(
+        "--thresholds",
+        default=None,
+        help="A JSON file mapping URLs, or fnmatch patterns of them, to the thresholds of their "
+        'metrics, e.g. {"*": {"largest_contentful_paint": 2500, "ttfb:p95": 800}}.',
+    )
+    args = parser.parse_args(argv)
+
+    recorder = PageMetricsRecorder()
+    for path in args.runs:
+        recorder.load_json(path=path)
+    for line in _format_report(recorder.report()):
+        print(line)
+    if args.json:
+        recorder.export_json(path=args.json)
+    if args.csv:
+        recorder.export_csv(path=args.csv)
+    if not args.thresholds:
+        return 0
+    violations = recorder.check_thresholds(thresholds=load_thresholds(args.thresholds))
+    for violation in violations:
+        print(f"THRESHOLD EXCEEDED {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
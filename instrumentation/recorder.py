@@ -0,0 +1,292 @@
+"""This module implements the recording of the WebDriver commands issued by a browser, together
+with the framework method and element which issued them, their latency and payload size, and
+their summary per test.
+
+Examples
+--------
+    enable_instrumentation()
+    browser = ChromeBrowser()
+    recorder = get_command_recorder()
+    recorder.current_test = "test_search"
+    ...
+    recorder.summary(test="test_search")["p95_latency"]
+    recorder.export_json("commands.json")
+"""
+import json
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, Generic, List, NamedTuple, Optional, Type, TypeVar
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from instrumentation.actions import current_action, track_actions
+from logger import get_logger
+from settings import INSTRUMENTATION_ENABLED
+
+LOGGER = get_logger(__name__)
+# The name of the driver's attribute holding its original execute method while instrumented
+_ORIGINAL_EXECUTE = "_uninstrumented_execute"
+# Whether browsers started from now on are instrumented, see enable_instrumentation
+_ENABLED = INSTRUMENTATION_ENABLED
+R = TypeVar("R")
+
+
+class CommandRecord(NamedTuple):
+    """A WebDriver command issued by an instrumented driver."""
+
+    # The test which issued the command, if known, see CommandRecorder.current_test
+    test: Optional[str]
+    # The WebDriver command, e.g. findElement
+    command: str
+    # The class name and locator of the element and the framework method which issued the
+    # command, if any, see instrumentation/actions.py
+    element: Optional[str]
+    locator: Optional[str]
+    method: Optional[str]
+    latency: float  # seconds
+    # The approximate JSON-encoded size of the command's parameters and response
+    request_bytes: int
+    response_bytes: int
+    failed: bool
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Returns the given percentile of values, using the nearest-rank method."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percentile / 100 * len(ordered)) - 1)]
+
+
+def _payload_size(payload: Any) -> int:
+    """Returns the approximate JSON-encoded size of a command's parameters or response, in which
+    elements are encoded by their id."""
+    if not payload:
+        return 0
+    return len(json.dumps(payload, default=lambda obj: getattr(obj, "id", str(obj))))
+
+
+class BaseRecorder(Generic[R]):
+    """This class implements the base of the thread-safe recorders of records attributed to the
+    test running, see CommandRecorder and PageMetricsRecorder."""
+
+    # The type of the records, which are NamedTuples, for loading them, see load_json
+    RECORD_TYPE: Type[Any] = tuple
+
+    def __init__(self):
+        self.records: List[R] = []
+        # The test the records recorded from now on are attributed to
+        self.current_test: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def record(self, record: R):
+        """Adds a record."""
+        with self._lock:
+            self.records.append(record)
+
+    def reset(self):
+        """Removes all records."""
+        with self._lock:
+            self.records = []
+
+    def load_json(self, path: str):
+        """Adds the records of a JSON file written by export_json, e.g. by another worker or run.
+
+        Parameters
+        ----------
+        path : str
+        """
+        with open(path, encoding="utf-8") as file:
+            records = json.load(file)["records"]
+        for record in records:
+            self.record(self.RECORD_TYPE(**record))
+
+
+class CommandRecorder(BaseRecorder[CommandRecord]):
+    """This class implements a recorder of the WebDriver commands issued by instrumented drivers,
+    see instrument_driver."""
+
+    RECORD_TYPE = CommandRecord
+    # The number of locators listed in a summary's top_locators
+    TOP_LOCATORS = 10
+
+    @property
+    def tests(self) -> List[str]:
+        """The tests which issued any recorded commands, in order of their first command.
+
+        Returns
+        -------
+        List[str]
+        """
+        return list(
+            dict.fromkeys(record.test for record in self.records if record.test)
+        )
+
+    def summary(self, test: Optional[str] = None) -> Dict[str, Any]:
+        """Summarizes the commands issued by a test, or all recorded commands.
+
+        Parameters
+        ----------
+        test : Optional[str]
+            The test whose commands to summarize. Defaults to None, meaning all commands.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The number of commands, their total, p50 and p95 latency in seconds, their total
+            request and response bytes, the number of commands per command name and per
+            framework method, and the TOP_LOCATORS locators by total latency.
+        """
+        records = [
+            record for record in self.records if test is None or record.test == test
+        ]
+        latencies = [record.latency for record in records]
+        by_locator: Dict[tuple, List[CommandRecord]] = defaultdict(list)
+        for record in records:
+            by_locator[(record.element, record.locator)].append(record)
+        top_locators = sorted(
+            by_locator.items(),
+            key=lambda item: sum(record.latency for record in item[1]),
+            reverse=True,
+        )[: self.TOP_LOCATORS]
+        return {
+            "commands": len(records),
+            "failed": sum(record.failed for record in records),
+            "total_latency": sum(latencies),
+            "p50_latency": _percentile(latencies, 50),
+            "p95_latency": _percentile(latencies, 95),
+            "request_bytes": sum(record.request_bytes for record in records),
+            "response_bytes": sum(record.response_bytes for record in records),
+            "by_command": dict(Counter(record.command for record in records)),
+            "by_method": dict(
+                Counter(
+                    f"{record.element}.{record.method}" if record.method else "(driver)"
+                    for record in records
+                )
+            ),
+            "top_locators": [
+                {
+                    "element": element,
+                    "locator": locator,
+                    "commands": len(locator_records),
+                    "total_latency": sum(record.latency for record in locator_records),
+                }
+                for (element, locator), locator_records in top_locators
+            ],
+        }
+
+    def export_json(self, path: str):
+        """Writes the summary of each test, and of all commands, to a JSON file, together with the
+        records, so that the files of multiple workers can be merged, see load_json.
+
+        Parameters
+        ----------
+        path : str
+        """
+        report = {
+            "records": [record._asdict() for record in self.records],
+            "tests": {test: self.summary(test=test) for test in self.tests},
+            "total": self.summary(),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        LOGGER.info("Exported the WebDriver command report to: %s.", path)
+
+
+_RECORDER = CommandRecorder()
+
+
+def get_command_recorder() -> CommandRecorder:
+    """Returns the recorder the instrumented drivers record their commands with.
+
+    Returns
+    -------
+    CommandRecorder
+    """
+    return _RECORDER
+
+
+def instrument_driver(driver: WebDriver, recorder: Optional[CommandRecorder] = None):
+    """Makes a driver record every command it issues, including the commands of its elements, in
+    recorder.
+
+    Parameters
+    ----------
+    driver : WebDriver
+    recorder : Optional[CommandRecorder]
+        Defaults to None, meaning the recorder returned by get_command_recorder.
+    """
+    if hasattr(driver, _ORIGINAL_EXECUTE):
+        return
+    recorder = recorder or get_command_recorder()
+    execute = driver.execute
+
+    def instrumented_execute(driver_command: str, params: Optional[dict] = None):
+        action = current_action()
+        response = None
+        failed = True
+        start = time.perf_counter()
+        try:
+            response = execute(driver_command, params)
+            failed = False
+            return response
+        finally:
+            recorder.record(
+                CommandRecord(
+                    test=recorder.current_test,
+                    command=driver_command,
+                    element=action.element if action else None,
+                    locator=action.locator if action else None,
+                    method=action.method if action else None,
+                    latency=time.perf_counter() - start,
+                    request_bytes=_payload_size(params),
+                    response_bytes=_payload_size(response and response.get("value")),
+                    failed=failed,
+                )
+            )
+
+    setattr(driver, _ORIGINAL_EXECUTE, execute)
+    # Elements issue their commands through their driver's execute too
+    driver.execute = instrumented_execute
+    # Actions are tracked as long as there is an instrumented driver
+    track_actions(enabled=True)
+
+
+def uninstrument_driver(driver: WebDriver):
+    """Makes an instrumented driver stop recording its commands.
+
+    Parameters
+    ----------
+    driver : WebDriver
+    """
+    if hasattr(driver, _ORIGINAL_EXECUTE):
+        driver.execute = getattr(driver, _ORIGINAL_EXECUTE)
+        delattr(driver, _ORIGINAL_EXECUTE)
+
+
+def enable_instrumentation():
+    """Makes the browsers started from now on instrument their drivers, see
+    settings.INSTRUMENTATION_ENABLED."""
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = True
+    track_actions(enabled=True)
+
+
+def disable_instrumentation():
+    """Makes the browsers started from now on not instrument their drivers. Already instrumented
+    drivers keep recording their commands, unless uninstrument_driver is called on them.
+    """
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = False
+
+
+def is_instrumentation_enabled() -> bool:
+    """Determines whether the browsers started from now on instrument their drivers.
+
+    Returns
+    -------
+    bool
+    """
+    return _ENABLED
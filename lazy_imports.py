@@ -0,0 +1,44 @@
+"""This module contains a helper for packages to import their submodules lazily, on first access
+of the names they define, according to PEP 562."""
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    module_name: str, module_globals: Dict[str, Any], lazy_imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns the module level __getattr__ and __dir__ functions of a package, which import the
+    names in lazy_imports from their modules on first access.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the package, i.e. its __name__.
+    module_globals : Dict[str, Any]
+        The package's globals(), where the imported names are cached, so that __getattr__ is only
+        called on their first access.
+    lazy_imports : Dict[str, str]
+        The module each name is defined in, keyed by the name.
+
+    Returns
+    -------
+    Tuple[Callable[[str], Any], Callable[[], List[str]]]
+
+    Examples
+    --------
+        _LAZY_IMPORTS = {"Table": "elements.table"}
+        __all__ = list(_LAZY_IMPORTS)
+        __getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_imports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(lazy_imports[name]), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,228 @@
+"""Contains the logging setup of the project, done once for all modules on first use of
+get_logger. Records are put on a queue by the logging thread and formatted and written by a
+background thread, so logging costs the caller little more than a level check. Actions are logged
+as structured events with timing fields (see log_timing), and frequent per-element events are
+sampled (see SamplingFilter).
+
+Examples
+--------
+    LOGGER = get_logger(__name__)
+
+    with log_timing(LOGGER, "click", "Clicked on element with locator: %s", self.locator):
+        self.web_element.click()
+"""
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from settings import LOG_FORMAT, LOG_SAMPLE_EVERY, LOGGING_LEVEL
+
+# The format of the text log records, the same as that of logging.basicConfig
+TEXT_FORMAT = logging.BASIC_FORMAT
+# The types of the log arguments which are formatted on the listener's thread, as they can't change
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool)
+# The attributes every LogRecord has, i.e. the ones which are not structured fields of an event
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_LISTENER: Optional[QueueListener] = None
+_CONFIGURED = False
+_CONFIGURE_LOCK = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """This class implements a filter which lets through only the first of every sample_every
+    records of the same sampled event, i.e. logged with extra={"sample": True}, e.g. finding an
+    element. Each record let through carries the number of records of the event so far as its
+    occurrences field."""
+
+    def __init__(self, sample_every: int = LOG_SAMPLE_EVERY):
+        super().__init__()
+        self.sample_every = sample_every
+        self._counts: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sample", False) or self.sample_every <= 1:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            occurrences = self._counts.get(key, 0) + 1
+            self._counts[key] = occurrences
+        record.occurrences = occurrences
+        return (occurrences - 1) % self.sample_every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """This class implements a formatter which formats each record as a JSON object, including the
+    structured fields of events, e.g. duration_ms."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        event.update(
+            (name, value)
+            for name, value in vars(record).items()
+            if name not in _RECORD_ATTRIBUTES and name != "sample"
+        )
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str)
+
+
+def _is_immutable(value: Any) -> bool:
+    """Determines whether a log argument can't change before the record is formatted, i.e. it's a
+    primitive or a tuple of such, e.g. a locator."""
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return value is None or isinstance(value, _IMMUTABLE_TYPES)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """A QueueHandler which leaves formatting the records to the listener's thread. The records
+    stay in the process, hence they don't need to be made picklable first. Only the message of a
+    record with other arguments than primitives is formatted right away, as those may change, or
+    be garbage, e.g. a stale element, by the time the listener formats it."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        values = args.values() if isinstance(args, dict) else args or ()
+        if all(_is_immutable(value) for value in values):
+            return record
+        # Other handlers of the record, if any, still format it themselves
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging(
+    level: int = LOGGING_LEVEL,
+    log_format: str = LOG_FORMAT,
+    sample_every: int = LOG_SAMPLE_EVERY,
+    stream: Optional[TextIO] = None,
+    force: bool = False,
+):
+    """Configures the root logger to put records on a queue, from which a background thread
+    writes them to stream. Like logging.basicConfig, it does nothing if the root logger already
+    has handlers, e.g. configured by the application, unless force is True.
+
+    Parameters
+    ----------
+    level : int
+        Defaults to settings.LOGGING_LEVEL.
+    log_format : str
+        "text" or "json". Defaults to settings.LOG_FORMAT.
+    sample_every : int
+        See SamplingFilter. Defaults to settings.LOG_SAMPLE_EVERY.
+    stream : Optional[TextIO]
+        Defaults to None, meaning sys.stderr.
+    force : bool
+        Controls whether a previous configuration is replaced. Defaults to False.
+    """
+    global _CONFIGURED, _LISTENER  # pylint: disable=global-statement
+    with _CONFIGURE_LOCK:
+        root = logging.getLogger()
+        if _CONFIGURED and not force:
+            return
+        _CONFIGURED = True
+        if root.handlers and not force:
+            return
+        stop_logging()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+
+        sink = logging.StreamHandler(stream or sys.stderr)
+        sink.setFormatter(
+            JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT)
+        )
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(records)
+        handler.addFilter(SamplingFilter(sample_every=sample_every))
+        root.addHandler(handler)
+        root.setLevel(level)
+        _LISTENER = QueueListener(records, sink)
+        _LISTENER.start()
+
+
+def stop_logging():
+    """Writes the records still on the queue and stops the background thread. Registered to run
+    at exit."""
+    global _LISTENER  # pylint: disable=global-statement
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
+
+atexit.register(stop_logging)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Returns the logger of a module, configuring logging on first use, see configure_logging.
+
+    Parameters
+    ----------
+    name : str
+        The name of the module, i.e. __name__.
+
+    Returns
+    -------
+    logging.Logger
+    """
+    configure_logging()
+    return logging.getLogger(name)
+
+
+@contextmanager
+def log_timing(
+    logger: logging.Logger,
+    event: str,
+    message: str,
+    *args: Any,
+    level: int = logging.INFO,
+    sample: bool = False,
+    **fields: Any,
+) -> Iterator[None]:
+    """Times the enclosed block and logs message, with " in <duration>ms" appended, as a
+    structured event with the fields event, duration_ms and any given fields. The level is checked
+    before anything else, hence the block is merely run if the event wouldn't be logged. Nothing is
+    logged if the block raises.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+    event : str
+        The name of the event, e.g. "click".
+    message : str
+        The message, formatted with args.
+    level : int
+        Defaults to logging.INFO.
+    sample : bool
+        Controls whether the event is sampled, see SamplingFilter. Defaults to False.
+    fields
+        Any additional fields of the event.
+    """
+    if not logger.isEnabledFor(level):
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    duration_ms = (time.perf_counter() - start) * 1000
+    logger.log(
+        level,
+        f"{message} in %.1fms.",
+        *args,
+        duration_ms,
+        extra={"event": event, "duration_ms": duration_ms, "sample": sample, **fields},
+    )
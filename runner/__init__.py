@@ -0,0 +1,3 @@
+"""__init__ for runner package"""
+from runner.durations import load_durations, merge_durations, save_durations
+from runner.sharding import balance_shards
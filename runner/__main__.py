@@ -0,0 +1,309 @@
+"""This module contains the runner's entry point, which shards a pytest suite across worker
+processes, each with its own browser, balanced by the durations of the tests in previous runs.
+
+Examples
+--------
+    python -m runner --workers 8 --browser chrome --headless tests/
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional, Sequence
+
+import pytest
+
+from instrumentation.page_metrics import PageMetricsRecorder, load_thresholds
+from instrumentation.recorder import CommandRecorder
+from logger import get_logger
+from runner.durations import (
+    DEFAULT_DURATIONS_FILE,
+    load_durations,
+    merge_durations,
+    save_durations,
+)
+from runner.sharding import balance_shards
+
+LOGGER = get_logger(__name__)
+DEFAULT_OUTPUT_DIR = ".runner"
+# The files each shard writes at the end of its session, which are merged once all shards finished
+SHARD_RESULT_FILES = ("timings.json", "commands.json", "page_metrics.json")
+
+
+def collect_test_ids(pytest_args: Sequence[str]) -> List[str]:
+    """Collects the node ids of the tests selected by pytest_args. The runner's plugin is loaded,
+    as in the workers, so that its options are accepted.
+
+    Returns
+    -------
+    List[str]
+
+    Raises
+    ------
+    UserWarning
+        If the collection failed, e.g. due to an unknown option or an import error.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "runner.plugin",
+            "--collect-only",
+            "-q",
+            *pytest_args,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode not in (
+        pytest.ExitCode.OK,
+        pytest.ExitCode.NO_TESTS_COLLECTED,
+    ):
+        raise UserWarning(
+            f"Collecting the tests failed with exit code {result.returncode}!\n"
+            f"{result.stdout}{result.stderr}"
+        )
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line]
+
+
+def _shard_path(output_dir: str, index: int, name: str) -> str:
+    return os.path.join(output_dir, f"shard-{index}.{name}")
+
+
+def run_shards(
+    shards: Sequence[Sequence[str]],
+    pytest_args: Sequence[str],
+    output_dir: str,
+    command_report: bool = False,
+    page_metrics: bool = False,
+) -> List[int]:
+    """Runs each shard in its own pytest process, all of them in parallel, and waits for them to
+    finish. Each shard writes its output and test durations to output_dir, and its command report
+    and page metrics, if enabled, to be merged, see merge_command_reports and merge_page_metrics.
+    The result files of a previous run are removed first, so that a shard which crashes before
+    writing its own doesn't have the previous run's results merged in their place.
+
+    Returns
+    -------
+    List[int]
+        The exit code of each shard.
+    """
+    processes = []
+    for index, test_ids in enumerate(shards):
+        for name in SHARD_RESULT_FILES:
+            if os.path.exists(_shard_path(output_dir, index, name)):
+                os.remove(_shard_path(output_dir, index, name))
+        shard_file = os.path.join(output_dir, f"shard-{index}.txt")
+        with open(shard_file, "w", encoding="utf-8") as file:
+            file.write("\n".join(test_ids))
+        log = open(  # pylint: disable=consider-using-with
+            os.path.join(output_dir, f"shard-{index}.log"), "w", encoding="utf-8"
+        )
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-p",
+                "runner.plugin",
+                # Passed as single arguments, so pytest doesn't consider the paths when
+                # determining the rootdir, which the node ids are relative to
+                f"--shard-file={shard_file}",
+                f"--shard-timings={_shard_path(output_dir, index, 'timings.json')}",
+                *(
+                    [
+                        f"--command-report={_shard_path(output_dir, index, 'commands.json')}"
+                    ]
+                    if command_report
+                    else []
+                ),
+                *(
+                    [
+                        f"--page-metrics={_shard_path(output_dir, index, 'page_metrics.json')}"
+                    ]
+                    if page_metrics
+                    else []
+                ),
+                *pytest_args,
+            ],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, "RUNNER_SHARD_INDEX": str(index)},
+        )
+        processes.append((process, log, time.monotonic()))
+        LOGGER.info("Started shard %s with %s tests.", index, len(test_ids))
+
+    exit_codes = []
+    for index, (process, log, start) in enumerate(processes):
+        exit_codes.append(process.wait())
+        log.close()
+        LOGGER.info(
+            "Shard %s finished with exit code %s in %.1fs.",
+            index,
+            exit_codes[-1],
+            time.monotonic() - start,
+        )
+    return exit_codes
+
+
+def merge_command_reports(shard_count: int, output_dir: str, path: str):
+    """Merges the command reports of the shards into one, see CommandRecorder.export_json.
+
+    Parameters
+    ----------
+    shard_count : int
+    output_dir : str
+        The directory the shards wrote their reports to.
+    path : str
+        The file to write the merged report to.
+    """
+    recorder = CommandRecorder()
+    for index in range(shard_count):
+        shard_path = _shard_path(output_dir, index, "commands.json")
+        if os.path.exists(shard_path):
+            recorder.load_json(path=shard_path)
+    recorder.export_json(path=path)
+
+
+def merge_page_metrics(
+    shard_count: int,
+    output_dir: str,
+    path: Optional[str] = None,
+    thresholds_path: Optional[str] = None,
+) -> List[str]:
+    """Merges the page metrics of the shards, writes their report and checks it against the
+    thresholds, see instrumentation/page_metrics.py.
+
+    Parameters
+    ----------
+    shard_count : int
+    output_dir : str
+        The directory the shards wrote their page metrics to.
+    path : Optional[str]
+        The JSON or CSV file to write the merged report to, if any.
+    thresholds_path : Optional[str]
+        A JSON file of the thresholds, if any.
+
+    Returns
+    -------
+    List[str]
+        A description of each threshold exceeded.
+    """
+    recorder = PageMetricsRecorder()
+    for index in range(shard_count):
+        shard_path = _shard_path(output_dir, index, "page_metrics.json")
+        if os.path.exists(shard_path):
+            recorder.load_json(path=shard_path)
+    if path:
+        recorder.export(path=path)
+    if not thresholds_path:
+        return []
+    violations = recorder.check_thresholds(thresholds=load_thresholds(thresholds_path))
+    for violation in violations:
+        LOGGER.error("Page metrics threshold exceeded: %s", violation)
+    return violations
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the suite sharded across worker processes. Any arguments not known to the runner are
+    passed to pytest.
+
+    Returns
+    -------
+    int
+        0 if all shards passed and no page metrics threshold is exceeded, or else the first
+        non-zero exit code of a shard, or 1.
+    """
+    parser = argparse.ArgumentParser(prog="python -m runner", description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of worker processes. Defaults to the number of CPUs.",
+    )
+    parser.add_argument("--browser", default="chrome", help="chrome, firefox or edge.")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--durations-file", default=DEFAULT_DURATIONS_FILE)
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        "--command-report",
+        default=None,
+        help="A JSON file to write the merged WebDriver command report of the shards to.",
+    )
+    parser.add_argument(
+        "--page-metrics",
+        default=None,
+        help="A JSON or CSV file to write the merged page metrics report of the shards to.",
+    )
+    parser.add_argument(
+        "--page-metric-thresholds",
+        default=None,
+        help="A JSON file of thresholds of the page metrics, checked against the merged report.",
+    )
+    args, pytest_args = parser.parse_known_args(argv)
+    if args.workers < 1:
+        parser.error("The number of workers must be at least 1")
+
+    test_ids = collect_test_ids(pytest_args=pytest_args)
+    if not test_ids:
+        LOGGER.warning("No tests were collected with the arguments: %s.", pytest_args)
+        return 5  # pytest's exit code for no tests collected
+
+    durations = load_durations(path=args.durations_file)
+    shards = [
+        shard
+        for shard in balance_shards(
+            test_ids=test_ids, shard_count=args.workers, durations=durations
+        )
+        if shard
+    ]
+    os.makedirs(args.output_dir, exist_ok=True)
+    worker_args = [
+        "--browser",
+        args.browser,
+        *(["--headless"] if args.headless else []),
+    ]
+    exit_codes = run_shards(
+        shards=shards,
+        pytest_args=[*worker_args, *pytest_args],
+        output_dir=args.output_dir,
+        command_report=bool(args.command_report),
+        page_metrics=bool(args.page_metrics or args.page_metric_thresholds),
+    )
+    exit_code = next((code for code in exit_codes if code), 0)
+
+    shard_timings = []
+    for index in range(len(shards)):
+        path = _shard_path(args.output_dir, index, "timings.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                shard_timings.append(json.load(file))
+    save_durations(
+        durations=merge_durations(durations=durations, shard_timings=shard_timings),
+        path=args.durations_file,
+    )
+    if args.command_report:
+        merge_command_reports(
+            shard_count=len(shards),
+            output_dir=args.output_dir,
+            path=args.command_report,
+        )
+    if args.page_metrics or args.page_metric_thresholds:
+        violations = merge_page_metrics(
+            shard_count=len(shards),
+            output_dir=args.output_dir,
+            path=args.page_metrics,
+            thresholds_path=args.page_metric_thresholds,
+        )
+        if violations and not exit_code:
+            exit_code = pytest.ExitCode.TESTS_FAILED
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
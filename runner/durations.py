@@ -0,0 +1,42 @@
+"""This module contains helpers to persist the durations of tests, which are used to balance the
+tests across shards in the next run."""
+import json
+import os
+from typing import Dict, Iterable
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+
+
+def load_durations(path: str = DEFAULT_DURATIONS_FILE) -> Dict[str, float]:
+    """Loads the durations of tests, keyed by test node id, in seconds. Returns an empty
+    dictionary if the file doesn't exist yet.
+
+    Returns
+    -------
+    Dict[str, float]
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_durations(durations: Dict[str, float], path: str = DEFAULT_DURATIONS_FILE):
+    """Saves the durations of tests, keyed by test node id, in seconds."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(durations, file, indent=2, sort_keys=True)
+
+
+def merge_durations(
+    durations: Dict[str, float], shard_timings: Iterable[Dict[str, float]]
+) -> Dict[str, float]:
+    """Returns the durations updated with the timings recorded by the shards of the last run.
+
+    Returns
+    -------
+    Dict[str, float]
+    """
+    merged = dict(durations)
+    for timings in shard_timings:
+        merged.update(timings)
+    return merged
@@ -0,0 +1,259 @@
+"""This module contains a pytest plugin used by the runner's workers. It provides each worker
+process with its own browser, runs only the tests of the worker's shard and records the durations
+of the tests for balancing the next run.
+
+Examples
+--------
+    pytest -p runner.plugin --browser firefox --headless
+"""
+
+# pylint: disable=redefined-outer-name
+import json
+from importlib import import_module
+from typing import Dict, Iterator, List, Optional
+
+import pytest
+
+from browsers.base_browser import (
+    DEFAULT_WINDOW_HEIGHT,
+    DEFAULT_WINDOW_WIDTH,
+    BaseBrowser,
+)
+from browsers.launch_profiles import get_launch_profile
+from instrumentation import enable_instrumentation, get_command_recorder
+from instrumentation.page_metrics import (
+    enable_page_metrics,
+    get_page_metrics_recorder,
+    load_thresholds,
+)
+from logger import get_logger
+
+LOGGER = get_logger(__name__)
+# The module, browser class and options arguments class of each browser supported by --browser,
+# imported when the session's browser starts, so that a worker imports only the browser it runs
+BROWSERS = {
+    "chrome": ("browsers.chrome_browser", "ChromeBrowser", "ChromeOptionArguments"),
+    "firefox": ("browsers.firefox_browser", "FirefoxBrowser", "FirefoxOptionArguments"),
+    "edge": ("browsers.edge_browser", "EdgeBrowser", "EdgeOptionArguments"),
+}
+# The headless options arguments of each browser, as the names of its options arguments members
+# followed by their values
+HEADLESS_ARGUMENTS = {
+    "chrome": [
+        ("HEADLESS",),
+        ("WINDOW_SIZE", f"{DEFAULT_WINDOW_WIDTH},{DEFAULT_WINDOW_HEIGHT}"),
+    ],
+    "firefox": [
+        ("HEADLESS",),
+        ("WIDTH", DEFAULT_WINDOW_WIDTH),
+        ("HEIGHT", DEFAULT_WINDOW_HEIGHT),
+    ],
+    "edge": [
+        ("HEADLESS",),
+        ("WINDOW_SIZE", f"{DEFAULT_WINDOW_WIDTH},{DEFAULT_WINDOW_HEIGHT}"),
+    ],
+}
+
+
+class ShardTimings:
+    """This class implements a pytest plugin which records the duration of each test, including
+    its setup and teardown, and writes them to a JSON file at the end of the session."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.durations: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        """Adds the duration of a test's phase to the test's duration."""
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+
+    def pytest_sessionfinish(self):
+        """Writes the durations of the tests to the JSON file."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.durations, file, indent=2, sort_keys=True)
+
+
+class CommandReport:
+    """This class implements a pytest plugin which instruments the browsers, attributes the
+    WebDriver commands they issue to the test running, and writes a summary of each test's
+    commands to a JSON file at the end of the session, see instrumentation/recorder.py.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        enable_instrumentation()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item, nextitem: Optional[pytest.Item]
+    ):
+        """Attributes the commands issued while the test runs, including its setup and teardown,
+        to the test."""
+        # pylint: disable=unused-argument
+        recorder = get_command_recorder()
+        recorder.current_test = item.nodeid
+        yield
+        recorder.current_test = None
+
+    def pytest_sessionfinish(self):
+        """Writes the summary of each test's commands to the JSON file."""
+        get_command_recorder().export_json(path=self.path)
+
+
+class PageMetricsReport:
+    """This class implements a pytest plugin which makes the browsers collect the performance
+    metrics of the pages they open, attributes them to the test running, and writes their report
+    per URL to a JSON or CSV file, depending on the file's extension, at the end of the session,
+    see instrumentation/page_metrics.py. If thresholds are given, the session fails if any is
+    exceeded.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        thresholds: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        self.path = path
+        self.thresholds = thresholds
+        enable_page_metrics()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item, nextitem: Optional[pytest.Item]
+    ):
+        """Attributes the pages opened while the test runs to the test."""
+        # pylint: disable=unused-argument
+        recorder = get_page_metrics_recorder()
+        recorder.current_test = item.nodeid
+        yield
+        recorder.current_test = None
+
+    def pytest_sessionfinish(self, session: pytest.Session):
+        """Writes the report of the page metrics and checks it against the thresholds."""
+        recorder = get_page_metrics_recorder()
+        if self.path:
+            recorder.export(path=self.path)
+        violations = recorder.check_thresholds(thresholds=self.thresholds or {})
+        for violation in violations:
+            LOGGER.error("Page metrics threshold exceeded: %s", violation)
+        if violations and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Adds the runner's command line options."""
+    group = parser.getgroup("runner")
+    group.addoption(
+        "--browser",
+        default="chrome",
+        choices=sorted(BROWSERS),
+        help="The browser to run the tests with. Defaults to chrome.",
+    )
+    group.addoption(
+        "--headless", action="store_true", help="Runs the browser in headless mode."
+    )
+    group.addoption(
+        "--launch-profile",
+        default=None,
+        help="The launch profile of the browser, e.g. ci-fast or ci-fast+low-memory, see "
+        "browsers/launch_profiles.py.",
+    )
+    group.addoption(
+        "--shard-file",
+        default=None,
+        help="A file with the node ids of the tests to run, one per line.",
+    )
+    group.addoption(
+        "--shard-timings",
+        default=None,
+        help="A JSON file to write the durations of the tests to.",
+    )
+    group.addoption(
+        "--command-report",
+        default=None,
+        help="A JSON file to write a summary of the WebDriver commands of each test to.",
+    )
+    group.addoption(
+        "--page-metrics",
+        default=None,
+        help="A JSON or CSV file to write the report of the performance metrics of the pages "
+        "opened, per URL, to.",
+    )
+    group.addoption(
+        "--page-metric-thresholds",
+        default=None,
+        help="A JSON file mapping URLs, or fnmatch patterns of them, to the thresholds of their "
+        "page metrics. The session fails if any is exceeded.",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    """Registers the timings recorder if --shard-timings is given, the command report if
+    --command-report is given, and the page metrics report if --page-metrics or
+    --page-metric-thresholds is given."""
+    path = config.getoption("shard_timings")
+    if path:
+        config.pluginmanager.register(ShardTimings(path=path), "runner-shard-timings")
+    report_path = config.getoption("command_report")
+    if report_path:
+        config.pluginmanager.register(
+            CommandReport(path=report_path), "runner-command-report"
+        )
+    metrics_path = config.getoption("page_metrics")
+    thresholds_path = config.getoption("page_metric_thresholds")
+    if metrics_path or thresholds_path:
+        config.pluginmanager.register(
+            PageMetricsReport(
+                path=metrics_path,
+                thresholds=(
+                    load_thresholds(thresholds_path) if thresholds_path else None
+                ),
+            ),
+            "runner-page-metrics-report",
+        )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]):
+    """Deselects the tests which are not listed in --shard-file, if given."""
+    shard_file = config.getoption("shard_file")
+    if not shard_file:
+        return
+    with open(shard_file, encoding="utf-8") as file:
+        selected = {line.strip() for line in file if line.strip()}
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+
+@pytest.fixture(scope="session")
+def session_browser(request: pytest.FixtureRequest) -> Iterator[BaseBrowser]:
+    """The browser of the worker process, started once and shared by the worker's tests."""
+    browser_name = request.config.getoption("browser")
+    module_name, class_name, arguments_name = BROWSERS[browser_name]
+    module = import_module(module_name)
+    browser_cls, arguments_cls = getattr(module, class_name), getattr(
+        module, arguments_name
+    )
+    options_args = None
+    if request.config.getoption("headless"):
+        options_args = [
+            (arguments_cls[name], *values)
+            for name, *values in HEADLESS_ARGUMENTS[browser_name]
+        ]
+    profile_name = request.config.getoption("launch_profile")
+    browser = browser_cls(
+        options_args=options_args,
+        profile=get_launch_profile(profile_name) if profile_name else None,
+    )
+    yield browser
+    browser.quit()
+
+
+@pytest.fixture
+def browser(session_browser: BaseBrowser) -> Iterator[BaseBrowser]:
+    """The worker's browser, reset after each test."""
+    yield session_browser
+    session_browser.reset()
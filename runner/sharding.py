@@ -0,0 +1,54 @@
+"""This module contains an implementation of balancing tests across shards by their durations."""
+import heapq
+import statistics
+from typing import Dict, List, Optional, Sequence
+
+# The duration assumed for tests without a recorded duration, if no test has one
+DEFAULT_TEST_DURATION = 1.0  # seconds
+
+
+def balance_shards(
+    test_ids: Sequence[str],
+    shard_count: int,
+    durations: Optional[Dict[str, float]] = None,
+) -> List[List[str]]:
+    """Splits the tests into shard_count shards with as equal total durations as possible, by
+    assigning the longest tests first, each to the shard with the least total duration so far.
+    Tests without a recorded duration are assumed to take the median recorded duration.
+
+    Parameters
+    ----------
+    test_ids : Sequence[str]
+        The node ids of the tests to split.
+    shard_count : int
+        The number of shards.
+    durations : Optional[Dict[str, float]]
+        The recorded durations of tests, keyed by node id, in seconds.
+
+    Returns
+    -------
+    List[List[str]]
+        The node ids of each shard's tests, in their original order.
+    """
+    if shard_count < 1:
+        raise ValueError(f"The number of shards must be at least 1, got: {shard_count}")
+    durations = durations or {}
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    default_duration = statistics.median(known) if known else DEFAULT_TEST_DURATION
+    order = {test_id: index for index, test_id in enumerate(test_ids)}
+
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    totals = [(0.0, index) for index in range(shard_count)]
+    heapq.heapify(totals)
+    for test_id in sorted(
+        test_ids,
+        key=lambda test_id: durations.get(test_id, default_duration),
+        reverse=True,
+    ):
+        total, index = heapq.heappop(totals)
+        shards[index].append(test_id)
+        heapq.heappush(
+            totals, (total + durations.get(test_id, default_duration), index)
+        )
+
+    return [sorted(shard, key=order.__getitem__) for shard in shards]
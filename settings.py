@@ -1,22 +1,87 @@
 """Contains common settings across the project."""
+from contextvars import ContextVar
 from logging import INFO
 from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 LOGGING_LEVEL = INFO
-GLOBAL_DRIVER: Optional[WebDriver] = None
+# The format of the log records, "text" or "json", see logger.py
+LOG_FORMAT = "text"
+# Only the first of every LOG_SAMPLE_EVERY records of frequent per-element events, e.g. finding an
+# element, is logged. Set to 1 to log all of them
+LOG_SAMPLE_EVERY = 10
+# Controls whether the browsers enable the element cache (see elements/element_cache.py), which
+# trusts found elements while no elements were removed from the page, instead of checking whether
+# they are stale before every use
+ELEMENT_CACHE_ENABLED = False
+# Controls whether the browsers record every WebDriver command they issue, see
+# instrumentation/recorder.py
+INSTRUMENTATION_ENABLED = False
+# Controls whether the browsers collect the performance metrics of the pages they open, see
+# instrumentation/page_metrics.py
+PAGE_METRICS_ENABLED = False
+# Controls whether the Chrome and Edge browsers run their sessions on the process-wide shared driver
+# service of their type, unless given a service, instead of each starting a driver process of its
+# own, see browsers/driver_service.py
+SHARE_DRIVER_SERVICES = False
+# The default timeout of waiting for elements to be present, see elements/waits.py
+DEFAULT_WAIT_TIMEOUT = 60  # seconds
+# The first interval between polls while waiting, which grows by DEFAULT_POLL_BACKOFF after each
+# poll, up to MAX_POLL_INTERVAL
+DEFAULT_POLL_INTERVAL = 0.05  # seconds
+DEFAULT_POLL_BACKOFF = 1.5
+MAX_POLL_INTERVAL = 0.5  # seconds
+# The maximum age of the page's DOM epoch read by the element cache before it's read again
+DOM_EPOCH_MAX_AGE = 0.5  # seconds
+# The driver of the current thread or asyncio task, see set_global_driver
+_CURRENT_DRIVER: "ContextVar[Optional[WebDriver]]" = ContextVar(
+    "current_driver", default=None
+)
 
 
 def set_global_driver(driver: WebDriver):
-    """Sets the GLOBAL_DRIVER, so it can be used cross-module.
+    """Sets the driver of the current context, i.e. thread or asyncio task, so it can be used
+    cross-module. Threads started afterwards start without a driver, as they start with an empty
+    context, and set their own. asyncio tasks created afterwards start with a copy of the creating
+    context, hence with this driver, until they set their own, which is then not seen by the
+    creator. Hence multiple browsers can be driven in parallel within one process, each from its
+    own thread or task.
 
     Parameters
     ----------
     driver : WebDriver
-        The WebDriver whose value is to be saved to GLOBAL_DRIVER. This is currently only done
-        from the constructor of the BaseBrowser class.
+        The WebDriver to be set for the current context. This is currently only done from the
+        constructor of the BaseBrowser class.
     """
-    # pylint: disable=global-statement
-    global GLOBAL_DRIVER
-    GLOBAL_DRIVER = driver
+    _CURRENT_DRIVER.set(driver)
+
+
+def get_global_driver() -> Optional[WebDriver]:
+    """Returns the driver of the current context, i.e. thread or asyncio task, if any. Elements
+    resolve their driver from their parent chain and only fall back to this one.
+
+    Returns
+    -------
+    Optional[WebDriver]
+    """
+    return _CURRENT_DRIVER.get()
+
+
+def clear_global_driver(driver: WebDriver):
+    """Unsets the driver of the current context, given that it's the one passed.
+
+    Parameters
+    ----------
+    driver : WebDriver
+        The WebDriver which is no longer to be used, e.g. after it quit.
+    """
+    if _CURRENT_DRIVER.get() is driver:
+        _CURRENT_DRIVER.set(None)
+
+
+def __getattr__(name: str):
+    # Keeps `from settings import GLOBAL_DRIVER` working, returning the current context's driver
+    if name == "GLOBAL_DRIVER":
+        return get_global_driver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")